@@ -0,0 +1,68 @@
+"""Validate many datasets with a checklist, from the command line
+
+Runs the automated checks of a checklist on each dataset and writes one JSON
+report per dataset, plus a summary table, to the output directory. Run it
+with a python interpreter that has access to the QGIS python bindings and to
+the processing plugin:
+
+    PYTHONPATH=src python scripts/batch_validate.py checklist.json \\
+        "/deliveries/**/*.gpkg" --output-dir reports --workers 8
+
+The exit status is zero only if all datasets are valid.
+
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("checklist", type=Path, help="path to the checklist file")
+    parser.add_argument(
+        "datasets", nargs="+", help="paths or glob patterns of the datasets"
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path("reports"),
+        help="directory where reports are written (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of worker processes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="do not reuse cached automation results",
+    )
+    args = parser.parse_args()
+
+    from dataset_qa_workbench.datasetqaworkbench import batch
+
+    application, _provider = batch.initialize_standalone_qgis()
+    try:
+        results = batch.run_batch(
+            args.checklist,
+            args.datasets,
+            args.output_dir,
+            use_cache=not args.no_cache,
+            workers=args.workers,
+        )
+    finally:
+        application.exitQgis()
+    valid_count = sum(1 for result in results if result.is_valid)
+    print(
+        f"Validated {len(results)} datasets, {valid_count} of them are valid. "
+        f"Summary written to {args.output_dir / batch.SUMMARY_FILE_NAME}"
+    )
+    return 0 if valid_count == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""Microbenchmark for the checklist item model
+
+Compares the current slotted ``ChecklistItemHead`` against the previous
+``__getattr__``-based implementation, for a checklist with 10k checks.
+
+Run it from the repository root, with a python interpreter that has access to
+the QGIS python bindings:
+
+    PYTHONPATH=src python scripts/benchmark_checklist_items.py
+
+"""
+
+import sys
+import timeit
+import tracemalloc
+
+from dataset_qa_workbench.datasetqaworkbench import models
+from dataset_qa_workbench.datasetqaworkbench.constants import (
+    ChecklistItemPropertyColumn,
+)
+
+NUM_CHECKS = 10_000
+ACCESS_REPETITIONS = 20
+
+
+class LegacyChecklistItemProperty:
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+
+class LegacyChecklistAutomationProperty(LegacyChecklistItemProperty):
+    def __init__(self, name, value=None):
+        super().__init__(name, value)
+        automation_info = dict(value) if value is not None else {}
+        self.algorithm_id = automation_info.get("algorithm_id")
+        self.artifact_parameter_name = automation_info.get(
+            "artifact_parameter_name", "INPUT_LAYER"
+        )
+        self.output_name = automation_info.get("output_name", "OUTPUT")
+        self.negate_output = automation_info.get("negate_output", False)
+        self.extra_parameters = automation_info.get("extra_parameters", {})
+
+
+class LegacyChecklistItemHead:
+    def __init__(self, name, check_properties):
+        self.name = name
+        self.validated = 0
+        self.check_properties = check_properties
+
+    def __getattr__(self, item):
+        if item == ChecklistItemPropertyColumn.DESCRIPTION.name.lower():
+            result = self.check_properties[
+                ChecklistItemPropertyColumn.DESCRIPTION.value
+            ].value
+        elif item == ChecklistItemPropertyColumn.GUIDE.name.lower():
+            result = self.check_properties[
+                ChecklistItemPropertyColumn.GUIDE.value
+            ].value
+        elif item == ChecklistItemPropertyColumn.AUTOMATION.name.lower():
+            result = self.check_properties[ChecklistItemPropertyColumn.AUTOMATION.value]
+        elif item == ChecklistItemPropertyColumn.VALIDATION_NOTES.name.lower():
+            result = self.check_properties[
+                ChecklistItemPropertyColumn.VALIDATION_NOTES.value
+            ].value
+        else:
+            raise AttributeError
+        return result
+
+    @classmethod
+    def from_dict(cls, raw):
+        check_properties = [
+            LegacyChecklistItemProperty("description", raw.get("description")),
+            LegacyChecklistItemProperty("guide", raw.get("guide")),
+            LegacyChecklistAutomationProperty("automation", raw.get("automation")),
+            LegacyChecklistItemProperty("Validation notes", ""),
+        ]
+        return cls(raw["name"], check_properties)
+
+
+def build_raw_checks(num_checks: int):
+    return [
+        {
+            "name": f"check {i}",
+            "description": f"description of check {i}",
+            "guide": f"guide for check {i}",
+            "automation": {"algorithm_id": "dataset_qa_workbench:crschecker"},
+        }
+        for i in range(num_checks)
+    ]
+
+
+def measure_memory(head_class, raw_checks):
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    heads = [head_class.from_dict(raw) for raw in raw_checks]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return heads, (after - before) / len(heads)
+
+
+def measure_access(heads):
+    def access_all():
+        for head in heads:
+            head.description
+            head.automation
+            head.validation_notes
+
+    total = timeit.timeit(access_all, number=ACCESS_REPETITIONS)
+    return total / (ACCESS_REPETITIONS * len(heads) * 3) * 1e9
+
+
+def main():
+    raw_checks = build_raw_checks(NUM_CHECKS)
+    results = {}
+    for label, head_class in (
+        ("legacy (__getattr__)", LegacyChecklistItemHead),
+        ("slotted", models.ChecklistItemHead),
+    ):
+        heads, bytes_per_check = measure_memory(head_class, raw_checks)
+        ns_per_access = measure_access(heads)
+        results[label] = (ns_per_access, bytes_per_check)
+    print(f"python {sys.version.split()[0]} - {NUM_CHECKS} checks")
+    print(f"{'implementation':<22}{'ns/access':>12}{'bytes/check':>14}")
+    for label, (ns_per_access, bytes_per_check) in results.items():
+        print(f"{label:<22}{ns_per_access:>12.1f}{bytes_per_check:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
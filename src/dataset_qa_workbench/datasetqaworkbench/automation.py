@@ -1,11 +1,12 @@
+import contextlib
+import functools
+import time
 import typing
+from collections import deque
 from pathlib import Path
 
 import processing
-from PyQt5 import (
-    QtCore,
-    QtWidgets,
-)
+from PyQt5 import QtCore
 from qgis.core import (
     QgsApplication,
     QgsMapLayer,
@@ -14,17 +15,357 @@ from qgis.core import (
     QgsProcessingContext,
     QgsProcessingFeedback,
     QgsProcessingParameterFeatureSink,
+    QgsProcessingParameterFeatureSource,
+    QgsProcessingParameterMapLayer,
+    QgsProcessingParameterRasterLayer,
     QgsProcessingParameterVectorDestination,
+    QgsProcessingParameterVectorLayer,
     QgsProcessingParameterRasterDestination,
-    QgsProcessingOutputLayerDefinition,
+    QgsProcessingUtils,
     QgsProject,
+    QgsVectorLayer,
 )
 
 from . import (
+    error_outputs,
     models,
+    result_cache,
     utils,
 )
-from .constants import ChecklistItemPropertyColumn
+from .constants import (
+    CheckStatus,
+    ErrorOutputMode,
+)
+
+_OUTPUT_TYPES = (
+    QgsProcessingParameterFeatureSink,
+    QgsProcessingParameterVectorDestination,
+    QgsProcessingParameterRasterDestination,
+)
+
+_LAYER_PARAMETER_TYPES = (
+    QgsProcessingParameterFeatureSource,
+    QgsProcessingParameterMapLayer,
+    QgsProcessingParameterRasterLayer,
+    QgsProcessingParameterVectorLayer,
+)
+
+
+def build_automation_parameters(
+    algorithm: QgsProcessingAlgorithm,
+    artifact_parameter_name: str,
+    artifact: typing.Union[str, Path, QgsMapLayer],
+    extra_parameters: typing.Optional[typing.Dict] = None,
+    outputs: typing.Optional[error_outputs.ErrorOutputs] = None,
+) -> typing.Tuple[typing.Dict, typing.Set[str]]:
+    """Build the parameters for running an automated check's algorithm
+
+    Outputs of the algorithm are sent to the destinations given by
+    ``outputs``, which default to temporary files. Returns the parameters and
+    the names of the output parameters.
+
+    """
+
+    params = dict(extra_parameters) if extra_parameters else {}
+    params[artifact_parameter_name] = (
+        str(artifact) if isinstance(artifact, Path) else artifact
+    )
+    outputs = outputs or error_outputs.ErrorOutputs()
+    output_parameter_names = set()
+    for param_def in algorithm.parameterDefinitions():
+        if isinstance(param_def, _OUTPUT_TYPES):
+            output_parameter_names.add(param_def.name())
+            params[param_def.name()] = outputs.get_destination(param_def)
+    return params, output_parameter_names
+
+
+def get_automation_cache_key(
+    algorithm: QgsProcessingAlgorithm,
+    params: typing.Dict,
+    artifact_parameter_name: str,
+    output_parameter_names: typing.Set[str],
+) -> typing.Optional[str]:
+    """Return the key for caching results, or None if they cannot be cached"""
+    fingerprint = result_cache.dataset_fingerprint(params[artifact_parameter_name])
+    if fingerprint is not None:
+        key_params = {
+            name: value
+            for name, value in params.items()
+            if name != artifact_parameter_name and name not in output_parameter_names
+        }
+        result = result_cache.make_cache_key(algorithm.id(), key_params, fingerprint)
+    else:
+        result = None
+    return result
+
+
+def evaluate_automation_output(
+    results: typing.Dict, output_name: str, negate_output: bool
+) -> bool:
+    raw_result = results.get(output_name, False)
+    utils.log_message("raw_result: %r", raw_result, level="debug")
+    return bool(raw_result) if not negate_output else not bool(raw_result)
+
+
+def get_automation_result(
+    passed: bool,
+    results: typing.Dict,
+    output_name: str,
+    output_parameter_names: typing.Set[str],
+    outputs: typing.Optional[error_outputs.ErrorOutputs] = None,
+    duration: typing.Optional[float] = None,
+) -> models.AutomationResult:
+    """Return the outcome of a run of an automated check
+
+    Layer outputs are only represented by the locations they were written to,
+    when ``outputs`` is given.
+
+    """
+
+    return models.AutomationResult.from_outputs(
+        passed,
+        {
+            name: value
+            for name, value in results.items()
+            if name == output_name or name not in output_parameter_names
+        },
+        output_name,
+        duration,
+        error_outputs=(
+            outputs.get_written_locations(results) if outputs is not None else None
+        ),
+    )
+
+
+def get_automation_notes(automation_result: models.AutomationResult) -> str:
+    return automation_result.notes
+
+
+@contextlib.contextmanager
+def measure_cost() -> typing.Iterator[models.CheckTimings]:
+    """Measure the cost of running the code inside the ``with`` block
+
+    The yielded timings are filled in when the block exits. CPU time is that
+    of the current thread only, so that checks running concurrently on other
+    threads are not accounted for.
+
+    """
+
+    timings = models.CheckTimings()
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield timings
+    finally:
+        timings.wall_time = time.perf_counter() - wall_start
+        timings.cpu_time = time.thread_time() - cpu_start
+
+
+class AutomationTask(QgsProcessingAlgRunnerTask):
+    """Runs the algorithm of an automated check, measuring what it costs
+
+    Timings are available in ``timings`` once the task has run.
+
+    The task keeps its processing context, since ``QgsProcessingAlgRunnerTask``
+    only holds a reference to it, which would otherwise dangle if its creator
+    moved on to another context while the task is still running.
+
+    ``outputs`` are the destinations of the error outputs of this run. The
+    task waits for other tasks writing to the same destinations before
+    running.
+
+    """
+
+    context: QgsProcessingContext
+    outputs: typing.Optional[error_outputs.ErrorOutputs]
+    timings: typing.Optional[models.CheckTimings]
+
+    def __init__(
+        self,
+        algorithm: QgsProcessingAlgorithm,
+        parameters: typing.Dict,
+        context: QgsProcessingContext,
+        feedback: typing.Optional[QgsProcessingFeedback] = None,
+        outputs: typing.Optional[error_outputs.ErrorOutputs] = None,
+    ):
+        super().__init__(algorithm, parameters, context, feedback)
+        self.context = context
+        self.outputs = outputs
+        self.timings = None
+
+    def run(self) -> bool:
+        writing = (
+            self.outputs.writing()
+            if self.outputs is not None
+            else contextlib.nullcontext()
+        )
+        with writing, measure_cost() as timings:
+            result = super().run()
+        self.timings = timings
+        return result
+
+
+class ValidationSession:
+    """The dataset being validated, shared by the automated checks of a run
+
+    When the dataset is a file, it is opened as a layer only once, the first
+    time that an algorithm taking a layer is run on it, and the layer is kept
+    in the temporary layer store of the session's processing context. This
+    spares every check from opening the same file again, which is costly for
+    large files or files on network shares.
+
+    Tasks that may run concurrently should use a context of their own, from
+    ``create_context()``, and pass it to ``prepare_parameters()`` in order to
+    get their own clone of the layer, as a layer cannot be read from several
+    threads at once. Only runs that happen one after the other, such as those
+    of a batch validation, share the session's layer.
+
+    """
+
+    artifact: typing.Union[str, Path, QgsMapLayer]
+    context: QgsProcessingContext
+    error_output_mode: ErrorOutputMode
+    _layer: typing.Optional[QgsMapLayer]
+    open_time: typing.Optional[float]
+    _layer_loaded: bool
+
+    def __init__(
+        self,
+        artifact: typing.Union[str, Path, QgsMapLayer],
+        context: typing.Optional[QgsProcessingContext] = None,
+        error_output_mode: typing.Optional[ErrorOutputMode] = None,
+    ):
+        self.artifact = artifact
+        self.context = context or QgsProcessingContext()
+        self.error_output_mode = error_output_mode or utils.get_error_output_mode()
+        self._layer = artifact if isinstance(artifact, QgsMapLayer) else None
+        self._layer_loaded = self._layer is not None
+        self.open_time = None
+
+    @property
+    def layer(self) -> typing.Optional[QgsMapLayer]:
+        """Return the dataset as a layer, or None if it cannot be opened as one"""
+        if not self._layer_loaded:
+            self._layer_loaded = True
+            start = time.perf_counter()
+            self._layer = QgsProcessingUtils.mapLayerFromString(
+                str(self.artifact), self.context, True
+            )
+            self.open_time = time.perf_counter() - start
+            if self._layer is None:
+                utils.log_message(
+                    f"Could not open {self.artifact} as a layer", level="warning"
+                )
+        return self._layer
+
+    def get_error_outputs(self, check_name: str) -> error_outputs.ErrorOutputs:
+        return error_outputs.ErrorOutputs.for_dataset(
+            self.error_output_mode, self.artifact, check_name
+        )
+
+    def create_context(self) -> QgsProcessingContext:
+        context = QgsProcessingContext()
+        context.copyThreadSafeSettings(self.context)
+        return context
+
+    def prepare_parameters(
+        self,
+        algorithm: QgsProcessingAlgorithm,
+        artifact_parameter_name: str,
+        params: typing.Dict,
+        context: typing.Optional[QgsProcessingContext] = None,
+    ) -> typing.Dict:
+        """Return the parameters to run an algorithm with the session's layer
+
+        The dataset is only replaced by the layer if the algorithm expects a
+        layer, other algorithms, such as those taking files, are given the
+        original parameters.
+
+        When ``context`` is given, the layer opened by the session is cloned
+        and the clone is owned by ``context``. Layers that were given as the
+        dataset are used as they are, since clones would not have their
+        unsaved edits.
+
+        """
+
+        param_def = algorithm.parameterDefinition(artifact_parameter_name)
+        result = params
+        if isinstance(param_def, _LAYER_PARAMETER_TYPES):
+            layer = self.layer
+            if layer is not None:
+                if context is not None and layer is not self.artifact:
+                    layer = layer.clone()
+                    context.temporaryLayerStore().addMapLayer(layer)
+                result = dict(params)
+                result[artifact_parameter_name] = layer
+        return result
+
+
+class DatasetWatcher(QtCore.QObject):
+    """Notifies about changes to the dataset being validated
+
+    Layers are watched for changes to their data, both while being edited and
+    when edits are saved. Files, including the files behind layers, are
+    watched for modifications made outside of QGIS. Notifications are
+    debounced, so that a burst of changes, such as the ones produced while
+    editing a layer, results in a single emission of ``dataset_changed``.
+
+    """
+
+    dataset: typing.Optional[typing.Union[Path, QgsMapLayer]]
+
+    dataset_changed = QtCore.pyqtSignal()
+
+    def __init__(
+        self,
+        debounce_interval: int = 1000,
+        parent: typing.Optional[QtCore.QObject] = None,
+    ):
+        super().__init__(parent)
+        self.dataset = None
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_interval)
+        self._timer.timeout.connect(self.dataset_changed)
+        self._watcher = QtCore.QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._respond_to_file_changed)
+
+    def watch(self, dataset: typing.Optional[typing.Union[Path, QgsMapLayer]]):
+        """Start watching a dataset, instead of the previous one"""
+        self._timer.stop()
+        if isinstance(self.dataset, QgsMapLayer):
+            self._disconnect_layer(self.dataset)
+        if len(self._watcher.files()) > 0:
+            self._watcher.removePaths(self._watcher.files())
+        self.dataset = dataset
+        if isinstance(dataset, QgsMapLayer):
+            dataset.dataChanged.connect(self._timer.start)
+            dataset.willBeDeleted.connect(self._stop_watching)
+            if isinstance(dataset, QgsVectorLayer):
+                dataset.editingStopped.connect(self._timer.start)
+            path = Path(dataset.source().split("|")[0])
+        else:
+            path = dataset
+        if path is not None and path.is_file():
+            self._watcher.addPath(str(path))
+
+    def _disconnect_layer(self, layer: QgsMapLayer):
+        try:
+            layer.dataChanged.disconnect(self._timer.start)
+            layer.willBeDeleted.disconnect(self._stop_watching)
+            if isinstance(layer, QgsVectorLayer):
+                layer.editingStopped.disconnect(self._timer.start)
+        except (RuntimeError, TypeError):
+            pass  # the layer has already been deleted
+
+    def _stop_watching(self):
+        self.watch(None)
+
+    def _respond_to_file_changed(self, path: str):
+        # files replaced by renaming are no longer watched after the change
+        if path not in self._watcher.files() and Path(path).is_file():
+            self._watcher.addPath(path)
+        self._timer.start()
 
 
 class ValidationStepAutomator:
@@ -34,14 +375,17 @@ class ValidationStepAutomator:
     params: typing.Dict
     output_name: str
     negate_output: bool
-    model: QtCore.QAbstractItemModel
-    validated_idx: QtCore.QModelIndex
-    notes_idx: QtCore.QModelIndex
-    _OUTPUT_TYPES = (
-        QgsProcessingParameterFeatureSink,
-        QgsProcessingParameterVectorDestination,
-        QgsProcessingParameterRasterDestination,
-    )
+    model: models.CheckListItemsModel
+    row: int
+    last_result: typing.Optional[bool]
+    use_cache: bool
+    session: typing.Optional[ValidationSession]
+    artifact_path: typing.Union[str, Path]
+    check_name: str
+    evaluated_key: typing.Optional[str]
+    _task: typing.Optional[AutomationTask]
+    _input_key: typing.Optional[str]
+    _cache_key: typing.Optional[str]
 
     def __init__(
         self,
@@ -50,37 +394,37 @@ class ValidationStepAutomator:
         output_name: str,
         negate_output: bool,
         artifact_path: typing.Union[str, Path],
-        model: QtCore.QAbstractItemModel,
-        validated_idx: QtCore.QModelIndex,
-        notes_idx: QtCore.QModelIndex,
+        model: models.CheckListItemsModel,
+        row: int,
         execution_params: typing.Optional[typing.Dict] = None,
         context: typing.Optional[QgsProcessingContext] = None,
         feedback: typing.Optional[QgsProcessingFeedback] = None,
+        use_cache: bool = True,
+        session: typing.Optional[ValidationSession] = None,
+        check_name: str = "",
     ):
         self.context = context or QgsProcessingContext()
         self.feedback = feedback or QgsProcessingFeedback()
-        registry = QgsApplication.processingRegistry()
-        algorithm = registry.createAlgorithmById(algorithm_id)
+        algorithm = utils.get_processing_algorithm(algorithm_id)
         if algorithm is None:
             raise RuntimeError(f"Invalid algorithm_id: {algorithm_id!r}")
         self.algorithm = algorithm
         self.output_name = output_name
         self.negate_output = negate_output
         self.model = model
-        self.validated_idx = validated_idx
-        self.notes_idx = notes_idx
-        self.params = dict(execution_params) if execution_params else {}
-        if isinstance(artifact_path, Path):
-            input_ = str(artifact_path)
-        else:
-            input_ = artifact_path
-        self.params.update({artifact_parameter_name: input_})
-
-        for param_def in self.algorithm.parameterDefinitions():
-            if isinstance(param_def, self._OUTPUT_TYPES):
-                out_layer_definition = QgsProcessingOutputLayerDefinition("memory:")
-                out_layer_definition.createOptions = {"fileEncoding": "utf-8"}
-                self.params[param_def.name()] = out_layer_definition
+        self.row = row
+        self.last_result = None
+        self.use_cache = use_cache
+        self.session = session
+        self.evaluated_key = None
+        self._task = None
+        self._input_key = None
+        self._cache_key = None
+        self.artifact_parameter_name = artifact_parameter_name
+        self.artifact_path = artifact_path
+        self.check_name = check_name
+        self._execution_params = execution_params
+        _, self.params, self._output_parameter_names = self.build_run_parameters()
 
     @classmethod
     def from_checklist_item(
@@ -88,15 +432,19 @@ class ValidationStepAutomator:
         checklist_item: QtCore.QModelIndex,
         resource: typing.Union[str, Path, QgsMapLayer],
     ):
-        checklist_item_head: models.ChecklistItemHead = (
-            checklist_item.internalPointer().ref
-        )
+        model: models.CheckListItemsModel = checklist_item.model()
+        return cls.from_check(model, model.check_row(checklist_item.row()), resource)
+
+    @classmethod
+    def from_check(
+        cls,
+        model: models.CheckListItemsModel,
+        row: int,
+        resource: typing.Union[str, Path, QgsMapLayer],
+        session: typing.Optional[ValidationSession] = None,
+    ):
+        checklist_item_head: models.ChecklistItemHead = model.checklist.checks[row]
         automation: models.ChecklistAutomationProperty = checklist_item_head.automation
-        model = checklist_item.model()
-        notes_idx = model.index(
-            ChecklistItemPropertyColumn.VALIDATION_NOTES.value, 1, checklist_item
-        )
-        validated_idx = checklist_item.siblingAtColumn(1)
         return cls(
             automation.algorithm_id,
             automation.artifact_parameter_name,
@@ -104,95 +452,385 @@ class ValidationStepAutomator:
             automation.negate_output,
             artifact_path=resource,
             model=model,
-            validated_idx=validated_idx,
-            notes_idx=notes_idx,
+            row=row,
             execution_params=automation.extra_parameters,
+            session=session,
+            check_name=checklist_item_head.name,
         )
 
-    def perform_automation(self):
-        task = QgsProcessingAlgRunnerTask(
-            self.algorithm, self.params, self.context, self.feedback
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None
+
+    def build_run_parameters(
+        self,
+    ) -> typing.Tuple[error_outputs.ErrorOutputs, typing.Dict, typing.Set[str]]:
+        """Return the destinations of the outputs and the parameters of a run
+
+        Each run gets destinations of its own, so that it does not overwrite
+        the error outputs of previous runs, which may still be referenced by
+        their results.
+
+        """
+
+        if self.session is not None:
+            outputs = self.session.get_error_outputs(self.check_name)
+        else:
+            outputs = error_outputs.ErrorOutputs.for_dataset(
+                utils.get_error_output_mode(), self.artifact_path, self.check_name
+            )
+        params, output_parameter_names = build_automation_parameters(
+            self.algorithm,
+            self.artifact_parameter_name,
+            self.artifact_path,
+            self._execution_params,
+            outputs,
         )
-        utils.log_message(f"self.algorithm: {self.algorithm}")
-        utils.log_message(f"self.params: {self.params}")
-        utils.log_message(
-            f"self.params types: {[(k, type(v)) for k,v in self.params.items()]}"
+        return outputs, params, output_parameter_names
+
+    def perform_automation(self) -> typing.Optional[AutomationTask]:
+        """Run the automation in the background
+
+        Returns the task that was started, or None if cached results were used
+        instead.
+
+        """
+
+        cached_results = self.get_cached_results()
+        if cached_results is not None:
+            self.task_finished(True, cached_results)
+            task = None
+        else:
+            task = self.create_task()
+            task_manager = QgsApplication.taskManager()
+            task_manager.addTask(task)
+        return task
+
+    def get_cached_results(self) -> typing.Optional[typing.Dict]:
+        """Return the results of a previous run with the same inputs, if any
+
+        When there are none, the key for caching the results of the next run
+        is remembered.
+
+        """
+
+        self._input_key = self.get_input_key()
+        self._cache_key = None
+        result = None
+        if self.use_cache and self._input_key is not None:
+            result = result_cache.get_result_cache().get(self._input_key)
+            if result is None:
+                self._cache_key = self._input_key
+            else:
+                utils.log_message(
+                    "Using cached results for %s", self.algorithm.id(), level="debug"
+                )
+        return result
+
+    def get_input_key(self) -> typing.Optional[str]:
+        """Return a key identifying the current inputs of the automation
+
+        This is None when the dataset cannot be fingerprinted, for example
+        when it has unsaved edits.
+
+        """
+
+        return get_automation_cache_key(
+            self.algorithm,
+            self.params,
+            self.artifact_parameter_name,
+            self._output_parameter_names,
         )
+
+    def is_stale(self) -> bool:
+        """Return whether the inputs changed since the check was last evaluated"""
+        return self.evaluated_key is None or self.get_input_key() != self.evaluated_key
+
+    def create_task(self) -> AutomationTask:
+        """Create the task that runs the automation, without starting it
+
+        When the automator is part of a validation session, the task uses a
+        clone of the session's layer and a copy of its context, as tasks may
+        run concurrently.
+
+        """
+
+        outputs, params, _ = self.build_run_parameters()
+        if self.session is not None:
+            context = self.session.create_context()
+            params = self.session.prepare_parameters(
+                self.algorithm, self.artifact_parameter_name, params, context
+            )
+        else:
+            context = self.context
+        task = AutomationTask(self.algorithm, params, context, self.feedback, outputs)
+        self._task = task
         utils.log_message(
-            f"self.params values: {[(k, v) for k,v in self.params.items()]}"
+            "Running %s with parameters %r", self.algorithm.id(), params, level="debug"
         )
         task.executed.connect(self.task_finished)
-        task_manager = QgsApplication.taskManager()
-        task_manager.addTask(task)
+        return task
 
     def configure_and_perform_automation(self):
-        utils.log_message(f"configure_automation called")
-        utils.log_message(f"self.algorithm: {self.algorithm}")
-        utils.log_message(f"self.params: {self.params}")
+        self._input_key = None
+        self._cache_key = None
+        _, params, _ = self.build_run_parameters()
         utils.log_message(
-            f"self.params types: {[(k, type(v)) for k,v in self.params.items()]}"
+            "Configuring %s with parameters %r",
+            self.algorithm.id(),
+            params,
+            level="debug",
         )
-        utils.log_message(
-            f"self.params values: {[(k, v) for k,v in self.params.items()]}"
-        )
-        accepted, result = utils.execute_algorithm_dialog(self.algorithm, self.params)
+        accepted, result = utils.execute_algorithm_dialog(self.algorithm, params)
         # result = processing.execAlgorithmDialog(
         #     self.algorithm,
         #     self.params
         # )
         if accepted:
-            utils.log_message(f"result: {result}")
+            utils.log_message("result: %r", result, level="debug")
             successful = bool(result) if result is not None else False
             self.task_finished(successful, result)
 
     def task_finished(self, successful: bool, results: typing.Dict):
-        utils.log_message(f"successful: {successful}")
-        utils.log_message(f"results: {results}")
+        utils.log_message(
+            "%s finished - successful: %s, results: %r",
+            self.algorithm.id(),
+            successful,
+            results,
+            level="debug",
+        )
+        self.last_result = None
+        # tasks also report cancellation as an unsuccessful run
+        cancelled = self._task is not None and self._task.isCanceled()
+        if successful and self._cache_key is not None:
+            result_cache.get_result_cache().put(
+                self._cache_key, self.algorithm.id(), results
+            )
+        self._cache_key = None
+        # results of configured runs cannot be tied to the check's inputs
+        self.evaluated_key = self._input_key if successful else None
+        self._input_key = None
+        # cached results keep the timings of the run that produced them
+        timings = self._task.timings if self._task is not None else None
+        if timings is not None and not cancelled:
+            self.model.checklist.checks[self.row].timings = timings
+        # error outputs are only written when the algorithm actually runs
+        outputs = self._task.outputs if self._task is not None else None
+        self._task = None
+        duration = timings.wall_time if timings is not None else None
         if successful:
-            _raw = results.get(self.output_name, False)
-            utils.log_message(f"raw_result: {_raw}")
-            result = bool(_raw) if not self.negate_output else not bool(_raw)
-            if result:
-                msg = f"Automated validation succeeded"
-            else:
-                msg = "Automated validation failed"
-            utils.log_message(f"result: {result}")
-            self.model.setData(
-                self.validated_idx,
-                QtCore.Qt.Checked if result else False,
-                role=QtCore.Qt.CheckStateRole,
+            result = evaluate_automation_output(
+                results, self.output_name, self.negate_output
+            )
+            utils.log_message("result: %s", result, level="debug")
+            self.last_result = result
+            automation_result = get_automation_result(
+                result,
+                results,
+                self.output_name,
+                self._output_parameter_names,
+                outputs,
+                duration,
+            )
+            self.model.set_check_result(
+                self.row,
+                validated=QtCore.Qt.Checked if result else QtCore.Qt.Unchecked,
+                notes=get_automation_notes(automation_result),
+                evaluated=True,
+                automation_result=automation_result,
+            )
+        elif cancelled:
+            # the check was not evaluated, it is left pending
+            self.model.set_check_result(
+                self.row,
+                validated=QtCore.Qt.Unchecked,
+                notes="Automated validation was cancelled",
+                evaluated=False,
+            )
+        else:
+            automation_result = models.AutomationResult.from_error(
+                self.output_name,
+                f"{self.algorithm.id()} did not finish successfully",
+                duration,
             )
-            self.model.setData(
-                self.notes_idx, f"{msg} - {results}", role=QtCore.Qt.EditRole
+            self.model.set_check_result(
+                self.row,
+                validated=QtCore.Qt.Unchecked,
+                notes=get_automation_notes(automation_result),
+                evaluated=True,
+                automation_result=automation_result,
             )
 
 
-class AutomationButtonsWidget(QtWidgets.QWidget):
-    run_pb: QtWidgets.QPushButton
-    configure_pb: QtWidgets.QPushButton
-    checklist_item_head_index: QtCore.QModelIndex
-    dataset: typing.Union[QgsMapLayer, str]
-    automator: ValidationStepAutomator
+class AutomationScheduler(QtCore.QObject):
+    """Runs the automation of many checks, only a few of them at a time
+
+    Automators are queued with ``submit()`` and are handed over to the QGIS
+    task manager as running ones finish, so that there are never more than
+    ``max_workers`` of them running at the same time.
+
+    Checks may depend on other checks. A check only runs after all of its
+    dependencies have passed and it is skipped as soon as one of them does not
+    pass. Dependencies on checks that are not part of the run are judged by
+    their current status. With ``fail_fast`` the whole run is cancelled at the
+    first check that does not pass.
+
+    """
+
+    max_workers: int
+    fail_fast: bool
+    _queue: typing.Deque[ValidationStepAutomator]
+    _waiting: typing.Dict[int, ValidationStepAutomator]
+    _dependencies: typing.Dict[int, typing.Set[int]]
+    _results: typing.Dict[int, bool]
+    _running: typing.Dict[int, QgsProcessingAlgRunnerTask]
+    _total: int
+    _finished: int
+    _cancelled: bool
+
+    progress_changed = QtCore.pyqtSignal(int, int)
+    check_finished = QtCore.pyqtSignal(int, bool)
+    check_skipped = QtCore.pyqtSignal(int, str)
+    all_finished = QtCore.pyqtSignal(bool)
 
     def __init__(
         self,
-        checklist_item_head_index: QtCore.QModelIndex,
-        dataset: typing.Union[QgsMapLayer, str],
-        *args,
-        **kwargs,
+        max_workers: typing.Optional[int] = None,
+        fail_fast: bool = False,
+        parent=None,
     ):
-        super().__init__(*args, **kwargs)
-        self.run_pb = QtWidgets.QPushButton("Run", parent=self)
-        self.configure_pb = QtWidgets.QPushButton("Configure and run...", parent=self)
-        layout = QtWidgets.QHBoxLayout()
-        layout.addWidget(self.run_pb)
-        layout.addWidget(self.configure_pb)
-        self.setLayout(layout)
-
-        self.automator = ValidationStepAutomator.from_checklist_item(
-            checklist_item_head_index, dataset
-        )
-        self.run_pb.clicked.connect(self.automator.perform_automation)
-        self.configure_pb.clicked.connect(
-            self.automator.configure_and_perform_automation
+        super().__init__(parent)
+        self.max_workers = max_workers or utils.get_max_automation_workers()
+        self.fail_fast = fail_fast
+        self._queue = deque()
+        self._waiting = {}
+        self._dependencies = {}
+        self._results = {}
+        self._running = {}
+        self._total = 0
+        self._finished = 0
+        self._cancelled = False
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._queue or self._waiting or self._running)
+
+    def is_scheduled(self, row: int) -> bool:
+        """Return whether the check is waiting, queued or running"""
+        return (
+            row in self._waiting
+            or row in self._running
+            or any(row == queued.row for queued in self._queue)
         )
+
+    def submit(
+        self,
+        automators: typing.Iterable[ValidationStepAutomator],
+        dependencies: typing.Optional[typing.Dict[int, typing.Set[int]]] = None,
+    ):
+        """Queue automators for running
+
+        ``dependencies`` maps the row of a check to the rows of the checks it
+        depends on, as returned by ``models.get_automation_dependencies()``.
+
+        """
+
+        if not self.is_running:
+            self._total = 0
+            self._finished = 0
+            self._cancelled = False
+            self._results = {}
+            self._dependencies = {}
+        for automator in automators:
+            self._waiting[automator.row] = automator
+            self._dependencies[automator.row] = set(
+                (dependencies or {}).get(automator.row, set())
+            )
+            self._total += 1
+        self._release_waiting()
+        self._start_next()
+        self.progress_changed.emit(self._finished, self._total)
+        if not self.is_running:
+            self.all_finished.emit(not self._cancelled)
+
+    def cancel(self):
+        if not self.is_running:
+            return
+        self._cancelled = True
+        self._finished += len(self._queue) + len(self._waiting)
+        self._queue.clear()
+        self._waiting.clear()
+        for task in list(self._running.values()):
+            task.cancel()
+        self.progress_changed.emit(self._finished, self._total)
+
+    def _dependency_status(self, automator: ValidationStepAutomator, row: int):
+        """Return whether a dependency passed, or None if it is still unknown"""
+        if row in self._results:
+            result = self._results[row]
+        elif row in self._waiting or row in self._running:
+            result = None
+        elif any(row == queued.row for queued in self._queue):
+            result = None
+        else:
+            check_head = automator.model.checklist.checks[row]
+            result = check_head.status == CheckStatus.PASSED
+        return result
+
+    def _release_waiting(self):
+        """Queue waiting checks whose dependencies passed, skip the others"""
+        changed = True
+        while changed:
+            changed = False
+            for row, automator in list(self._waiting.items()):
+                statuses = [
+                    self._dependency_status(automator, dependency)
+                    for dependency in self._dependencies[row]
+                ]
+                if False in statuses:
+                    del self._waiting[row]
+                    self._results[row] = False
+                    self._finished += 1
+                    self.check_skipped.emit(
+                        row, "Skipped because a check it depends on did not pass"
+                    )
+                    changed = True
+                elif None not in statuses:
+                    del self._waiting[row]
+                    self._queue.append(automator)
+                    changed = True
+
+    def _start_next(self):
+        task_manager = QgsApplication.taskManager()
+        while self._queue and len(self._running) < self.max_workers:
+            automator = self._queue.popleft()
+            cached_results = automator.get_cached_results()
+            if cached_results is not None:
+                automator.task_finished(True, cached_results)
+                self._record_result(automator, True)
+                continue
+            task = automator.create_task()
+            task.executed.connect(functools.partial(self._task_finished, automator))
+            self._running[automator.row] = task
+            task_manager.addTask(task)
+
+    def _task_finished(
+        self, automator: ValidationStepAutomator, successful: bool, results: typing.Dict
+    ):
+        self._running.pop(automator.row, None)
+        self._record_result(automator, successful)
+        if not self._cancelled:
+            self._start_next()
+        self.progress_changed.emit(self._finished, self._total)
+        if not self.is_running:
+            self.all_finished.emit(not self._cancelled)
+
+    def _record_result(self, automator: ValidationStepAutomator, successful: bool):
+        self._finished += 1
+        passed = bool(successful and automator.last_result)
+        self._results[automator.row] = passed
+        self.check_finished.emit(automator.row, successful)
+        if not passed and self.fail_fast:
+            self.cancel()
+        if not self._cancelled:
+            self._release_waiting()
@@ -0,0 +1,422 @@
+"""Headless validation of many datasets with a single checklist
+
+This runs the automated checks of a checklist over each dataset, without
+needing the plugin's GUI, and writes one JSON report per dataset plus a CSV
+summary table. It can be used from the Python console or a standalone script:
+
+    from dataset_qa_workbench.datasetqaworkbench import batch
+    batch.run_batch(
+        Path("checklist.json"), ["/deliveries/**/*.gpkg"], Path("/reports")
+    )
+
+It is also available as the ``dataset_qa_workbench:batchvalidator``
+processing algorithm.
+
+"""
+
+import csv
+import glob
+import json
+import multiprocessing
+import typing
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    as_completed,
+)
+from pathlib import Path
+
+from qgis.core import (
+    QgsApplication,
+    QgsProcessingContext,
+    QgsProcessingException,
+    QgsProcessingFeedback,
+    QgsProcessingMultiStepFeedback,
+)
+from PyQt5.QtCore import Qt
+
+from . import (
+    automation,
+    error_outputs,
+    models,
+    report,
+    result_cache,
+    utils,
+)
+from .constants import CheckStatus
+
+SUMMARY_FILE_NAME = "summary.csv"
+
+SUMMARY_COLUMNS = (
+    "dataset",
+    "report",
+    "dataset_is_valid",
+    "total",
+    "passed",
+    "failed",
+    "pending",
+    "error",
+)
+
+
+class BatchResult:
+    __slots__ = ("dataset", "report", "report_path", "error")
+    dataset: Path
+    report: typing.Optional[typing.Dict]
+    report_path: typing.Optional[Path]
+    error: typing.Optional[str]
+
+    def __init__(
+        self,
+        dataset: Path,
+        report: typing.Optional[typing.Dict] = None,
+        report_path: typing.Optional[Path] = None,
+        error: typing.Optional[str] = None,
+    ):
+        self.dataset = dataset
+        self.report = report
+        self.report_path = report_path
+        self.error = error
+
+    @property
+    def is_valid(self) -> bool:
+        return self.report is not None and self.report["dataset_is_valid"]
+
+    def to_summary_row(self) -> typing.Dict:
+        summary = self.report["summary"] if self.report is not None else {}
+        return {
+            "dataset": str(self.dataset),
+            "report": str(self.report_path or ""),
+            "dataset_is_valid": self.is_valid,
+            "total": summary.get("total", ""),
+            "passed": summary.get("passed", ""),
+            "failed": summary.get("failed", ""),
+            "pending": summary.get("pending", ""),
+            "error": self.error or "",
+        }
+
+
+def expand_datasets(patterns: typing.Iterable[str]) -> typing.List[Path]:
+    """Return the paths of the datasets matched by paths or glob patterns
+
+    GeoPackages with the error outputs of previous validations are skipped.
+
+    """
+
+    result = []
+    seen = set()
+    for pattern in patterns:
+        pattern = pattern.strip()
+        if not pattern:
+            continue
+        matches = sorted(glob.glob(str(Path(pattern).expanduser()), recursive=True))
+        for match in matches:
+            if match.endswith(error_outputs.ERROR_OUTPUT_SUFFIX):
+                continue
+            path = Path(match).resolve()
+            if path not in seen:
+                seen.add(path)
+                result.append(path)
+    return result
+
+
+def run_check(
+    check: models.ChecklistItemHead,
+    session: automation.ValidationSession,
+    feedback: QgsProcessingFeedback,
+    use_cache: bool = True,
+):
+    """Run the automation of a single check and record its result on it
+
+    Cached results are looked up before the session's dataset is opened, so
+    that a dataset whose results are all cached is never opened.
+
+    """
+
+    automation_property = check.automation
+    algorithm = utils.get_processing_algorithm(automation_property.algorithm_id)
+    output_name = automation_property.output_name
+    if algorithm is None:
+        check.evaluated = True
+        check.automation_result = models.AutomationResult.from_error(
+            output_name, f"Invalid algorithm_id: {automation_property.algorithm_id!r}"
+        )
+        check.validation_notes = automation.get_automation_notes(
+            check.automation_result
+        )
+        return
+    outputs = session.get_error_outputs(check.name)
+    params, output_names = automation.build_automation_parameters(
+        algorithm,
+        automation_property.artifact_parameter_name,
+        session.artifact,
+        automation_property.extra_parameters,
+        outputs,
+    )
+    cache_key = (
+        automation.get_automation_cache_key(
+            algorithm, params, automation_property.artifact_parameter_name, output_names
+        )
+        if use_cache
+        else None
+    )
+    results = None
+    duration = None
+    was_run = False
+    if cache_key is not None:
+        results = result_cache.get_result_cache().get(cache_key)
+    if results is None:
+        try:
+            run_params = session.prepare_parameters(
+                algorithm, automation_property.artifact_parameter_name, params
+            )
+            with automation.measure_cost() as timings:
+                results, successful = algorithm.run(
+                    run_params, session.context, feedback
+                )
+            check.timings = timings
+            duration = timings.wall_time
+            was_run = True
+        except QgsProcessingException as exc:
+            results, successful = None, False
+            check.automation_result = models.AutomationResult.from_error(
+                output_name, str(exc)
+            )
+        else:
+            if not successful:
+                check.automation_result = models.AutomationResult.from_error(
+                    output_name, f"{algorithm.id()} did not finish successfully"
+                )
+        if successful and cache_key is not None:
+            result_cache.get_result_cache().put(cache_key, algorithm.id(), results)
+    else:
+        successful = True
+    check.evaluated = True
+    if successful:
+        result = automation.evaluate_automation_output(
+            results, output_name, automation_property.negate_output
+        )
+        check.validated = Qt.Checked if result else Qt.Unchecked
+        check.automation_result = automation.get_automation_result(
+            result,
+            results,
+            output_name,
+            output_names,
+            outputs if was_run else None,
+            duration,
+        )
+    check.validation_notes = automation.get_automation_notes(check.automation_result)
+
+
+def validate_dataset(
+    raw_checklist: typing.Dict,
+    dataset: Path,
+    context: typing.Optional[QgsProcessingContext] = None,
+    feedback: typing.Optional[QgsProcessingFeedback] = None,
+    use_cache: bool = True,
+) -> typing.Dict:
+    """Run the automated checks of a checklist on a dataset
+
+    Checks run in dependency order and those whose dependencies did not pass
+    are skipped. They all share the same validation session, so the dataset is
+    opened at most once. Returns the validation report.
+
+    """
+
+    session = automation.ValidationSession(dataset, context)
+    feedback = feedback or QgsProcessingFeedback()
+    checklist = models.CheckList.from_dict(raw_checklist)
+    dependencies = models.get_automation_dependencies(checklist.checks)
+    for row in models.get_automation_order(dependencies):
+        if feedback.isCanceled():
+            break
+        check = checklist.checks[row]
+        dependencies_passed = all(
+            checklist.checks[dependency].status == CheckStatus.PASSED
+            for dependency in dependencies[row]
+        )
+        if dependencies_passed:
+            feedback.pushInfo(f"Running check {check.name!r} on {dataset}...")
+            run_check(check, session, feedback, use_cache)
+        else:
+            check.validation_notes = (
+                "Skipped because a check it depends on did not pass"
+            )
+    return report.build_report_contents(
+        checklist, str(dataset), dataset_open_time=session.open_time
+    )
+
+
+def run_batch(
+    checklist_path: Path,
+    datasets: typing.Iterable[typing.Union[str, Path]],
+    output_dir: Path,
+    context: typing.Optional[QgsProcessingContext] = None,
+    feedback: typing.Optional[QgsProcessingFeedback] = None,
+    use_cache: bool = True,
+    workers: int = 1,
+) -> typing.List[BatchResult]:
+    """Validate many datasets and write their reports to ``output_dir``
+
+    ``datasets`` may contain paths or glob patterns. Errors with a dataset
+    are recorded in the summary table and do not stop the run.
+
+    With more than one worker, datasets are validated in a pool of worker
+    processes, each one with its own standalone ``QgsApplication``. This is
+    meant for standalone scripts, as QGIS desktop cannot spawn python worker
+    processes. Reports are written as datasets finish, the summary table
+    keeps the order of the datasets.
+
+    """
+
+    raw_checklist = models.load_raw_checklist(checklist_path)
+    dataset_paths = expand_datasets(str(dataset) for dataset in datasets)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    feedback = feedback or QgsProcessingFeedback()
+    if workers > 1 and len(dataset_paths) > 1:
+        outcomes = _validate_in_processes(
+            raw_checklist, dataset_paths, feedback, use_cache, workers
+        )
+    else:
+        outcomes = _validate_serially(
+            raw_checklist, dataset_paths, context, feedback, use_cache
+        )
+    results = {}
+    used_names = set()
+    for dataset, contents, error in outcomes:
+        if error is not None:
+            utils.log_message(f"Could not validate {dataset}: {error}", level="warning")
+            results[dataset] = BatchResult(dataset, error=error)
+        else:
+            report_path = output_dir / _get_unique_name(dataset, used_names)
+            report_path.write_text(json.dumps(contents, indent=2), encoding="utf-8")
+            results[dataset] = BatchResult(dataset, contents, report_path)
+    ordered_results = [results[path] for path in dataset_paths if path in results]
+    write_summary(ordered_results, output_dir / SUMMARY_FILE_NAME)
+    return ordered_results
+
+
+_Outcome = typing.Tuple[Path, typing.Optional[typing.Dict], typing.Optional[str]]
+
+
+def _validate_serially(
+    raw_checklist: typing.Dict,
+    dataset_paths: typing.List[Path],
+    context: typing.Optional[QgsProcessingContext],
+    feedback: QgsProcessingFeedback,
+    use_cache: bool,
+) -> typing.Iterator[_Outcome]:
+    multi_step_feedback = QgsProcessingMultiStepFeedback(
+        max(1, len(dataset_paths)), feedback
+    )
+    for index, dataset in enumerate(dataset_paths):
+        if feedback.isCanceled():
+            break
+        multi_step_feedback.setCurrentStep(index)
+        dataset_context = QgsProcessingContext()
+        if context is not None:
+            dataset_context.copyThreadSafeSettings(context)
+        try:
+            contents = validate_dataset(
+                raw_checklist,
+                dataset,
+                context=dataset_context,
+                feedback=multi_step_feedback,
+                use_cache=use_cache,
+            )
+        except (OSError, ValueError, KeyError) as exc:
+            yield dataset, None, str(exc)
+        else:
+            yield dataset, contents, None
+
+
+def _validate_in_processes(
+    raw_checklist: typing.Dict,
+    dataset_paths: typing.List[Path],
+    feedback: QgsProcessingFeedback,
+    use_cache: bool,
+    workers: int,
+) -> typing.Iterator[_Outcome]:
+    # forking a process that runs Qt is not safe, workers must be spawned
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_initialize_worker,
+    )
+    futures = {}
+    try:
+        for path in dataset_paths:
+            future = executor.submit(
+                _validate_in_worker, raw_checklist, str(path), use_cache
+            )
+            futures[future] = path
+        for finished, future in enumerate(as_completed(futures), start=1):
+            dataset = futures[future]
+            try:
+                contents, error = future.result()
+            except Exception as exc:  # a worker died, e.g. QGIS crashed
+                contents, error = None, f"Worker process failed: {exc!r}"
+            feedback.setProgress(100 * finished / len(futures))
+            yield dataset, contents, error
+            if feedback.isCanceled():
+                break
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def initialize_standalone_qgis():
+    """Set up a standalone QGIS application, with processing and our provider
+
+    Returns the application and the provider, which must be kept alive for as
+    long as they are used.
+
+    """
+
+    from processing.core.Processing import Processing
+    from ..processing_provider.provider import DatasetQaWorkbenchProvider
+
+    application = QgsApplication([], False)
+    application.initQgis()
+    Processing.initialize()
+    provider = DatasetQaWorkbenchProvider()
+    QgsApplication.processingRegistry().addProvider(provider)
+    return application, provider
+
+
+# the QGIS application and processing provider of a worker process
+_worker_state = []
+
+
+def _initialize_worker():
+    _worker_state.extend(initialize_standalone_qgis())
+
+
+def _validate_in_worker(
+    raw_checklist: typing.Dict, dataset: str, use_cache: bool
+) -> typing.Tuple[typing.Optional[typing.Dict], typing.Optional[str]]:
+    try:
+        contents = validate_dataset(raw_checklist, Path(dataset), use_cache=use_cache)
+    except (OSError, ValueError, KeyError) as exc:
+        result = None, str(exc)
+    else:
+        result = contents, None
+    return result
+
+
+def write_summary(results: typing.Iterable[BatchResult], path: Path):
+    with path.open("w", encoding="utf-8", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=SUMMARY_COLUMNS)
+        writer.writeheader()
+        for result in results:
+            writer.writerow(result.to_summary_row())
+
+
+def _get_unique_name(dataset: Path, used_names: typing.Set[str]) -> str:
+    name = f"{dataset.stem}-report.json"
+    suffix = 1
+    while name in used_names:
+        suffix += 1
+        name = f"{dataset.stem}-report-{suffix}.json"
+    used_names.add(name)
+    return name
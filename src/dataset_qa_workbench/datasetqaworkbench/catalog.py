@@ -0,0 +1,470 @@
+import functools
+import json
+import os
+import threading
+import typing
+import uuid
+from pathlib import Path
+
+from PyQt5 import QtCore
+from qgis.core import QgsTask
+
+from . import (
+    models,
+    utils,
+)
+from .constants import (
+    DatasetType,
+    ValidationArtifactType,
+)
+
+CATALOG_INDEX_VERSION = 2
+
+
+class ChecklistCatalogEntry:
+    """Lightweight description of a checklist file
+
+    Entries hold only what the checklist picker needs to show and nothing more,
+    so that listing the available checklists does not require re-parsing every
+    file in the checklists directory.
+
+    """
+
+    identifier: uuid.UUID
+    path: Path
+    size: int
+    mtime_ns: int
+    name: str
+    description: str
+    dataset_type: DatasetType
+    validation_artifact_type: ValidationArtifactType
+    check_count: int
+    report: typing.Optional[typing.Dict]
+
+    def __init__(
+        self,
+        path: Path,
+        size: int,
+        mtime_ns: int,
+        name: str,
+        description: str,
+        dataset_type: DatasetType,
+        validation_artifact_type: ValidationArtifactType,
+        check_count: int,
+        report: typing.Optional[typing.Dict] = None,
+    ):
+        self.identifier = uuid.uuid4()
+        self.path = path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.name = name
+        self.description = description
+        self.dataset_type = dataset_type
+        self.validation_artifact_type = validation_artifact_type
+        self.check_count = check_count
+        self.report = report
+
+    def is_up_to_date(self, stat_result: os.stat_result) -> bool:
+        return (
+            self.size == stat_result.st_size
+            and self.mtime_ns == stat_result.st_mtime_ns
+        )
+
+    def load_checklist(self) -> models.CheckList:
+        """Return a lazy checklist, whose checks are only read when accessed"""
+        return models.CheckList(
+            name=self.name,
+            description=self.description,
+            dataset_type=self.dataset_type,
+            validation_artifact_type=self.validation_artifact_type,
+            report=(
+                models.ChecklistReport.from_dict(self.report) if self.report else None
+            ),
+            checks_loader=functools.partial(models.load_raw_checks, self.path),
+        )
+
+    def update_checklist(self, checklist: models.CheckList) -> bool:
+        """Apply this entry's header fields to an already loaded checklist
+
+        Checklists whose checks have not been materialized yet are fully
+        updated and ``True`` is returned. Checklists that have already
+        materialized their checks are left untouched, as they may be in use.
+
+        """
+
+        if checklist.checks_loaded:
+            return False
+        checklist.name = self.name
+        checklist.description = self.description
+        checklist.dataset_type = self.dataset_type
+        checklist.validation_artifact_type = self.validation_artifact_type
+        checklist.report = (
+            models.ChecklistReport.from_dict(self.report) if self.report else None
+        )
+        checklist.set_checks_loader(
+            functools.partial(models.load_raw_checks, self.path)
+        )
+        return True
+
+    def to_dict(self) -> typing.Dict:
+        return {
+            "path": str(self.path),
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "name": self.name,
+            "description": self.description,
+            "dataset_type": self.dataset_type.value,
+            "validation_artifact_type": self.validation_artifact_type.value,
+            "check_count": self.check_count,
+            "report": self.report,
+        }
+
+    @classmethod
+    def from_dict(cls, raw: typing.Dict):
+        return cls(
+            path=Path(raw["path"]),
+            size=raw["size"],
+            mtime_ns=raw["mtime_ns"],
+            name=raw["name"],
+            description=raw.get("description", ""),
+            dataset_type=DatasetType(raw["dataset_type"]),
+            validation_artifact_type=ValidationArtifactType(
+                raw["validation_artifact_type"]
+            ),
+            check_count=raw.get("check_count", 0),
+            report=raw.get("report"),
+        )
+
+    @classmethod
+    def from_file(cls, path: Path, stat_result: typing.Optional[os.stat_result] = None):
+        stat_result = stat_result or path.stat()
+        raw = models.load_raw_checklist(path)
+        raw_report = raw.get("report")
+        if raw_report:
+            # fail early on an invalid report configuration
+            models.ChecklistReport.from_dict(raw_report)
+        return cls(
+            path=path,
+            size=stat_result.st_size,
+            mtime_ns=stat_result.st_mtime_ns,
+            name=raw["name"],
+            description=raw.get("description", ""),
+            dataset_type=DatasetType(raw["dataset_type"]),
+            validation_artifact_type=ValidationArtifactType(
+                raw["validation_artifact_type"]
+            ),
+            check_count=len(raw.get("checks", [])),
+            report=raw_report,
+        )
+
+
+class ChecklistCatalog:
+    """On-disk index of the checklists available in the checklists directory
+
+    The index is stored as a JSON file that lives next to the checklists
+    directory. Each entry records the size and modification time of its file,
+    which allows ``refresh()`` to only re-parse files that have changed since
+    the index was last written.
+
+    """
+
+    directory: Path
+    index_path: Path
+    entries: typing.Dict[str, ChecklistCatalogEntry]
+
+    def __init__(self, directory: Path, index_path: Path):
+        self.directory = directory
+        self.index_path = index_path
+        self.entries = {}
+        self._dirty = False
+        # the catalog may be refreshed from a background task
+        self._lock = threading.RLock()
+
+    def __iter__(self) -> typing.Iterator[ChecklistCatalogEntry]:
+        with self._lock:
+            entries = sorted(self.entries.values(), key=lambda e: e.path.name)
+        return iter(entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @classmethod
+    def from_index(
+        cls,
+        directory: typing.Optional[Path] = None,
+        index_path: typing.Optional[Path] = None,
+    ):
+        instance = cls(
+            directory or utils.get_checklists_dir(),
+            index_path or utils.get_checklists_index_path(),
+        )
+        instance.load_index()
+        return instance
+
+    def load_index(self):
+        self.entries = {}
+        try:
+            with self.index_path.open(encoding="utf-8") as fh:
+                raw = json.load(fh)
+        except FileNotFoundError:
+            return
+        except (UnicodeDecodeError, ValueError) as exc:
+            utils.log_message(
+                f"Discarding invalid checklist index {str(self.index_path)!r}: {exc}"
+            )
+            self._dirty = True
+            return
+        is_current_version = raw.get("version") == CATALOG_INDEX_VERSION
+        is_same_directory = raw.get("directory") == str(self.directory)
+        if not (is_current_version and is_same_directory):
+            self._dirty = True
+            return
+        for raw_entry in raw.get("entries", []):
+            try:
+                entry = ChecklistCatalogEntry.from_dict(raw_entry)
+            except (KeyError, ValueError):
+                self._dirty = True
+            else:
+                self.entries[str(entry.path)] = entry
+
+    def save_index(self, force: bool = False):
+        # the index is saved both by loading tasks and by the directory watcher,
+        # their writes to the temporary file must not interleave
+        with self._lock:
+            if not (self._dirty or force):
+                return
+            self._dirty = False
+            contents = {
+                "version": CATALOG_INDEX_VERSION,
+                "directory": str(self.directory),
+                "entries": [entry.to_dict() for entry in self],
+            }
+            temp_path = self.index_path.with_name(f"{self.index_path.name}.tmp")
+            try:
+                with temp_path.open("w", encoding="utf-8") as fh:
+                    json.dump(contents, fh)
+                os.replace(temp_path, self.index_path)
+            except OSError as exc:
+                utils.log_message(
+                    f"Could not write checklist index {str(self.index_path)!r}: "
+                    f"{exc}",
+                    level="warning",
+                )
+                self._dirty = True
+
+    def list_files(self) -> typing.List[Path]:
+        return [
+            item
+            for item in self.directory.iterdir()
+            if item != self.index_path and item.is_file()
+        ]
+
+    def scan(
+        self, paths: typing.Optional[typing.List[Path]] = None
+    ) -> typing.Iterator[
+        typing.Tuple[Path, typing.Optional[ChecklistCatalogEntry], typing.Optional[str]]
+    ]:
+        """Bring the catalog in sync with the contents of the checklists directory
+
+        This is a generator, yielding a ``(path, entry, error)`` tuple for each
+        checklist file as soon as it has been looked at, which allows callers to
+        process results incrementally. Entries whose files are no longer present
+        are dropped once all files have been visited.
+
+        """
+
+        paths = paths if paths is not None else self.list_files()
+        seen = set()
+        for path in paths:
+            seen.add(str(path))
+            error = self.update_file(path)
+            yield path, self.entries.get(str(path)), error
+        with self._lock:
+            vanished = set(self.entries.keys()) - seen
+        for key in vanished:
+            self.remove_file(Path(key))
+
+    def refresh(self) -> typing.List[typing.Tuple[Path, str]]:
+        """Bring the catalog in sync with the contents of the checklists directory
+
+        Returns a list with the files that could not be parsed, together with the
+        reason for the failure.
+
+        """
+
+        return [(path, error) for path, _, error in self.scan() if error is not None]
+
+    def update_file(self, path: Path) -> typing.Optional[str]:
+        key = str(path)
+        try:
+            stat_result = path.stat()
+        except FileNotFoundError:
+            self.remove_file(path)
+            return None
+        current = self.entries.get(key)
+        if current is not None and current.is_up_to_date(stat_result):
+            return None
+        try:
+            entry = ChecklistCatalogEntry.from_file(path, stat_result)
+        except (OSError, UnicodeDecodeError, ValueError, KeyError) as exc:
+            self.remove_file(path)
+            return str(exc)
+        with self._lock:
+            if current is not None:
+                entry.identifier = current.identifier
+            self.entries[key] = entry
+            self._dirty = True
+        return None
+
+    def remove_file(self, path: Path) -> typing.Optional[ChecklistCatalogEntry]:
+        with self._lock:
+            removed = self.entries.pop(str(path), None)
+            if removed is not None:
+                self._dirty = True
+        return removed
+
+
+class ChecklistCatalogTask(QgsTask):
+    """Refreshes a checklist catalog in a background thread
+
+    Entries are streamed back in batches through the ``entries_loaded`` signal,
+    so that they can be shown while the remaining files are still being looked
+    at. Parse errors are collected and logged as a single summary message once
+    the task is done.
+
+    """
+
+    catalog: ChecklistCatalog
+    batch_size: int
+    errors: typing.List[typing.Tuple[Path, str]]
+
+    entries_loaded = QtCore.pyqtSignal(list)
+
+    def __init__(self, catalog: ChecklistCatalog, batch_size: int = 20):
+        super().__init__("Loading checklists", QgsTask.CanCancel)
+        self.catalog = catalog
+        self.batch_size = batch_size
+        self.errors = []
+
+    def run(self) -> bool:
+        paths = self.catalog.list_files()
+        batch = []
+        for index, (path, entry, error) in enumerate(self.catalog.scan(paths)):
+            if self.isCanceled():
+                return False
+            if error is not None:
+                self.errors.append((path, error))
+            elif entry is not None:
+                batch.append(entry)
+            if len(batch) >= self.batch_size:
+                self.entries_loaded.emit(batch)
+                batch = []
+            self.setProgress((index + 1) / len(paths) * 100)
+        if len(batch) > 0:
+            self.entries_loaded.emit(batch)
+        self.catalog.save_index()
+        return True
+
+    def finished(self, result: bool):
+        if len(self.errors) > 0:
+            details = "\n".join(
+                f"- {str(path)!r}: {error}" for path, error in self.errors
+            )
+            utils.log_message(
+                f"Could not load {len(self.errors)} checklist(s):\n{details}",
+                level="warning",
+            )
+
+
+class ChecklistsDirectoryWatcher(QtCore.QObject):
+    """Keeps a checklist catalog in sync with changes on the checklists directory
+
+    Change notifications are debounced, so that a burst of changes (such as the
+    ones produced when syncing a whole directory of checklists) is processed
+    only once. Only the files that were actually touched are re-parsed and each
+    change is reported by emitting the relevant signal with the affected
+    catalog entry.
+
+    """
+
+    catalog: ChecklistCatalog
+
+    checklist_added = QtCore.pyqtSignal(object)
+    checklist_updated = QtCore.pyqtSignal(object)
+    checklist_removed = QtCore.pyqtSignal(object)
+
+    def __init__(
+        self,
+        catalog: ChecklistCatalog,
+        debounce_interval: int = 500,
+        parent: typing.Optional[QtCore.QObject] = None,
+    ):
+        super().__init__(parent)
+        self.catalog = catalog
+        self._changed_files = set()
+        self._directory_changed = False
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_interval)
+        self._timer.timeout.connect(self.apply_changes)
+        self._watcher = QtCore.QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._respond_to_directory_changed)
+        self._watcher.fileChanged.connect(self._respond_to_file_changed)
+        self._watcher.addPath(str(catalog.directory))
+        self._watch_files(catalog.list_files())
+
+    def _respond_to_directory_changed(self, path: str):
+        self._directory_changed = True
+        self._timer.start()
+
+    def _respond_to_file_changed(self, path: str):
+        self._changed_files.add(Path(path))
+        self._timer.start()
+
+    def _watch_files(self, paths: typing.Iterable[Path]):
+        watched = set(self._watcher.files())
+        to_watch = [
+            str(path) for path in paths if str(path) not in watched and path.is_file()
+        ]
+        if len(to_watch) > 0:
+            self._watcher.addPaths(to_watch)
+
+    def apply_changes(self):
+        changed = set(self._changed_files)
+        self._changed_files.clear()
+        if self._directory_changed:
+            self._directory_changed = False
+            # files that are created, deleted or replaced by renaming only
+            # trigger a notification for the directory. Only their stat info is
+            # checked here, actual parsing is restricted to changed files
+            present = self.catalog.list_files()
+            known = {entry.path for entry in self.catalog}
+            changed.update(present)
+            changed.update(known - set(present))
+        else:
+            present = None
+        errors = []
+        for path in sorted(changed):
+            error = self._apply_change(path)
+            if error is not None:
+                errors.append((path, error))
+        if len(errors) > 0:
+            details = "\n".join(f"- {str(path)!r}: {error}" for path, error in errors)
+            utils.log_message(
+                f"Could not reload {len(errors)} checklist(s):\n{details}",
+                level="warning",
+            )
+        self.catalog.save_index()
+        self._watch_files(present if present is not None else changed)
+
+    def _apply_change(self, path: Path) -> typing.Optional[str]:
+        previous = self.catalog.entries.get(str(path))
+        error = self.catalog.update_file(path)
+        current = self.catalog.entries.get(str(path))
+        if current is None and previous is not None:
+            self.checklist_removed.emit(previous)
+        elif current is not None and previous is None:
+            self.checklist_added.emit(current)
+        elif current is not previous:
+            self.checklist_updated.emit(current)
+        return error
@@ -1,13 +1,13 @@
-import json
 import typing
 from pathlib import Path
 
+from qgis.core import QgsApplication
 from PyQt5 import uic
 from PyQt5 import QtCore
 from PyQt5 import QtGui
 from PyQt5 import QtWidgets
 
-from . import models
+from . import catalog
 from . import utils
 from .constants import (
     ChecklistModelColumn,
@@ -24,8 +24,17 @@ class ChecklistPicker(QtWidgets.QDialog, FORM_CLASS):
     checklist_save_path_la: QtWidgets.QLabel
     checklists_tv: QtWidgets.QTreeView
     delete_checklist_pb: QtWidgets.QPushButton
+    loading_pb: QtWidgets.QProgressBar
+    loading_task: typing.Optional[catalog.ChecklistCatalogTask]
+    watcher: typing.Optional[catalog.ChecklistsDirectoryWatcher]
 
-    def __init__(self, iface, parent=None):
+    def __init__(
+        self,
+        iface,
+        parent=None,
+        checklist_catalog: typing.Optional[catalog.ChecklistCatalog] = None,
+        watcher: typing.Optional[catalog.ChecklistsDirectoryWatcher] = None,
+    ):
         """Constructor."""
         super(ChecklistPicker, self).__init__(parent)
         # Set up the user interface from Designer through FORM_CLASS.
@@ -40,8 +49,9 @@ class ChecklistPicker(QtWidgets.QDialog, FORM_CLASS):
         self.checklist_save_path_la.setText(
             f"Checklists are loaded from {utils.get_checklists_dir()}"
         )
-        checklists = models.load_checklists()
-        self.model = QtGui.QStandardItemModel(len(checklists), 3)
+        self.catalog = checklist_catalog or catalog.ChecklistCatalog.from_index()
+        self._items_by_path = {}
+        self.model = QtGui.QStandardItemModel(0, len(ChecklistModelColumn))
         self.model.setHorizontalHeaderLabels(
             [i.name.replace("_", " ").capitalize() for i in ChecklistModelColumn]
         )
@@ -54,7 +64,45 @@ class ChecklistPicker(QtWidgets.QDialog, FORM_CLASS):
         )
         self.model.rowsRemoved.connect(self.toggle_delete_checklist_button)
         self.button_box.button(self.button_box.Ok).setEnabled(False)
-        self.load_checklists(checklists)
+        self.load_checklists([])
+        self.finished.connect(self.cancel_loading)
+        self.loading_task = None
+        self.start_loading()
+        self.watcher = watcher
+        if watcher is not None:
+            watcher.checklist_added.connect(self.update_checklist)
+            watcher.checklist_updated.connect(self.update_checklist)
+            watcher.checklist_removed.connect(self.remove_checklist)
+            # the watcher outlives the dialog, which would otherwise be kept alive
+            self.finished.connect(self.stop_watching)
+
+    def stop_watching(self, *args):
+        if self.watcher is not None:
+            self.watcher.checklist_added.disconnect(self.update_checklist)
+            self.watcher.checklist_updated.disconnect(self.update_checklist)
+            self.watcher.checklist_removed.disconnect(self.remove_checklist)
+            self.watcher = None
+
+    def start_loading(self):
+        self.loading_pb.setValue(0)
+        self.loading_pb.setVisible(True)
+        self.loading_task = catalog.ChecklistCatalogTask(self.catalog)
+        self.loading_task.entries_loaded.connect(self.append_checklists)
+        self.loading_task.progressChanged.connect(self.update_loading_progress)
+        self.loading_task.taskCompleted.connect(self.finish_loading)
+        self.loading_task.taskTerminated.connect(self.finish_loading)
+        QgsApplication.taskManager().addTask(self.loading_task)
+
+    def update_loading_progress(self, progress: float):
+        self.loading_pb.setValue(int(progress))
+
+    def finish_loading(self):
+        self.loading_task = None
+        self.loading_pb.setVisible(False)
+
+    def cancel_loading(self, *args):
+        if self.loading_task is not None:
+            self.loading_task.cancel()
 
     def enable_checklist_actions(
         self, selected: QtCore.QItemSelection, deselected: QtCore.QItemSelection
@@ -73,52 +121,28 @@ class ChecklistPicker(QtWidgets.QDialog, FORM_CLASS):
         if idx.isValid():
             model = self.checklists_tv.model()
             identifier_index = model.index(idx.row(), 0)
-            checklist = identifier_index.data(
+            entry: catalog.ChecklistCatalogEntry = identifier_index.data(
                 role=CustomDataRoles.CHECKLIST_DOWNLOADER_IDENTIFIER.value
             )
-            path = (
-                utils.get_checklists_dir()
-                / f"{sanitize_checklist_name(checklist.name)}.json"
-            )
             try:
-                path.unlink()
+                entry.path.unlink()
             except FileNotFoundError as exc:
                 utils.log_message(str(exc))
             else:
-                model.removeRow(idx.row())
+                self.catalog.remove_file(entry.path)
+                self.catalog.save_index()
+                self.remove_checklist(entry)
 
-    def load_checklists(self, checklists: typing.List[models.CheckList]):
+    def load_checklists(self, entries: typing.List[catalog.ChecklistCatalogEntry]):
         self.checklists_tv.selectionModel().select(
             QtCore.QItemSelection(), QtCore.QItemSelectionModel.Clear
         )
         self.model.clear()
+        self._items_by_path.clear()
         self.model.setHorizontalHeaderLabels(
             [i.name.replace("_", " ").capitalize() for i in ChecklistModelColumn]
         )
-        for row_index, checklist in enumerate(checklists):
-            checklist: models.CheckList
-            identifier_item = QtGui.QStandardItem(str(checklist.identifier))
-            identifier_item.setData(
-                checklist, role=CustomDataRoles.CHECKLIST_DOWNLOADER_IDENTIFIER.value
-            )
-            self.model.setItem(
-                row_index, ChecklistModelColumn.IDENTIFIER.value, identifier_item
-            )
-            self.model.setItem(
-                row_index,
-                ChecklistModelColumn.NAME.value,
-                QtGui.QStandardItem(checklist.name),
-            )
-            self.model.setItem(
-                row_index,
-                ChecklistModelColumn.DATASET_TYPE.value,
-                QtGui.QStandardItem(checklist.dataset_type.value),
-            )
-            self.model.setItem(
-                row_index,
-                ChecklistModelColumn.APPLICABLE_TO.value,
-                QtGui.QStandardItem(checklist.validation_artifact_type.value),
-            )
+        self.append_checklists(entries)
         # self.checklists_tv.setModel(self.model)
         self.checklists_tv.setColumnHidden(ChecklistModelColumn.IDENTIFIER.value, True)
         header = self.checklists_tv.header()
@@ -127,6 +151,47 @@ class ChecklistPicker(QtWidgets.QDialog, FORM_CLASS):
         # self.checklists_tv.setSortingEnabled(True)
         # self.checklists_tv.sortByColumn(ChecklistModelColumn.DATASET_TYPES.value, QtCore.Qt.DescendingOrder)
 
+    def append_checklists(self, entries: typing.List[catalog.ChecklistCatalogEntry]):
+        for entry in entries:
+            if str(entry.path) in self._items_by_path:
+                self.update_checklist(entry)
+                continue
+            identifier_item = QtGui.QStandardItem(str(entry.identifier))
+            identifier_item.setData(
+                entry, role=CustomDataRoles.CHECKLIST_DOWNLOADER_IDENTIFIER.value
+            )
+            row = [None] * len(ChecklistModelColumn)
+            row[ChecklistModelColumn.IDENTIFIER.value] = identifier_item
+            row[ChecklistModelColumn.NAME.value] = QtGui.QStandardItem(entry.name)
+            row[ChecklistModelColumn.DATASET_TYPE.value] = QtGui.QStandardItem(
+                entry.dataset_type.value
+            )
+            row[ChecklistModelColumn.APPLICABLE_TO.value] = QtGui.QStandardItem(
+                entry.validation_artifact_type.value
+            )
+            self.model.appendRow(row)
+            self._items_by_path[str(entry.path)] = identifier_item
+
+    def update_checklist(self, entry: catalog.ChecklistCatalogEntry):
+        identifier_item = self._items_by_path.get(str(entry.path))
+        if identifier_item is None:
+            self.append_checklists([entry])
+        else:
+            row = identifier_item.row()
+            identifier_item.setData(
+                entry, role=CustomDataRoles.CHECKLIST_DOWNLOADER_IDENTIFIER.value
+            )
+            for column, value in (
+                (ChecklistModelColumn.NAME, entry.name),
+                (ChecklistModelColumn.DATASET_TYPE, entry.dataset_type.value),
+                (
+                    ChecklistModelColumn.APPLICABLE_TO,
+                    entry.validation_artifact_type.value,
+                ),
+            ):
+                self.model.item(row, column.value).setText(value)
 
-def sanitize_checklist_name(name: str) -> str:
-    return name.replace(" ", "_").lower()
+    def remove_checklist(self, entry: catalog.ChecklistCatalogEntry):
+        identifier_item = self._items_by_path.pop(str(entry.path), None)
+        if identifier_item is not None:
+            self.model.removeRow(identifier_item.row())
@@ -42,6 +42,29 @@ class ChecklistItemPropertyColumn(Enum):
     VALIDATION_NOTES = 3
 
 
+class CheckStatus(Enum):
+    PASSED = "passed"
+    FAILED = "failed"
+    PENDING = "pending"
+
+
+class AutomationStatus(Enum):
+    PASSED = "passed"
+    FAILED = "failed"
+    ERROR = "error"
+
+
+class ErrorOutputMode(Enum):
+    DISCARD = "discard"
+    TEMPORARY = "temporary"
+    PERSISTENT = "persistent"
+
+
+class AutomationButton(Enum):
+    RUN = "Run"
+    CONFIGURE = "Configure and run..."
+
+
 class LayerChooserDataRole(Enum):
     LAYER_IDENTIFIER = Qt.UserRole + 1
 
@@ -1,4 +1,3 @@
-import datetime as dt
 import json
 import typing
 from pathlib import Path
@@ -24,19 +23,30 @@ from PyQt5.QtPrintSupport import QPrinter
 
 from . import models
 from . import utils
-from .automation import AutomationButtonsWidget
+from .automation import (
+    AutomationScheduler,
+    DatasetWatcher,
+    ValidationSession,
+    ValidationStepAutomator,
+)
+from .catalog import (
+    ChecklistCatalog,
+    ChecklistCatalogEntry,
+    ChecklistsDirectoryWatcher,
+)
 from .checklist_picker import ChecklistPicker
 from .constants import (
-    ChecklistItemPropertyColumn,
     ChecklistModelColumn,
     CustomDataRoles,
     DatasetType,
     LayerChooserDataRole,
-    QGIS_VARIABLE_PREFIX,
     TabPages,
     ValidationArtifactType,
 )
-from .report import ReportHandler
+from .report import (
+    ReportHandler,
+    build_report_contents,
+)
 from .utils import log_message
 
 # This loads your .ui file so that PyQt can populate your plugin with the elements from Qt Designer
@@ -57,6 +67,12 @@ class DatasetQaWorkbenchDock(QtWidgets.QDockWidget, FORM_CLASS):
     checklist_description_te: QtWidgets.QTextEdit
     choose_checklist_pb: QtWidgets.QPushButton
     clear_checks_pb: QtWidgets.QPushButton
+    checks_progress_la: QtWidgets.QLabel
+    automate_all_checks_pb: QtWidgets.QPushButton
+    automation_pb: QtWidgets.QProgressBar
+    use_automation_cache_cb: QtWidgets.QCheckBox
+    revalidate_on_change_cb: QtWidgets.QCheckBox
+    sort_by_cost_cb: QtWidgets.QCheckBox
     validate_file_rb: QtWidgets.QRadioButton
     validate_layer_rb: QtWidgets.QRadioButton
     layer_chooser_lv: QtWidgets.QListView
@@ -69,6 +85,10 @@ class DatasetQaWorkbenchDock(QtWidgets.QDockWidget, FORM_CLASS):
     run_post_validation_pb: QtWidgets.QPushButton
     configure_and_run_post_validation_pb: QtWidgets.QPushButton
     report_handler: typing.Optional[ReportHandler]
+    automators: typing.Dict[int, ValidationStepAutomator]
+    automation_scheduler: AutomationScheduler
+    validation_session: typing.Optional[ValidationSession]
+    dataset_watcher: DatasetWatcher
 
     closingPlugin = QtCore.pyqtSignal()
 
@@ -86,6 +106,28 @@ class DatasetQaWorkbenchDock(QtWidgets.QDockWidget, FORM_CLASS):
         self.iface = iface
         self.checklists = []
         self.selected_checklist = None
+        self.selected_checklist_entry = None
+        self.automators = {}
+        self.validation_session = None
+        self.automation_scheduler = AutomationScheduler(parent=self)
+        self.automation_scheduler.progress_changed.connect(
+            self.update_automation_progress
+        )
+        self.automation_scheduler.all_finished.connect(self.finish_automation)
+        self.automation_scheduler.check_skipped.connect(self.respond_to_check_skipped)
+        self._revalidation_pending = False
+        self.dataset_watcher = DatasetWatcher(parent=self)
+        self.dataset_watcher.dataset_changed.connect(self.revalidate_stale_checks)
+        self.checklist_catalog = ChecklistCatalog.from_index()
+        self.checklists_watcher = ChecklistsDirectoryWatcher(
+            self.checklist_catalog, parent=self
+        )
+        self.checklists_watcher.checklist_updated.connect(
+            self.respond_to_checklist_updated
+        )
+        self.checklists_watcher.checklist_removed.connect(
+            self.respond_to_checklist_removed
+        )
         self.tab_widget.currentChanged.connect(self.update_tab_page)
         self.tab_widget.setTabEnabled(TabPages.CHOOSE.value, True)
         self.tab_widget.setTabEnabled(TabPages.VALIDATE.value, False)
@@ -99,6 +141,7 @@ class DatasetQaWorkbenchDock(QtWidgets.QDockWidget, FORM_CLASS):
         )
         self.clear_checks_pb.clicked.connect(self.clear_all_checks)
         self.automate_all_checks_pb.clicked.connect(self.automate_all_checks)
+        self.sort_by_cost_cb.toggled.connect(self.toggle_sort_by_cost)
         self.file_chooser.fileChanged.connect(self.selected_file_changed)
         self.validate_layer_rb.toggled.connect(
             self.respond_to_validate_layer_rb_toggled
@@ -109,7 +152,7 @@ class DatasetQaWorkbenchDock(QtWidgets.QDockWidget, FORM_CLASS):
         QgsProject.instance().layersRemoved.connect(self.respond_to_layers_removed)
 
     def respond_to_layers_added(self, layers):
-        utils.log_message("layers added")
+        utils.log_message("layers added", level="debug")
         if self.selected_checklist is not None:
             current_dataset_type = self.selected_checklist.dataset_type
             model: QtGui.QStandardItemModel = self.layer_chooser_lv.model()
@@ -122,7 +165,7 @@ class DatasetQaWorkbenchDock(QtWidgets.QDockWidget, FORM_CLASS):
                     model.appendRow([item])
 
     def respond_to_layers_removed(self, layers: typing.List[str]):
-        utils.log_message("layers removed")
+        utils.log_message("layers removed", level="debug")
         model: QtGui.QStandardItemModel = self.layer_chooser_lv.model()
         if model is not None:
             for row_idx in reversed(range(model.rowCount())):
@@ -131,32 +174,199 @@ class DatasetQaWorkbenchDock(QtWidgets.QDockWidget, FORM_CLASS):
                 if item.data() in layers:
                     model.removeRow(row_idx)
 
+    def respond_to_checklist_updated(self, entry: ChecklistCatalogEntry):
+        if self._is_selected_checklist_entry(entry):
+            self.selected_checklist_entry = entry
+            if entry.update_checklist(self.selected_checklist):
+                self.checklist_name_le.setText(entry.name)
+                self.checklist_description_te.setText(entry.description)
+            else:
+                self.iface.messageBar().pushMessage(
+                    "Info",
+                    f"Checklist {self.selected_checklist.name!r} has been modified "
+                    f"on disk. Choose it again in order to use the new version",
+                    level=Qgis.Info,
+                )
+
+    def respond_to_checklist_removed(self, entry: ChecklistCatalogEntry):
+        if self._is_selected_checklist_entry(entry):
+            self.iface.messageBar().pushMessage(
+                "Info",
+                f"Checklist {self.selected_checklist.name!r} has been removed from "
+                f"disk",
+                level=Qgis.Info,
+            )
+
+    def _is_selected_checklist_entry(self, entry: ChecklistCatalogEntry) -> bool:
+        return (
+            self.selected_checklist is not None
+            and self.selected_checklist_entry is not None
+            and self.selected_checklist_entry.path == entry.path
+        )
+
     def clear_all_checks(self):
-        utils.log_message(f"clear_all_checks_called")
-        model = self.checklist_checks_tv.model()
-        for row_index in range(model.rowCount()):
-            utils.log_message(f"Unchecking row {row_index}...")
-            checkbox_index = model.index(row_index, 1)
-            model.setData(
-                checkbox_index, QtCore.Qt.Unchecked, role=QtCore.Qt.CheckStateRole
+        utils.log_message("clear_all_checks_called", level="debug")
+        model: models.CheckListItemsModel = self.checklist_checks_tv.model()
+        changes = (
+            (row, QtCore.Qt.Unchecked, "") for row in range(model.total_root_count())
+        )
+        model.set_many(changes, evaluated=False)
+
+    def automate_all_checks(self):
+        utils.log_message("automate_all_checks_called", level="debug")
+        if self.automation_scheduler.is_running:
+            self.automation_scheduler.cancel()
+            return
+        model: models.CheckListItemsModel = self.checklist_checks_tv.model()
+        try:
+            dependencies = models.get_automation_dependencies(model.checklist.checks)
+        except ValueError as exc:
+            self.iface.messageBar().pushMessage(
+                "Error", f"Could not automate checks: {exc}", level=Qgis.Critical
             )
-            head_index = model.index(row_index, 0)
-            notes_index = model.index(
-                ChecklistItemPropertyColumn.VALIDATION_NOTES.value, 1, parent=head_index
+            return
+        automators = []
+        for row in dependencies:
+            automator = self._get_automator(row)
+            if automator is not None:
+                automators.append(automator)
+        if automators:
+            self.automate_all_checks_pb.setText("Cancel automation")
+            self.automation_pb.setVisible(True)
+            self.automation_scheduler.fail_fast = utils.get_automation_fail_fast()
+            self.automation_scheduler.submit(automators, dependencies)
+
+    def respond_to_check_skipped(self, row: int, reason: str):
+        model: models.CheckListItemsModel = self.checklist_checks_tv.model()
+        # a result from a previous run would no longer hold
+        model.set_check_result(
+            row, validated=QtCore.Qt.Unchecked, notes=reason, evaluated=False
+        )
+
+    def update_automation_progress(self, finished: int, total: int):
+        self.automation_pb.setMaximum(total)
+        self.automation_pb.setValue(finished)
+
+    def finish_automation(self, completed: bool):
+        utils.log_message(
+            "automation of all checks completed: %s", completed, level="debug"
+        )
+        self.automate_all_checks_pb.setText("Automate all checks")
+        self.automation_pb.setVisible(False)
+        if self._revalidation_pending:
+            self.revalidate_stale_checks()
+
+    def revalidate_stale_checks(self):
+        """Re-run the automated checks whose results are outdated
+
+        This is called when the dataset changes. Only checks that have already
+        been evaluated by their automation are considered. Those whose inputs
+        did not change keep their result, the others are re-run in the
+        background. If an automation run is in progress, including runs of
+        single checks, revalidation waits for it to finish, since running
+        tasks still use the layer of the current validation session.
+
+        """
+
+        model: models.CheckListItemsModel = self.checklist_checks_tv.model()
+        if model is None or not self.revalidate_on_change_cb.isChecked():
+            return
+        if self.automation_scheduler.is_running or any(
+            automator.is_running for automator in self.automators.values()
+        ):
+            self._revalidation_pending = True
+            return
+        self._revalidation_pending = False
+        # a layer opened by the previous session would show outdated contents
+        self.validation_session = ValidationSession(self.dataset)
+        stale = []
+        for row, automator in self.automators.items():
+            automator.session = self.validation_session
+            if model.checklist.checks[row].evaluated and automator.is_stale():
+                stale.append(automator)
+        if stale:
+            utils.log_message(f"Revalidating {len(stale)} outdated check(s)")
+            try:
+                dependencies = models.get_automation_dependencies(
+                    model.checklist.checks
+                )
+            except ValueError:
+                dependencies = None  # checks are then revalidated independently
+            changes = (
+                (automator.row, QtCore.Qt.Unchecked, "Dataset changed, revalidating...")
+                for automator in stale
             )
-            model.setData(notes_index, "", role=QtCore.Qt.EditRole)
+            model.set_many(changes, evaluated=False)
+            self.automate_all_checks_pb.setText("Cancel automation")
+            self.automation_pb.setVisible(True)
+            self.automation_scheduler.submit(stale, dependencies)
 
-    def automate_all_checks(self):
-        utils.log_message(f"automate_all_checks_called")
-        model = self.checklist_checks_tv.model()
-        for row_index in range(model.rowCount()):
-            item_head_index = model.index(row_index, 0)
-            automation_index = model.index(
-                ChecklistItemPropertyColumn.AUTOMATION.value, 1, parent=item_head_index
+    def toggle_sort_by_cost(self, checked: bool):
+        model: models.CheckListItemsModel = self.checklist_checks_tv.model()
+        if model is not None:
+            model.sort_by_cost(checked)
+
+    def run_automation(self, head_index: QtCore.QModelIndex):
+        row = head_index.model().check_row(head_index.row())
+        if self._is_automation_in_progress(row):
+            return
+        automator = self._get_automator(row)
+        if automator is not None:
+            task = automator.perform_automation()
+            if task is not None:
+                task.executed.connect(self.respond_to_check_automated)
+
+    def respond_to_check_automated(self, successful: bool, results: typing.Dict):
+        if self._revalidation_pending:
+            self.revalidate_stale_checks()
+
+    def configure_automation(self, head_index: QtCore.QModelIndex):
+        row = head_index.model().check_row(head_index.row())
+        if self._is_automation_in_progress(row):
+            return
+        automator = self._get_automator(row)
+        if automator is not None:
+            automator.configure_and_perform_automation()
+
+    def _is_automation_in_progress(self, row: int) -> bool:
+        """Return whether the check is being automated, telling the user if so"""
+        automator = self.automators.get(row)
+        result = self.automation_scheduler.is_scheduled(row) or (
+            automator is not None and automator.is_running
+        )
+        if result:
+            model: models.CheckListItemsModel = self.checklist_checks_tv.model()
+            self.iface.messageBar().pushMessage(
+                "Info",
+                f"Check {model.checklist.checks[row].name!r} is already being "
+                f"automated",
+                level=Qgis.Info,
             )
-            automation_widget = self.checklist_checks_tv.indexWidget(automation_index)
-            if automation_widget:
-                automation_widget.automator.perform_automation()
+        return result
+
+    def _get_automator(self, row: int) -> typing.Optional[ValidationStepAutomator]:
+        """Return the automator of a check, creating it on first use"""
+        automator = self.automators.get(row)
+        if automator is None:
+            model: models.CheckListItemsModel = self.checklist_checks_tv.model()
+            if self.validation_session is None:
+                self.validation_session = ValidationSession(self.dataset)
+            try:
+                automator = ValidationStepAutomator.from_check(
+                    model, row, self.dataset, session=self.validation_session
+                )
+            except RuntimeError as exc:
+                self.iface.messageBar().pushMessage(
+                    "Error",
+                    f"Could not automate check {model.checklist.checks[row].name!r}: "
+                    f"{exc}",
+                    level=Qgis.Critical,
+                )
+            else:
+                self.automators[row] = automator
+        if automator is not None:
+            automator.use_cache = self.use_automation_cache_cb.isChecked()
+        return automator
 
     def update_tab_page(self, index: int):
         if index == TabPages.REPORT.value:
@@ -227,7 +437,12 @@ class DatasetQaWorkbenchDock(QtWidgets.QDockWidget, FORM_CLASS):
     def generate_report(self, dataset: typing.Union[QgsMapLayer, str]):
         checklist_model = self.checklist_checks_tv.model()
         if checklist_model is not None:
-            result = get_report_contents(checklist_model, dataset)
+            session = self.validation_session
+            result = get_report_contents(
+                checklist_model,
+                dataset,
+                dataset_open_time=session.open_time if session is not None else None,
+            )
         else:
             result = None
         return result
@@ -280,60 +495,70 @@ class DatasetQaWorkbenchDock(QtWidgets.QDockWidget, FORM_CLASS):
         self, current: QtCore.QModelIndex, previous: QtCore.QModelIndex
     ):
         utils.log_message(
-            f"inside load_checklist_steps selected_checklist: {self.selected_checklist}"
+            "inside load_checklist_steps selected_checklist: %s",
+            self.selected_checklist,
+            level="debug",
         )
-        utils.log_message(
-            f"selected_checklist checks: {self.selected_checklist.checks}"
-        )
-        for head_check in self.selected_checklist.checks:
-            head_check: models.ChecklistItemHead
-            utils.log_message(
-                f"check {head_check.name} description: "
-                f"{head_check.check_properties[ChecklistItemPropertyColumn.DESCRIPTION.value]}"
+        try:
+            # lazy checklists get their checks materialized here
+            checks = self.selected_checklist.checks
+        except (OSError, UnicodeDecodeError, ValueError, KeyError) as exc:
+            self.iface.messageBar().pushMessage(
+                "Error",
+                f"Could not load the checks of {self.selected_checklist.name!r}: {exc}",
+                level=Qgis.Critical,
             )
+            return
+        utils.log_message("selected_checklist checks: %s", checks, level="debug")
         checklist_checks_model = models.CheckListItemsModel(self.selected_checklist)
+        if self.sort_by_cost_cb.isChecked():
+            checklist_checks_model.sort_by_cost()
         self.checklist_checks_tv.setModel(checklist_checks_model)
+        checklist_checks_model.summaryChanged.connect(self.update_checks_progress)
+        self.update_checks_progress(checklist_checks_model.summary())
         self.checklist_checks_tv.resized.connect(self.force_model_update)
         self.checklist_checks_tv.setTextElideMode(QtCore.Qt.ElideNone)
         self.checklist_checks_tv.setWordWrap(True)
         self.checklist_checks_tv.setAlternatingRowColors(True)
-        self.add_automation_widgets()
+        self.automation_scheduler.cancel()
+        self.automators = {}
+        self.validation_session = None
+        self._revalidation_pending = False
+        self.dataset_watcher.watch(self.dataset)
         header = self.checklist_checks_tv.header()
         header.setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeToContents)
         delegate = models.ChecklistItemsModelDelegate(self.checklist_checks_tv)
+        delegate.run_automation_requested.connect(self.run_automation)
+        delegate.configure_automation_requested.connect(self.configure_automation)
         self.checklist_checks_tv.setItemDelegate(delegate)
 
-    def add_automation_widgets(self):
-        model = self.checklist_checks_tv.model()
-        for head_row in range(model.rowCount()):
-            head_index = model.index(head_row, 0)
-            item_head: models.ChecklistItemHead = head_index.internalPointer().ref
-            if item_head.automation.algorithm_id is not None:
-                automation_index = model.index(
-                    ChecklistItemPropertyColumn.AUTOMATION.value, 1, head_index
-                )
-                automation_widget = AutomationButtonsWidget(
-                    checklist_item_head_index=head_index, dataset=self.dataset
-                )
-                self.checklist_checks_tv.setIndexWidget(
-                    automation_index, automation_widget
-                )
+    def update_checks_progress(self, summary: models.ChecklistSummary):
+        self.checks_progress_la.setText(
+            f"{summary.passed} passed, {summary.failed} failed, "
+            f"{summary.pending} pending of {summary.total}"
+        )
 
     def force_model_update(self):
+        """Make the view recompute the height of multiline cells
+
+        Only expanded checks are notified, as collapsed ones are not laid out.
+        The delegate caches heights per column width, so this is cheap for
+        cells whose width did not change.
+
+        """
+
         model = self.checklist_checks_tv.model()
+        if model is None:
+            return
         for row in range(model.rowCount()):
             parent = model.index(row, 0)
-            properties = (
-                ChecklistItemPropertyColumn.DESCRIPTION.value,
-                ChecklistItemPropertyColumn.GUIDE.value,
-                ChecklistItemPropertyColumn.VALIDATION_NOTES.value,
-            )
-            for property_row in properties:
-                property_index = model.index(property_row, 1, parent)
-                model.dataChanged.emit(property_index, property_index)
+            if self.checklist_checks_tv.isExpanded(parent):
+                first = model.index(0, 1, parent)
+                last = model.index(model.rowCount(parent) - 1, 1, parent)
+                model.dataChanged.emit(first, last)
 
     def selected_file_changed(self, raw_path: str):
-        utils.log_message(f"selected_file_changed raw_path: {raw_path}")
+        utils.log_message("selected_file_changed raw_path: %s", raw_path, level="debug")
         if raw_path and self.validate_file_rb.isChecked():
             self.toggle_other_pages(True)
             self.dataset = Path(raw_path).expanduser().resolve()
@@ -376,14 +601,14 @@ class DatasetQaWorkbenchDock(QtWidgets.QDockWidget, FORM_CLASS):
 
     def _get_current_layer(self) -> typing.Optional[QgsMapLayer]:
         current_layer_idx = self.layer_chooser_lv.currentIndex()
-        utils.log_message(f"current_layer_idx: {current_layer_idx}")
+        utils.log_message("current_layer_idx: %s", current_layer_idx, level="debug")
         result = None
         if current_layer_idx != QtCore.QModelIndex():
             layer_model = self.layer_chooser_lv.model()
             layer_id = layer_model.data(
                 current_layer_idx, role=LayerChooserDataRole.LAYER_IDENTIFIER.value
             )
-            utils.log_message(f"layer_id: {layer_id}")
+            utils.log_message("layer_id: %s", layer_id, level="debug")
             layer_model = self.layer_chooser_lv.model()
             project = QgsProject.instance()
             try:
@@ -393,7 +618,11 @@ class DatasetQaWorkbenchDock(QtWidgets.QDockWidget, FORM_CLASS):
         return result
 
     def show_checklist_picker(self):
-        self.checklist_picker_dlg = ChecklistPicker(self.iface)
+        self.checklist_picker_dlg = ChecklistPicker(
+            self.iface,
+            checklist_catalog=self.checklist_catalog,
+            watcher=self.checklists_watcher,
+        )
         self.checklist_picker_dlg.button_box.accepted.connect(self.load_checklist)
         self.checklist_picker_dlg.setModal(True)
         self.checklist_picker_dlg.show()
@@ -403,19 +632,24 @@ class DatasetQaWorkbenchDock(QtWidgets.QDockWidget, FORM_CLASS):
         selected_indexes = self.checklist_picker_dlg.checklists_tv.selectedIndexes()
         if any(selected_indexes):
             self.selected_checklist = self.get_selected_checklist(selected_indexes[0])
-            log_message(f"the selected checklist is: {self.selected_checklist.name}")
+            log_message(
+                "the selected checklist is: %s",
+                self.selected_checklist.name,
+                level="debug",
+            )
             self.reset_loaded_checklist()
             self.load_checklist_elements(self.selected_checklist)
         else:
-            log_message("no checklist was selected")
+            log_message("no checklist was selected", level="debug")
 
     def get_selected_checklist(self, index: QtCore.QModelIndex) -> models.CheckList:
         model = index.model()
         identifier_item = model.item(index.row(), ChecklistModelColumn.IDENTIFIER.value)
-        result = identifier_item.data(
+        entry: ChecklistCatalogEntry = identifier_item.data(
             role=CustomDataRoles.CHECKLIST_DOWNLOADER_IDENTIFIER.value
         )
-        return result
+        self.selected_checklist_entry = entry
+        return entry.load_checklist()
 
     def load_checklist_elements(self, checklist: models.CheckList):
         self.checklist_name_le.setEnabled(True)
@@ -453,7 +687,7 @@ class DatasetQaWorkbenchDock(QtWidgets.QDockWidget, FORM_CLASS):
             selection_model: QtCore.QItemSelectionModel = (
                 self.layer_chooser_lv.selectionModel()
             )
-            log_message(f"selection_model: {selection_model}")
+            log_message("selection_model: %s", selection_model, level="debug")
             selection_model.currentChanged.connect(self.selected_layer_changed)
             selection_model.selectionChanged.connect(
                 self.selected_layer_selection_changed
@@ -489,7 +723,7 @@ class DatasetQaWorkbenchDock(QtWidgets.QDockWidget, FORM_CLASS):
             selection_model: QtCore.QItemSelectionModel = (
                 self.layer_chooser_lv.selectionModel()
             )
-            log_message(f"selection_model: {selection_model}")
+            log_message("selection_model: %s", selection_model, level="debug")
             selection_model.currentChanged.connect(self.selected_layer_changed)
             selection_model.selectionChanged.connect(
                 self.selected_layer_selection_changed
@@ -530,10 +764,7 @@ def get_list_view_layers(dataset_type: DatasetType) -> QtGui.QStandardItemModel:
             item = QtGui.QStandardItem(layer.name())
             item.setData(id_, LayerChooserDataRole.LAYER_IDENTIFIER.value)
             result.appendRow([item])
-            log_message(
-                f"retrieving layer id from the "
-                f"item: {item.data(LayerChooserDataRole.LAYER_IDENTIFIER.value)}"
-            )
+            log_message("adding layer %s to the layer chooser", id_, level="debug")
     return result
 
 
@@ -547,48 +778,20 @@ def get_legal_layers(dataset_type: models.DatasetType) -> typing.Dict[str, QgsMa
 
 
 def get_report_contents(
-    checklist_items: models.CheckListItemsModel, dataset: typing.Union[QgsMapLayer, str]
+    checklist_items: models.CheckListItemsModel,
+    dataset: typing.Union[QgsMapLayer, str],
+    dataset_open_time: typing.Optional[float] = None,
 ) -> typing.Dict:
     if isinstance(dataset, QgsMapLayer):
         name = dataset.name()
     else:
         name = dataset
-    result = {
-        "name": "Validation report",
-        "validator": utils.get_qgis_variable(
-            f"{QGIS_VARIABLE_PREFIX}_validator", "user_full_name"
-        ),
-        "generated": dt.datetime.now(dt.timezone.utc).isoformat(),
-        "dataset": name,
-        "dataset_is_valid": checklist_items.result,
-        "checklist": checklist_items.checklist.name,
-        "dataset_type": checklist_items.checklist.dataset_type.value,
-        "artifact_type": checklist_items.checklist.validation_artifact_type.value,
-        "description": checklist_items.checklist.description,
-        "checks": [],
-    }
-    for row in range(checklist_items.rowCount()):
-        name_idx = checklist_items.index(row, 0)
-        node = name_idx.internalPointer()
-        checklist_head: models.ChecklistItemHead = node.ref
-        description_prop: models.ChecklistItemProperty = (
-            checklist_head.check_properties[
-                ChecklistItemPropertyColumn.DESCRIPTION.value
-            ]
-        )
-        notes_prop: models.ChecklistItemProperty = checklist_head.check_properties[
-            ChecklistItemPropertyColumn.VALIDATION_NOTES.value
-        ]
-        check = {
-            "name": checklist_head.name,
-            "validated": True
-            if checklist_head.validated == QtCore.Qt.Checked
-            else False,
-            "description": checklist_head.description,
-            "notes": checklist_head.validation_notes,
-        }
-        result["checks"].append(check)
-    return result
+    return build_report_contents(
+        checklist_items.checklist,
+        name,
+        summary=checklist_items.summary(),
+        dataset_open_time=dataset_open_time,
+    )
 
 
 def serialize_report(report: typing.Dict) -> str:
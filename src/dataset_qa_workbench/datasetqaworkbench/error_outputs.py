@@ -0,0 +1,179 @@
+"""Destinations of the features flagged by automated checks
+
+Processing algorithms used by automated checks may have feature sink or
+layer destination outputs, usually with the features that did not pass the
+check. On large datasets these may hold millions of features, so they are
+written to files as the algorithm produces them, rather than being kept in
+memory. The ``dataset_qa_workbench_error_output`` QGIS variable selects
+where they go:
+
+- ``discard``: optional outputs are not written at all. Outputs that the
+  algorithm requires are written to temporary files
+- ``temporary`` (the default): each run writes to temporary files, which are
+  removed when QGIS exits
+- ``persistent``: feature sinks are written to a GeoPackage next to the
+  dataset, named after it with a ``_qa_errors.gpkg`` suffix, with one table
+  per check. Datasets that are not files use temporary files instead. Since
+  SQLite allows a single writer at a time, checks writing to the same
+  GeoPackage are run one after the other
+
+"""
+
+import contextlib
+import re
+import threading
+import typing
+from pathlib import Path
+
+from qgis.core import (
+    QgsMapLayer,
+    QgsProcessingOutputLayerDefinition,
+    QgsProcessingParameterDefinition,
+    QgsProcessingParameterFeatureSink,
+    QgsProcessingParameterRasterDestination,
+    QgsProcessingUtils,
+)
+
+from .constants import ErrorOutputMode
+
+ERROR_OUTPUT_SUFFIX = "_qa_errors.gpkg"
+
+_write_locks: typing.Dict[Path, threading.Lock] = {}
+_write_locks_lock = threading.Lock()
+
+
+def get_persistent_path(
+    dataset: typing.Union[str, Path, QgsMapLayer],
+) -> typing.Optional[Path]:
+    """Return the path of the GeoPackage with the error outputs of a dataset
+
+    This is None for datasets that are not files.
+
+    """
+
+    if isinstance(dataset, (str, Path)):
+        source = str(dataset)
+    else:
+        try:
+            source = dataset.source()
+        except AttributeError:
+            return None
+    path = Path(source.split("|")[0])
+    return path.parent / f"{path.stem}{ERROR_OUTPUT_SUFFIX}" if path.is_file() else None
+
+
+def get_write_lock(path: Path) -> threading.Lock:
+    """Return the lock that serializes writing to a GeoPackage of error outputs"""
+    with _write_locks_lock:
+        return _write_locks.setdefault(path.resolve(), threading.Lock())
+
+
+def get_table_name(check_name: str, output_name: str) -> str:
+    """Return the name of the table with an output of a check"""
+    slug = re.sub(r"[^0-9a-zA-Z]+", "_", f"{check_name} {output_name}")
+    return slug.strip("_").lower() or "errors"
+
+
+class ErrorOutputs:
+    """Destinations of the error outputs of an automated check
+
+    Once destinations have been created, ``locations`` maps the name of each
+    output that is being written to a data source string that QGIS can open.
+    Temporary destinations are new files each time they are created, so each
+    run of a check needs its own ``ErrorOutputs``.
+
+    """
+
+    mode: ErrorOutputMode
+    check_name: str
+    path: typing.Optional[Path]
+    locations: typing.Dict[str, str]
+
+    def __init__(
+        self,
+        mode: ErrorOutputMode = ErrorOutputMode.TEMPORARY,
+        check_name: str = "",
+        path: typing.Optional[Path] = None,
+    ):
+        if mode == ErrorOutputMode.PERSISTENT and path is None:
+            mode = ErrorOutputMode.TEMPORARY
+        self.mode = mode
+        self.check_name = check_name
+        self.path = path
+        self.locations = {}
+
+    @classmethod
+    def for_dataset(
+        cls,
+        mode: ErrorOutputMode,
+        dataset: typing.Union[str, Path, QgsMapLayer],
+        check_name: str = "",
+    ):
+        path = (
+            get_persistent_path(dataset) if mode == ErrorOutputMode.PERSISTENT else None
+        )
+        return cls(mode, check_name, path)
+
+    def get_destination(
+        self, param_def: QgsProcessingParameterDefinition
+    ) -> typing.Optional[QgsProcessingOutputLayerDefinition]:
+        """Return the value of an output parameter of the check's algorithm
+
+        Returns None for outputs that are to be skipped.
+
+        """
+
+        name = param_def.name()
+        is_optional = param_def.flags() & QgsProcessingParameterDefinition.FlagOptional
+        if self.mode == ErrorOutputMode.DISCARD and is_optional:
+            return None
+        if self.mode == ErrorOutputMode.PERSISTENT and isinstance(
+            param_def, QgsProcessingParameterFeatureSink
+        ):
+            table = get_table_name(self.check_name, name)
+            escaped_path = str(self.path).replace("'", "\\'")
+            destination = f"ogr:dbname='{escaped_path}' table=\"{table}\" (geom)"
+            location = f"{self.path}|layername={table}"
+        else:
+            # algorithms such as the GDAL ones can only write to plain files
+            if isinstance(param_def, QgsProcessingParameterRasterDestination):
+                extension = "tif"
+            else:
+                extension = "gpkg"
+            destination = QgsProcessingUtils.generateTempFilename(
+                f"{name.lower()}.{extension}"
+            )
+            location = destination
+        if self.mode != ErrorOutputMode.DISCARD:
+            self.locations[name] = location
+        result = QgsProcessingOutputLayerDefinition(destination)
+        result.createOptions = {"fileEncoding": "utf-8"}
+        return result
+
+    @property
+    def writes_to_path(self) -> bool:
+        """Whether any of the destinations is a table of the GeoPackage"""
+        prefix = f"{self.path}|"
+        return any(location.startswith(prefix) for location in self.locations.values())
+
+    def writing(self) -> typing.ContextManager:
+        """Return a context manager to hold while the check writes its outputs
+
+        Checks writing to the same persistent GeoPackage wait for each other.
+        Checks with no output going to the GeoPackage do not wait.
+
+        """
+
+        if self.mode == ErrorOutputMode.PERSISTENT and self.writes_to_path:
+            result = get_write_lock(self.path)
+        else:
+            result = contextlib.nullcontext()
+        return result
+
+    def get_written_locations(self, results: typing.Dict) -> typing.Dict[str, str]:
+        """Return the locations of the outputs that a run of the check wrote"""
+        return {
+            name: location
+            for name, location in self.locations.items()
+            if results.get(name) is not None
+        }
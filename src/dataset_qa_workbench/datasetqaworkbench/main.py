@@ -5,6 +5,7 @@ from PyQt5.QtCore import QSettings, QTranslator, QCoreApplication, Qt
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QAction
 
+from ..processing_provider.algorithms.base import close_expression_caches
 from ..processing_provider.provider import DatasetQaWorkbenchProvider
 
 # Initialize Qt resources from file resources.py
@@ -12,7 +13,11 @@ from .resources import *
 
 # Import the code for the dialog
 from .dataset_qa_workbench_dock import DatasetQaWorkbenchDock
-from .utils import log_message
+from .utils import (
+    close_message_log,
+    close_processing_algorithms,
+    log_message,
+)
 
 
 class DatasetQaWorkbench:
@@ -147,7 +152,7 @@ class DatasetQaWorkbench:
     def initGui(self):
         """Create the menu entries and toolbar icons inside the QGIS GUI."""
 
-        log_message("inside initGui...")
+        log_message("inside initGui...", level="debug")
         self.initProcessing()
         icon_path = ":/plugins/dataset_qa_workbench/clipboard-check-solid.svg"
         self.add_action(
@@ -169,6 +174,9 @@ class DatasetQaWorkbench:
         """Removes the plugin menu item and icon from QGIS GUI."""
         processing_registry = QgsApplication.processingRegistry()
         processing_registry.removeProvider(self.processing_provider)
+        close_processing_algorithms()
+        close_expression_caches()
+        close_message_log()
         for action in self.actions:
             self.iface.removePluginMenu(self.tr("&Dataset QA Workbench"), action)
             self.iface.removeToolBarIcon(action)
@@ -176,7 +184,7 @@ class DatasetQaWorkbench:
     def run(self, checked: bool):
         """Run method that performs all the real work"""
 
-        log_message(f"inside run method - checked: {checked}")
+        log_message("inside run method - checked: %s", checked, level="debug")
         if checked:
             self.plugin_is_active = True
             if self.dock_widget is None:
@@ -1,6 +1,9 @@
+import contextlib
 import json
 import typing
 import uuid
+from collections import OrderedDict
+from pathlib import Path
 
 from PyQt5 import QtCore
 from PyQt5 import QtGui
@@ -9,13 +12,22 @@ from PyQt5.QtCore import Qt
 
 from . import utils
 from .constants import (
+    AutomationButton,
+    AutomationStatus,
+    CheckStatus,
     ChecklistItemPropertyColumn,
     DatasetType,
     ValidationArtifactType,
 )
 
+_DESCRIPTION_INDEX = ChecklistItemPropertyColumn.DESCRIPTION.value
+_GUIDE_INDEX = ChecklistItemPropertyColumn.GUIDE.value
+_AUTOMATION_INDEX = ChecklistItemPropertyColumn.AUTOMATION.value
+_VALIDATION_NOTES_INDEX = ChecklistItemPropertyColumn.VALIDATION_NOTES.value
+
 
 class ChecklistItemProperty:
+    __slots__ = ("name", "value")
     name: str
     value: typing.Any
 
@@ -25,11 +37,20 @@ class ChecklistItemProperty:
 
 
 class ChecklistAutomationProperty(ChecklistItemProperty):
+    __slots__ = (
+        "algorithm_id",
+        "artifact_parameter_name",
+        "extra_parameters",
+        "output_name",
+        "negate_output",
+        "depends_on",
+    )
     algorithm_id: str
     artifact_parameter_name: str
     extra_parameters: typing.Dict[str, str]
     output_name: str
     negate_output: bool
+    depends_on: typing.List[str]
 
     def __init__(
         self,
@@ -45,6 +66,7 @@ class ChecklistAutomationProperty(ChecklistItemProperty):
         self.output_name = automation_info.get("output_name", "OUTPUT")
         self.negate_output = automation_info.get("negate_output", False)
         self.extra_parameters = automation_info.get("extra_parameters", {})
+        self.depends_on = list(automation_info.get("depends_on", []))
 
     def to_dict(self):
         if self.algorithm_id is not None:
@@ -55,50 +77,235 @@ class ChecklistAutomationProperty(ChecklistItemProperty):
                 "negate_output": self.negate_output,
                 "extra_parameters": self.extra_parameters,
             }
+            if self.depends_on:
+                result["depends_on"] = self.depends_on
         else:
             result = None
         return result
 
 
+_PROPERTY_NAMES = tuple(
+    (
+        member.name.replace("_", " ").capitalize()
+        if member == ChecklistItemPropertyColumn.VALIDATION_NOTES
+        else member.name.lower()
+    )
+    for member in sorted(ChecklistItemPropertyColumn, key=lambda m: m.value)
+)
+
+
+class CheckTimings:
+    """What running the automation of a check cost
+
+    Times are in seconds. Memory is not measured, as the memory used by a
+    check cannot be told apart from that of the rest of QGIS, including other
+    checks running at the same time.
+
+    """
+
+    __slots__ = ("wall_time", "cpu_time")
+    wall_time: float
+    cpu_time: float
+
+    def __init__(self, wall_time: float = 0.0, cpu_time: float = 0.0):
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+
+    def to_dict(self) -> typing.Dict:
+        return {
+            "wall_time": round(self.wall_time, 3),
+            "cpu_time": round(self.cpu_time, 3),
+        }
+
+
+MAX_AUTOMATION_OUTPUTS = 10
+MAX_AUTOMATION_ERRORS = 5
+MAX_AUTOMATION_VALUE_LENGTH = 200
+
+_AUTOMATION_SCALAR_TYPES = (bool, int, float, str, type(None))
+
+
+class AutomationResult:
+    """The outcome of the last automated run of a check
+
+    Only plain values among the outputs of the processing algorithm are kept,
+    and their number and length are capped, so that results are cheap to keep
+    around and to write to validation reports. Layers and other objects
+    returned by the algorithm are left out, ``error_outputs`` has the
+    locations of those that were written to files.
+
+    """
+
+    __slots__ = (
+        "status",
+        "output_name",
+        "output_value",
+        "outputs",
+        "errors",
+        "duration",
+        "error_outputs",
+    )
+    status: AutomationStatus
+    output_name: str
+    output_value: typing.Union[bool, int, float, str, None]
+    outputs: typing.Dict[str, typing.Union[bool, int, float, str, None]]
+    errors: typing.List[str]
+    duration: typing.Optional[float]
+    error_outputs: typing.Dict[str, str]
+
+    def __init__(
+        self,
+        status: AutomationStatus,
+        output_name: str,
+        output_value: typing.Any = None,
+        outputs: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        errors: typing.Optional[typing.Iterable[str]] = None,
+        duration: typing.Optional[float] = None,
+        error_outputs: typing.Optional[typing.Dict[str, str]] = None,
+    ):
+        self.status = status
+        self.output_name = output_name
+        self.output_value = _cap_automation_value(output_value)
+        self.outputs = {}
+        for name, value in (outputs or {}).items():
+            if len(self.outputs) == MAX_AUTOMATION_OUTPUTS:
+                break
+            if name != output_name and isinstance(value, _AUTOMATION_SCALAR_TYPES):
+                self.outputs[name] = _cap_automation_value(value)
+        self.errors = [
+            _cap_automation_value(str(error))
+            for error in list(errors or [])[:MAX_AUTOMATION_ERRORS]
+        ]
+        self.duration = duration
+        self.error_outputs = dict(error_outputs) if error_outputs else {}
+
+    @classmethod
+    def from_outputs(
+        cls,
+        passed: bool,
+        outputs: typing.Dict[str, typing.Any],
+        output_name: str,
+        duration: typing.Optional[float] = None,
+        error_outputs: typing.Optional[typing.Dict[str, str]] = None,
+    ):
+        return cls(
+            AutomationStatus.PASSED if passed else AutomationStatus.FAILED,
+            output_name,
+            output_value=outputs.get(output_name),
+            outputs=outputs,
+            duration=duration,
+            error_outputs=error_outputs,
+        )
+
+    @classmethod
+    def from_error(
+        cls,
+        output_name: str,
+        error: str,
+        duration: typing.Optional[float] = None,
+    ):
+        return cls(
+            AutomationStatus.ERROR, output_name, errors=[error], duration=duration
+        )
+
+    @property
+    def notes(self) -> str:
+        """A short, human readable, description of the result"""
+        if self.status == AutomationStatus.PASSED:
+            result = "Automated validation succeeded"
+        elif self.status == AutomationStatus.FAILED:
+            result = "Automated validation failed"
+        else:
+            result = "Automated validation could not run"
+            if self.errors:
+                result = f"{result}: {self.errors[0]}"
+        return result
+
+    def to_dict(self) -> typing.Dict:
+        result = {
+            "status": self.status.value,
+            "output": {self.output_name: self.output_value},
+        }
+        if self.outputs:
+            result["other_outputs"] = self.outputs
+        if self.errors:
+            result["errors"] = self.errors
+        if self.duration is not None:
+            result["duration"] = round(self.duration, 3)
+        if self.error_outputs:
+            result["error_outputs"] = self.error_outputs
+        return result
+
+
+def _cap_automation_value(value: typing.Any) -> typing.Any:
+    if not isinstance(value, _AUTOMATION_SCALAR_TYPES):
+        result = None
+    elif isinstance(value, str) and len(value) > MAX_AUTOMATION_VALUE_LENGTH:
+        result = f"{value[:MAX_AUTOMATION_VALUE_LENGTH - 3]}..."
+    else:
+        result = value
+    return result
+
+
 class ChecklistItemHead:
+    __slots__ = (
+        "name",
+        "validated",
+        "evaluated",
+        "check_properties",
+        "timings",
+        "automation_result",
+    )
     name: str
     validated: Qt.CheckState
+    evaluated: bool
     check_properties: typing.List
+    timings: typing.Optional[CheckTimings]
+    automation_result: typing.Optional[AutomationResult]
 
     def __init__(self, name: str, check_properties: typing.List[ChecklistItemProperty]):
         self.name = name
         self.validated = Qt.Unchecked
+        self.evaluated = False
         self.check_properties = check_properties
+        self.timings = None
+        self.automation_result = None
 
-    def __getattr__(self, item):
-        # This method is here to make it easier to access an instance's properties.
-        # It enables calling ``check.description`` in order to get an instance's
-        # description, rather than having to call
-        # ``check.check_properties[ChecklistItemPropertyColumn.DESCRIPTION.value].value``
-        if item == ChecklistItemPropertyColumn.DESCRIPTION.name.lower():
-            prop: ChecklistItemProperty = self.check_properties[
-                ChecklistItemPropertyColumn.DESCRIPTION.value
-            ]
-            result = prop.value
-        elif item == ChecklistItemPropertyColumn.GUIDE.name.lower():
-            prop: ChecklistItemProperty = self.check_properties[
-                ChecklistItemPropertyColumn.GUIDE.value
-            ]
-            result = prop.value
-        elif item == ChecklistItemPropertyColumn.AUTOMATION.name.lower():
-            prop: ChecklistAutomationProperty = self.check_properties[
-                ChecklistItemPropertyColumn.AUTOMATION.value
-            ]
-            result = prop
-        elif item == ChecklistItemPropertyColumn.VALIDATION_NOTES.name.lower():
-            prop: ChecklistItemProperty = self.check_properties[
-                ChecklistItemPropertyColumn.VALIDATION_NOTES.value
-            ]
-            result = prop.value
+    @property
+    def status(self) -> CheckStatus:
+        if self.validated == Qt.Checked:
+            result = CheckStatus.PASSED
+        elif self.evaluated:
+            result = CheckStatus.FAILED
         else:
-            raise AttributeError
+            result = CheckStatus.PENDING
         return result
 
+    # These properties make it easier to access an instance's properties.
+    # They enable calling ``check.description`` in order to get an instance's
+    # description, rather than having to call
+    # ``check.check_properties[ChecklistItemPropertyColumn.DESCRIPTION.value].value``
+
+    @property
+    def description(self) -> str:
+        return self.check_properties[_DESCRIPTION_INDEX].value
+
+    @property
+    def guide(self) -> str:
+        return self.check_properties[_GUIDE_INDEX].value
+
+    @property
+    def automation(self) -> ChecklistAutomationProperty:
+        return self.check_properties[_AUTOMATION_INDEX]
+
+    @property
+    def validation_notes(self) -> str:
+        return self.check_properties[_VALIDATION_NOTES_INDEX].value
+
+    @validation_notes.setter
+    def validation_notes(self, notes: str):
+        self.check_properties[_VALIDATION_NOTES_INDEX].value = notes
+
     def to_dict(
         self,
         include_notes: bool = True,
@@ -130,25 +337,17 @@ class ChecklistItemHead:
 
     @classmethod
     def from_dict(cls, raw: typing.Dict):
-        check_properties = []
-        for item in sorted(
-            ChecklistItemPropertyColumn.__members__.values(), key=lambda m: m.value
-        ):
-            name = item.name.lower()
-            if item == ChecklistItemPropertyColumn.AUTOMATION:
+        # property names are shared between all instances, rather than being
+        # recomputed for each one
+        check_properties = [None] * len(_PROPERTY_NAMES)
+        for index, name in enumerate(_PROPERTY_NAMES):
+            if index == _AUTOMATION_INDEX:
                 prop = ChecklistAutomationProperty(name, raw.get(name))
-            elif item == ChecklistItemPropertyColumn.VALIDATION_NOTES:
-                prop = ChecklistItemProperty(cls._decode_notes_column_name(), "")
+            elif index == _VALIDATION_NOTES_INDEX:
+                prop = ChecklistItemProperty(name, "")
             else:
                 prop = ChecklistItemProperty(name, raw.get(name))
-            check_properties.append(prop)
-        # check_properties = [
-        #     ChecklistItemProperty(ChecklistItemPropertyColumn.DESCRIPTION.name.lower(), raw.get('description')),
-        #     ChecklistItemProperty(ChecklistItemPropertyColumn.GUIDE.name.lower(), raw.get('guide')),
-        #     # ChecklistItemProperty(ChecklistItemPropertyColumn.AUTOMATION.name.lower(), raw.get('automation')),
-        #     ChecklistAutomationProperty(ChecklistItemPropertyColumn.AUTOMATION.name.lower(), raw.get('automation')),
-        #     ChecklistItemProperty(cls._decode_notes_column_name(), ''),
-        # ]
+            check_properties[index] = prop
         return cls(raw["name"], check_properties)
 
 
@@ -172,13 +371,23 @@ class ChecklistReport:
 
 
 class CheckList:
+    """A checklist, with its header fields and its checks
+
+    A checklist may be created in lazy mode by passing a ``checks_loader``. This
+    is a callable that returns the raw (i.e. not yet parsed) checks. In lazy
+    mode, only the header fields are kept around and the checks get
+    materialized the first time the ``checks`` attribute is accessed.
+
+    """
+
     identifier: uuid.UUID
     name: str
     description: str
     dataset_type: DatasetType
     validation_artifact_type: ValidationArtifactType
-    checks: typing.List[ChecklistItemHead]
     report: typing.Optional[ChecklistReport]
+    _checks: typing.Optional[typing.List[ChecklistItemHead]]
+    _checks_loader: typing.Optional[typing.Callable[[], typing.List[typing.Dict]]]
 
     def __init__(
         self,
@@ -187,14 +396,44 @@ class CheckList:
         dataset_type: DatasetType,
         validation_artifact_type: ValidationArtifactType,
         report: typing.Optional[ChecklistReport] = None,
+        checks_loader: typing.Optional[
+            typing.Callable[[], typing.List[typing.Dict]]
+        ] = None,
     ):
         self.identifier = uuid.uuid4()
         self.name = name
         self.description = description
         self.dataset_type = dataset_type
         self.validation_artifact_type = validation_artifact_type
-        self.checks = []
         self.report = report
+        self._checks_loader = checks_loader
+        self._checks = [] if checks_loader is None else None
+
+    @property
+    def checks(self) -> typing.List[ChecklistItemHead]:
+        if self._checks is None:
+            self._checks = [
+                ChecklistItemHead.from_dict(raw_check)
+                for raw_check in self._checks_loader()
+            ]
+            self._checks_loader = None
+        return self._checks
+
+    @checks.setter
+    def checks(self, checks: typing.List[ChecklistItemHead]):
+        self._checks = checks
+        self._checks_loader = None
+
+    @property
+    def checks_loaded(self) -> bool:
+        return self._checks is not None
+
+    def set_checks_loader(
+        self, checks_loader: typing.Callable[[], typing.List[typing.Dict]]
+    ):
+        """Discard any checks and lazily reload them with the input loader"""
+        self._checks = None
+        self._checks_loader = checks_loader
 
     def to_dict(
         self,
@@ -225,9 +464,10 @@ class CheckList:
         return result
 
     @classmethod
-    def from_dict(cls, raw: typing.Dict):
+    def from_dict(cls, raw: typing.Dict, lazy: bool = False):
         raw_report = raw.get("report")
         report = ChecklistReport.from_dict(raw_report) if raw_report else None
+        raw_checks = raw.get("checks", [])
         try:
             instance = cls(
                 name=raw["name"],
@@ -237,17 +477,23 @@ class CheckList:
                     raw["validation_artifact_type"]
                 ),
                 report=report,
+                checks_loader=(lambda: raw_checks) if lazy else None,
             )
         except KeyError:
             raise
-        for raw_check in raw.get("checks", []):
-            try:
-                checklist_head = ChecklistItemHead.from_dict(raw_check)
-            except KeyError:
-                raise
-            instance.checks.append(checklist_head)
+        if not lazy:
+            for raw_check in raw_checks:
+                try:
+                    checklist_head = ChecklistItemHead.from_dict(raw_check)
+                except KeyError:
+                    raise
+                instance.checks.append(checklist_head)
         return instance
 
+    @classmethod
+    def from_file(cls, path: Path, lazy: bool = False):
+        return cls.from_dict(load_raw_checklist(path), lazy=lazy)
+
 
 class ChecklistItemPropertyNode(utils.TreeNode):
     ref: ChecklistItemProperty
@@ -256,8 +502,8 @@ class ChecklistItemPropertyNode(utils.TreeNode):
         self.ref = ref
         super().__init__(parent, row)
 
-    def _get_children(self):
-        return []
+    def _get_child_count(self) -> int:
+        return 0
 
 
 class ChecklistItemHeadNode(utils.TreeNode):
@@ -267,32 +513,250 @@ class ChecklistItemHeadNode(utils.TreeNode):
         self.ref = ref
         super().__init__(parent, row)
 
-    def _get_children(self):
-        result = []
-        for index, check_property in enumerate(self.ref.check_properties):
-            check_property_node = ChecklistItemPropertyNode(check_property, self, index)
-            result.append(check_property_node)
-        return result
+    def _get_child_count(self) -> int:
+        return len(self.ref.check_properties)
+
+    def _create_child(self, row: int) -> ChecklistItemPropertyNode:
+        return ChecklistItemPropertyNode(self.ref.check_properties[row], self, row)
+
+
+class ChecklistSummary:
+    __slots__ = ("total", "passed", "failed", "automated")
+    total: int
+    passed: int
+    failed: int
+    automated: int
+
+    def __init__(self, total: int, passed: int, failed: int, automated: int):
+        self.total = total
+        self.passed = passed
+        self.failed = failed
+        self.automated = automated
+
+    def __eq__(self, other):
+        return isinstance(other, ChecklistSummary) and self.to_dict() == other.to_dict()
+
+    @classmethod
+    def from_checks(cls, checks: typing.Sequence[ChecklistItemHead]):
+        statuses = [check.status for check in checks]
+        return cls(
+            total=len(checks),
+            passed=statuses.count(CheckStatus.PASSED),
+            failed=statuses.count(CheckStatus.FAILED),
+            automated=sum(1 for c in checks if c.automation.algorithm_id is not None),
+        )
+
+    @property
+    def pending(self) -> int:
+        return self.total - self.passed - self.failed
+
+    @property
+    def manual(self) -> int:
+        return self.total - self.automated
+
+    @property
+    def is_valid(self) -> bool:
+        return self.passed == self.total
+
+    def to_dict(self) -> typing.Dict[str, int]:
+        return {
+            "total": self.total,
+            "passed": self.passed,
+            "failed": self.failed,
+            "pending": self.pending,
+            "automated": self.automated,
+            "manual": self.manual,
+        }
 
 
 class CheckListItemsModel(utils.TreeModel):
+    """Model for the checks of a checklist
+
+    Changing the result of many checks at once should be done inside a
+    ``bulk_update()`` block, which defers notifying views until the block
+    exits and then emits one ``dataChanged`` signal per contiguous range of
+    changed rows, instead of one per cell.
+
+    The number of passed and failed checks is kept up to date as results
+    change, so ``summary()`` and ``result`` do not need to go through all
+    checks. ``summaryChanged`` is emitted whenever these numbers change.
+
+    Checks may be shown in a different order than the checklist's, see
+    ``sort_by_cost()``. Methods of the model take the position of checks in
+    the checklist, use ``check_row()`` in order to get it from a view's row.
+
+    """
+
     checklist: CheckList
-    root_nodes: typing.List[ChecklistItemHead]
+    _bulk_depth: int
+    _changed_validated_rows: typing.Set[int]
+    _changed_notes_rows: typing.Set[int]
+    _status_counts: typing.Dict[CheckStatus, int]
+    _automated_count: int
+    _summary_changed: bool
+    _order: typing.Optional[typing.List[int]]
+    _view_rows: typing.Optional[typing.List[int]]
+
+    summaryChanged = QtCore.pyqtSignal(ChecklistSummary)
 
     def __init__(self, checklist: CheckList):
         self.checklist = checklist
+        self._bulk_depth = 0
+        self._changed_validated_rows = set()
+        self._changed_notes_rows = set()
+        self._status_counts = {status: 0 for status in CheckStatus}
+        self._automated_count = 0
+        for check_head in checklist.checks:
+            self._status_counts[check_head.status] += 1
+            if check_head.automation.algorithm_id is not None:
+                self._automated_count += 1
+        self._summary_changed = False
+        self._order = None
+        self._view_rows = None
         super().__init__()
 
+    def check_row(self, view_row: int) -> int:
+        """Return the position in the checklist of the check shown at a row"""
+        return view_row if self._order is None else self._order[view_row]
+
+    def view_row(self, check_row: int) -> int:
+        """Return the row where a check of the checklist is shown"""
+        return check_row if self._view_rows is None else self._view_rows[check_row]
+
+    def sort_by_cost(self, enabled: bool = True):
+        """Show the most costly checks first, or go back to the checklist's order
+
+        Checks are sorted by the wall time of their last automation run.
+        Checks that have not been timed are shown last, in their original
+        order.
+
+        """
+
+        if enabled:
+            checks = self.checklist.checks
+            self._order = sorted(
+                range(len(checks)),
+                key=lambda row: _get_check_cost(checks[row]),
+                reverse=True,
+            )
+            self._view_rows = [0] * len(checks)
+            for view_row, check_row in enumerate(self._order):
+                self._view_rows[check_row] = view_row
+        else:
+            self._order = None
+            self._view_rows = None
+        self.reset()
+
+    def summary(self) -> ChecklistSummary:
+        return ChecklistSummary(
+            total=len(self.checklist.checks),
+            passed=self._status_counts[CheckStatus.PASSED],
+            failed=self._status_counts[CheckStatus.FAILED],
+            automated=self._automated_count,
+        )
+
+    @contextlib.contextmanager
+    def bulk_update(self):
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0:
+                self._emit_pending_changes()
+
+    def set_check_result(
+        self,
+        row: int,
+        validated: typing.Optional[Qt.CheckState] = None,
+        notes: typing.Optional[str] = None,
+        evaluated: typing.Optional[bool] = None,
+        automation_result: typing.Optional[AutomationResult] = None,
+    ):
+        """Change the result of a check
+
+        A check is considered to have been evaluated when it passes. Pass
+        ``evaluated=True`` in order to record that a check has failed, rather
+        than it just not having been checked yet.
+
+        ``automation_result`` is the outcome of the automated run that produced
+        the result, if any. Changing the result without one discards the
+        check's previous automation result.
+
+        """
+
+        check_head: ChecklistItemHead = self.checklist.checks[row]
+        with self.bulk_update():
+            if validated is not None:
+                previous_status = check_head.status
+                check_head.validated = validated
+                if evaluated is None:
+                    evaluated = validated == Qt.Checked
+                check_head.evaluated = evaluated
+                current_status = check_head.status
+                if current_status != previous_status:
+                    self._status_counts[previous_status] -= 1
+                    self._status_counts[current_status] += 1
+                    self._summary_changed = True
+                self._changed_validated_rows.add(row)
+            if validated is not None or automation_result is not None:
+                check_head.automation_result = automation_result
+            if notes is not None:
+                check_head.validation_notes = notes
+                self._changed_notes_rows.add(row)
+
+    def set_many(
+        self,
+        changes: typing.Iterable[
+            typing.Tuple[int, typing.Optional[Qt.CheckState], typing.Optional[str]]
+        ],
+        evaluated: typing.Optional[bool] = None,
+    ):
+        with self.bulk_update():
+            for row, validated, notes in changes:
+                self.set_check_result(
+                    row, validated=validated, notes=notes, evaluated=evaluated
+                )
+
+    def _emit_pending_changes(self):
+        # rows that have not been fetched yet are unknown to views
+        fetched = self.fetched_root_count()
+        validated_rows = [
+            row
+            for row in map(self.view_row, self._changed_validated_rows)
+            if row < fetched
+        ]
+        for first, last in contiguous_ranges(validated_rows):
+            self.dataChanged.emit(
+                self.index(first, 1),
+                self.index(last, 1),
+                [Qt.CheckStateRole, Qt.BackgroundRole],
+            )
+        for row in sorted(map(self.view_row, self._changed_notes_rows)):
+            # notes cells that were never materialized have not been shown yet
+            if row < fetched and self.is_root_node_materialized(row):
+                head_node: ChecklistItemHeadNode = self.root_node(row)
+                if head_node.is_materialized(_VALIDATION_NOTES_INDEX):
+                    notes_index = self.index(
+                        _VALIDATION_NOTES_INDEX, 1, self.index(row, 0)
+                    )
+                    self.dataChanged.emit(notes_index, notes_index, [Qt.EditRole])
+        self._changed_validated_rows.clear()
+        self._changed_notes_rows.clear()
+        if self._summary_changed:
+            self._summary_changed = False
+            self.summaryChanged.emit(self.summary())
+
     @property
-    def result(self):
-        return all(c.validated for c in self.checklist.checks)
+    def result(self) -> bool:
+        return self._status_counts[CheckStatus.PASSED] == len(self.checklist.checks)
 
-    def _get_root_nodes(self):
-        result = []
-        for index, check_head in enumerate(self.checklist.checks):
-            check_head_node = ChecklistItemHeadNode(check_head, None, index)
-            result.append(check_head_node)
-        return result
+    def _get_root_count(self) -> int:
+        return len(self.checklist.checks)
+
+    def _create_root_node(self, row: int) -> ChecklistItemHeadNode:
+        check_head = self.checklist.checks[self.check_row(row)]
+        return ChecklistItemHeadNode(check_head, None, row)
 
     def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
         return 2
@@ -313,6 +777,15 @@ class CheckListItemsModel(utils.TreeModel):
                         raise RuntimeError(f"Invalid column: {index.column()}")
                 elif role == Qt.CheckStateRole and index.column() == 1:
                     result = check_head.validated
+                elif (
+                    role == Qt.ToolTipRole
+                    and index.column() == 0
+                    and check_head.timings is not None
+                ):
+                    result = (
+                        f"Last automated run took {check_head.timings.wall_time:.2f} s "
+                        f"({check_head.timings.cpu_time:.2f} s of CPU time)"
+                    )
                 elif (
                     role == Qt.BackgroundRole
                     and index.column() == 1
@@ -372,27 +845,163 @@ class CheckListItemsModel(utils.TreeModel):
         if index.isValid():
             node = index.internalPointer()
             if index.parent() == QtCore.QModelIndex():
-                checklist_head: ChecklistItemHead = node.ref
                 if index.column() == 1 and role == Qt.CheckStateRole:
-                    checklist_head.validated = value
-                    self.dataChanged.emit(index, index, [role])
+                    self.set_check_result(self.check_row(node.row), validated=value)
                     result = True
             else:
-                checklist_property: ChecklistItemProperty = node.ref
                 if index.row() == ChecklistItemPropertyColumn.VALIDATION_NOTES.value:
-                    checklist_property.value = value
-                    self.dataChanged.emit(index, index, [role])
+                    self.set_check_result(self.check_row(node.parent.row), notes=value)
                     result = True
         return result
 
 
+def _get_text_width(metrics: QtGui.QFontMetrics, text: str) -> int:
+    # horizontalAdvance() is only available since Qt 5.11, QGIS 3.10 may run
+    # with older versions
+    try:
+        result = metrics.horizontalAdvance(text)
+    except AttributeError:
+        result = metrics.width(text)
+    return result
+
+
 class ChecklistItemsModelDelegate(QtWidgets.QStyledItemDelegate):
+    """Delegate for rendering checklist items
+
+    Computing the height of word-wrapped text is expensive and views ask for it
+    on every layout pass, so heights are kept in a bounded LRU cache, keyed by
+    the text, the column width and the font that were used to measure it.
+
+    The buttons of automated checks are painted and hit-tested by the delegate
+    rather than being real widgets. Clicking them emits either
+    ``run_automation_requested`` or ``configure_automation_requested`` with the
+    index of the check.
+
+    """
+
     gui_view: QtWidgets.QTreeView
+    height_cache_size: int = 4096
+    button_spacing: int = 6
+    _height_cache: "OrderedDict[typing.Tuple[int, int, str], int]"
+    _pressed_button: typing.Optional[
+        typing.Tuple[QtCore.QPersistentModelIndex, AutomationButton]
+    ]
+
+    run_automation_requested = QtCore.pyqtSignal(QtCore.QModelIndex)
+    configure_automation_requested = QtCore.pyqtSignal(QtCore.QModelIndex)
 
     def __init__(self, gui_view: QtWidgets.QTreeView, *args, **kwargs):
         self.gui_view = gui_view
+        self._height_cache = OrderedDict()
+        self._pressed_button = None
         super().__init__(*args, **kwargs)
 
+    @staticmethod
+    def is_automation_cell(index: QtCore.QModelIndex) -> bool:
+        result = False
+        parent = index.parent()
+        if parent.isValid() and index.column() == 1:
+            if index.row() == _AUTOMATION_INDEX:
+                check_head: ChecklistItemHead = parent.internalPointer().ref
+                result = check_head.automation.algorithm_id is not None
+        return result
+
+    def _button_option(
+        self, option: QtWidgets.QStyleOptionViewItem, button: AutomationButton
+    ) -> QtWidgets.QStyleOptionButton:
+        button_option = QtWidgets.QStyleOptionButton()
+        button_option.initFrom(self.gui_view)
+        button_option.text = button.value
+        button_option.fontMetrics = option.fontMetrics
+        text_size = QtCore.QSize(
+            _get_text_width(option.fontMetrics, button.value),
+            option.fontMetrics.height(),
+        )
+        button_option.rect = QtCore.QRect(
+            QtCore.QPoint(0, 0),
+            self.gui_view.style().sizeFromContents(
+                QtWidgets.QStyle.CT_PushButton, button_option, text_size, self.gui_view
+            ),
+        )
+        return button_option
+
+    def _button_options(
+        self, option: QtWidgets.QStyleOptionViewItem
+    ) -> typing.List[typing.Tuple[AutomationButton, QtWidgets.QStyleOptionButton]]:
+        result = []
+        left = option.rect.left()
+        for button in AutomationButton:
+            button_option = self._button_option(option, button)
+            button_option.rect.moveTo(left, option.rect.top())
+            left = button_option.rect.right() + 1 + self.button_spacing
+            result.append((button, button_option))
+        return result
+
+    def _button_at(
+        self, option: QtWidgets.QStyleOptionViewItem, position: QtCore.QPoint
+    ) -> typing.Optional[AutomationButton]:
+        for button, button_option in self._button_options(option):
+            if button_option.rect.contains(position):
+                result = button
+                break
+        else:
+            result = None
+        return result
+
+    def paint(
+        self,
+        painter: QtGui.QPainter,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ):
+        if self.is_automation_cell(index):
+            style = self.gui_view.style()
+            style.drawPrimitive(
+                QtWidgets.QStyle.PE_PanelItemViewItem, option, painter, self.gui_view
+            )
+            for button, button_option in self._button_options(option):
+                if self._pressed_button == (index, button):
+                    button_option.state |= QtWidgets.QStyle.State_Sunken
+                else:
+                    button_option.state |= QtWidgets.QStyle.State_Raised
+                style.drawControl(
+                    QtWidgets.QStyle.CE_PushButton,
+                    button_option,
+                    painter,
+                    self.gui_view,
+                )
+        else:
+            super().paint(painter, option, index)
+
+    def editorEvent(
+        self,
+        event: QtCore.QEvent,
+        model: QtCore.QAbstractItemModel,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ) -> bool:
+        mouse_events = (
+            QtCore.QEvent.MouseButtonPress,
+            QtCore.QEvent.MouseButtonRelease,
+        )
+        if event.type() in mouse_events and self.is_automation_cell(index):
+            button = self._button_at(option, event.pos())
+            previously_pressed = self._pressed_button
+            if event.type() == QtCore.QEvent.MouseButtonPress and button is not None:
+                self._pressed_button = (QtCore.QPersistentModelIndex(index), button)
+            else:
+                self._pressed_button = None
+                if button is not None and previously_pressed == (index, button):
+                    if button == AutomationButton.RUN:
+                        self.run_automation_requested.emit(index.parent())
+                    else:
+                        self.configure_automation_requested.emit(index.parent())
+            self.gui_view.viewport().update(option.rect)
+            result = button is not None
+        else:
+            result = super().editorEvent(event, model, option, index)
+        return result
+
     def sizeHint(
         self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex
     ) -> QtCore.QSize:
@@ -407,21 +1016,39 @@ class ChecklistItemsModelDelegate(QtWidgets.QStyledItemDelegate):
             check_property: ChecklistItemProperty = index.internalPointer().ref
             text_to_draw = check_property.value
             base_width = self.gui_view.columnWidth(1)
-            base_height = 10000  # some ridiculous high value just for initialization
-            base_size = QtCore.QSize(base_width, base_height)
-
-            metrics = QtGui.QFontMetrics(option.font)
-            out_rect: QtCore.QRect = metrics.boundingRect(
-                QtCore.QRect(QtCore.QPoint(0, 0), base_size),
-                Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap,
-                text_to_draw,
+            cache_key = (hash(text_to_draw), base_width, option.font.key())
+            height = self._height_cache.get(cache_key)
+            if height is None:
+                # some ridiculous high value just for initialization
+                base_height = 10000
+                metrics = QtGui.QFontMetrics(option.font)
+                out_rect: QtCore.QRect = metrics.boundingRect(
+                    QtCore.QRect(
+                        QtCore.QPoint(0, 0), QtCore.QSize(base_width, base_height)
+                    ),
+                    Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap,
+                    text_to_draw,
+                )
+                height = out_rect.height()
+                self._height_cache[cache_key] = height
+                if len(self._height_cache) > self.height_cache_size:
+                    self._height_cache.popitem(last=False)
+            else:
+                self._height_cache.move_to_end(cache_key)
+            result = QtCore.QSize(base_width, height)
+        elif self.is_automation_cell(index):
+            button_rects = [o.rect for _, o in self._button_options(option)]
+            result = QtCore.QSize(
+                button_rects[-1].right() - button_rects[0].left() + 1,
+                max(r.height() for r in button_rects),
             )
-            base_size.setHeight(out_rect.height())
-            result = base_size
         else:
             result = super().sizeHint(option, index)
         return result
 
+    def clear_size_hint_cache(self):
+        self._height_cache.clear()
+
 
 class MyTreeView(QtWidgets.QTreeView):
 
@@ -432,21 +1059,90 @@ class MyTreeView(QtWidgets.QTreeView):
         self.resized.emit()
 
 
-def load_checklists() -> typing.List[CheckList]:
-    directory = utils.get_checklists_dir()
+def get_automation_dependencies(
+    checks: typing.Sequence[ChecklistItemHead],
+) -> typing.Dict[int, typing.Set[int]]:
+    """Return the rows of the checks that each automated check depends on
+
+    Checks refer to their dependencies by name, in the ``depends_on`` property
+    of their automation. Raises ``ValueError`` if a dependency does not exist
+    or if there is a dependency cycle.
+
+    """
+
+    rows_by_name = {}
+    for row, check in enumerate(checks):
+        rows_by_name.setdefault(check.name, row)
+    result = {}
+    for row, check in enumerate(checks):
+        if check.automation.algorithm_id is None:
+            continue
+        dependencies = set()
+        for name in check.automation.depends_on:
+            try:
+                dependencies.add(rows_by_name[name])
+            except KeyError:
+                raise ValueError(
+                    f"Check {check.name!r} depends on unknown check {name!r}"
+                )
+        result[row] = dependencies
+    try:
+        get_automation_order(result)
+    except ValueError as exc:
+        names = ", ".join(repr(checks[row].name) for row in exc.args[1])
+        raise ValueError(f"Dependency cycle between checks: {names}")
+    return result
+
+
+def get_automation_order(dependencies: typing.Dict[int, typing.Set[int]]):
+    """Return the rows of automated checks, sorted so dependencies come first
+
+    Dependencies on rows that are not keys of ``dependencies`` are ignored.
+    Raises ``ValueError`` if there is a cycle, with the rows that are part of
+    it, or that depend on it, as second argument.
+
+    """
+
     result = []
-    for item in directory.iterdir():
-        utils.log_message(f"loading file {item}...")
-        if item.is_file():
-            with item.open(
-                encoding="utf-8"
-            ) as fh:  # TODO: use the same encoding used by QGIS
-                try:
-                    raw_data = json.load(fh)
-                    checklist = CheckList.from_dict(raw_data)
-                    result.append(checklist)
-                except (UnicodeDecodeError, ValueError, KeyError) as exc:
-                    utils.log_message(
-                        f"Could not generate checklist from {str(item)!r} because: {exc}"
-                    )
+    remaining = {
+        row: set(deps) & set(dependencies) for row, deps in dependencies.items()
+    }
+    # repeatedly take the checks whose dependencies have all been taken already
+    while remaining:
+        ready = sorted(row for row, deps in remaining.items() if not deps)
+        if not ready:
+            raise ValueError("Dependency cycle", sorted(remaining))
+        for row in ready:
+            del remaining[row]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+        result.extend(ready)
+    return result
+
+
+def _get_check_cost(check: ChecklistItemHead) -> float:
+    return check.timings.wall_time if check.timings is not None else -1.0
+
+
+def contiguous_ranges(rows: typing.Iterable[int]) -> typing.List[typing.Tuple]:
+    """Group row numbers into a list of (first, last) inclusive ranges"""
+    result = []
+    for row in sorted(set(rows)):
+        if result and row == result[-1][1] + 1:
+            result[-1] = (result[-1][0], row)
+        else:
+            result.append((row, row))
     return result
+
+
+def load_raw_checklist(path: Path) -> typing.Dict:
+    # TODO: use the same encoding used by QGIS
+    with path.open(encoding="utf-8") as fh:
+        raw = json.load(fh)
+    if not isinstance(raw, dict):
+        raise ValueError("A checklist must be defined as a JSON object")
+    return raw
+
+
+def load_raw_checks(path: Path) -> typing.List[typing.Dict]:
+    return load_raw_checklist(path).get("checks", [])
@@ -1,3 +1,4 @@
+import datetime as dt
 import json
 import typing
 
@@ -12,8 +13,15 @@ from qgis.core import (
 )
 from qgis.gui import QgisInterface
 
-from . import utils
-from .constants import REPORT_HANDLER_INPUT_NAME
+from . import (
+    models,
+    utils,
+)
+from .constants import (
+    CheckStatus,
+    QGIS_VARIABLE_PREFIX,
+    REPORT_HANDLER_INPUT_NAME,
+)
 
 
 class ReportHandler:
@@ -34,8 +42,7 @@ class ReportHandler:
         self.iface = iface
         self.context = context or QgsProcessingContext()
         self.feedback = feedback or QgsProcessingFeedback()
-        registry = QgsApplication.processingRegistry()
-        algorithm = registry.createAlgorithmById(algorithm_id)
+        algorithm = utils.get_processing_algorithm(algorithm_id)
         if algorithm is None:
             raise RuntimeError(f"Invalid algorithm_id: {algorithm_id}")
         self.algorithm = algorithm
@@ -52,8 +59,7 @@ class ReportHandler:
 
     def configure_and_handle_report(self):
         accepted, result = utils.execute_algorithm_dialog(self.algorithm, self.params)
-        utils.log_message(f"accepted: {accepted}")
-        utils.log_message(f"result: {result}")
+        utils.log_message("accepted: %s, result: %r", accepted, result, level="debug")
         if accepted:
             successful = bool(result) if result is not None else False
             self.task_finished(successful, result)
@@ -66,3 +72,76 @@ class ReportHandler:
             msg = f"Post validation failed"
             level = Qgis.Warning
         self.iface.messageBar().pushMessage(msg, level=level, duration=3)
+
+
+def build_report_contents(
+    checklist: models.CheckList,
+    dataset_name: str,
+    summary: typing.Optional[models.ChecklistSummary] = None,
+    dataset_open_time: typing.Optional[float] = None,
+) -> typing.Dict:
+    """Build a validation report with the current results of a checklist's checks
+
+    ``summary`` may be passed in when it is already known, which avoids
+    having to go through all checks once more.
+
+    Checks that have been automated include the outcome of their automation,
+    with the values of the processing algorithm's outputs.
+
+    When checks have been timed, or the time it took to open the dataset is
+    known, the report includes a ``timings`` section with them.
+
+    """
+
+    if summary is None:
+        summary = models.ChecklistSummary.from_checks(checklist.checks)
+    result = {
+        "name": "Validation report",
+        "validator": utils.get_qgis_variable(
+            f"{QGIS_VARIABLE_PREFIX}_validator", "user_full_name"
+        ),
+        "generated": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "dataset": dataset_name,
+        "dataset_is_valid": summary.is_valid,
+        "summary": summary.to_dict(),
+        "checklist": checklist.name,
+        "dataset_type": checklist.dataset_type.value,
+        "artifact_type": checklist.validation_artifact_type.value,
+        "description": checklist.description,
+        "checks": [],
+    }
+    for checklist_head in checklist.checks:
+        checklist_head: models.ChecklistItemHead
+        check = {
+            "name": checklist_head.name,
+            "validated": checklist_head.status == CheckStatus.PASSED,
+            "description": checklist_head.description,
+            "notes": checklist_head.validation_notes,
+        }
+        if checklist_head.automation_result is not None:
+            check["automation"] = checklist_head.automation_result.to_dict()
+        result["checks"].append(check)
+    timings = get_report_timings(checklist, dataset_open_time)
+    if timings is not None:
+        result["timings"] = timings
+    return result
+
+
+def get_report_timings(
+    checklist: models.CheckList, dataset_open_time: typing.Optional[float] = None
+) -> typing.Optional[typing.Dict]:
+    checks = [
+        {"name": check.name, **check.timings.to_dict()}
+        for check in checklist.checks
+        if check.timings is not None
+    ]
+    if checks or dataset_open_time is not None:
+        result = {
+            "dataset_open_time": (
+                round(dataset_open_time, 3) if dataset_open_time is not None else None
+            ),
+            "checks": checks,
+        }
+    else:
+        result = None
+    return result
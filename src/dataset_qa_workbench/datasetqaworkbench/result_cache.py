@@ -0,0 +1,245 @@
+"""Persistent cache of automation results
+
+Running the processing algorithm of an automated check on a large dataset may
+take a long time. Results are cached in a SQLite database, keyed by the
+algorithm, its parameters and a fingerprint of the dataset being validated, so
+that validating an unchanged dataset again is instantaneous.
+
+"""
+
+import glob
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import typing
+from pathlib import Path
+
+from . import utils
+
+DEFAULT_MAX_ENTRIES = 2000
+
+# seconds to wait for other processes, such as batch validation workers, that
+# are writing to the cache
+BUSY_TIMEOUT = 10
+
+_CACHEABLE_TYPES = (bool, int, float, str, type(None))
+
+
+def dataset_fingerprint(dataset: typing.Any) -> typing.Optional[str]:
+    """Return a string that changes whenever the dataset changes
+
+    Files are identified by their path, size and modification time, along
+    with those of their sidecar files, since the data of some formats is not
+    all in the main file. Shapefiles keep their attributes in a ``.dbf`` file
+    and GeoPackages keep recent edits in a ``-wal`` file. Layers are
+    identified by their source, as long as it is a file and the layer has no
+    unsaved edits. Other datasets cannot be fingerprinted and ``None`` is
+    returned for them.
+
+    """
+
+    if isinstance(dataset, (str, Path)):
+        source = str(dataset)
+        provider = "file"
+    else:
+        try:
+            source = dataset.source()
+            provider = dataset.providerType()
+        except AttributeError:
+            return None
+        if getattr(dataset, "isModified", lambda: False)():
+            return None
+    path = Path(source.split("|")[0])
+    try:
+        stat_result = path.stat()
+    except OSError:
+        result = None
+    else:
+        if path.is_file():
+            result = (
+                f"{provider}|{source}|{path.resolve()}|"
+                f"{stat_result.st_size}|{stat_result.st_mtime_ns}"
+            )
+            for sidecar, sidecar_stat in get_sidecar_files(path):
+                result += (
+                    f"|{sidecar.name}|{sidecar_stat.st_size}|"
+                    f"{sidecar_stat.st_mtime_ns}"
+                )
+        else:
+            result = None
+    return result
+
+
+def get_sidecar_files(path: Path) -> typing.List[typing.Tuple[Path, os.stat_result]]:
+    """Return the files next to a dataset that may hold part of its data
+
+    These are the files with the same name but another extension, such as the
+    ``.dbf`` of a shapefile, and SQLite's ``-wal`` journal. The ``-shm`` file
+    of SQLite databases is left out, as it holds no data and is also modified
+    by readers.
+
+    """
+
+    result = []
+    candidates = set(path.parent.glob(f"{glob.escape(path.stem)}.*"))
+    candidates.add(path.parent / f"{path.name}-wal")
+    for candidate in sorted(candidates):
+        if candidate == path or candidate.name.endswith("-shm"):
+            continue
+        try:
+            result.append((candidate, candidate.stat()))
+        except OSError:
+            pass  # the file does not exist or was removed meanwhile
+    return result
+
+
+def make_cache_key(
+    algorithm_id: str, params: typing.Dict[str, typing.Any], fingerprint: str
+) -> str:
+    """Return a key that identifies a run of an algorithm over a dataset
+
+    ``params`` should not include the dataset itself nor any output
+    definitions. Values that are not JSON serializable are represented by
+    their ``str()``.
+
+    """
+
+    normalized = json.dumps(
+        {
+            "algorithm_id": algorithm_id,
+            "params": params,
+            "dataset": fingerprint,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def get_cacheable_results(results: typing.Dict) -> typing.Dict:
+    """Return the results that can be stored in the cache
+
+    Only plain values are kept. Layers created by the algorithm (or their
+    identifiers) do not outlive the current session.
+
+    """
+
+    return {
+        name: value
+        for name, value in results.items()
+        if isinstance(value, _CACHEABLE_TYPES)
+    }
+
+
+class AutomationResultCache:
+    """A size-bounded, least recently used, cache of automation results
+
+    The cache is used both from the main thread and from the threads of
+    processing tasks, so its connection is not tied to the thread that opened
+    it and accesses are serialized with a lock.
+
+    """
+
+    path: Path
+    max_entries: int
+    _connection: typing.Optional[sqlite3.Connection]
+    _lock: threading.RLock
+
+    def __init__(self, path: Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._connection = None
+        self._lock = threading.RLock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(
+                str(self.path), timeout=BUSY_TIMEOUT, check_same_thread=False
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, "
+                "algorithm_id TEXT NOT NULL, "
+                "results TEXT NOT NULL, "
+                "last_used REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)"
+            )
+            self._connection.commit()
+        return self._connection
+
+    def get(self, key: str) -> typing.Optional[typing.Dict]:
+        try:
+            with self._lock:
+                connection = self._get_connection()
+                row = connection.execute(
+                    "SELECT results FROM results WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    with connection:
+                        connection.execute(
+                            "UPDATE results SET last_used = ? WHERE key = ?",
+                            (time.time(), key),
+                        )
+        except sqlite3.Error as exc:
+            utils.log_message(
+                f"Could not read from the automation results cache: {exc}",
+                level="warning",
+            )
+            row = None
+        return json.loads(row[0]) if row is not None else None
+
+    def put(self, key: str, algorithm_id: str, results: typing.Dict):
+        try:
+            with self._lock, self._get_connection() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO results "
+                    "(key, algorithm_id, results, last_used) VALUES (?, ?, ?, ?)",
+                    (
+                        key,
+                        algorithm_id,
+                        json.dumps(get_cacheable_results(results)),
+                        time.time(),
+                    ),
+                )
+                connection.execute(
+                    "DELETE FROM results WHERE key NOT IN ("
+                    "SELECT key FROM results ORDER BY last_used DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+        except sqlite3.Error as exc:
+            utils.log_message(
+                f"Could not write to the automation results cache: {exc}",
+                level="warning",
+            )
+
+    def clear(self):
+        with self._lock, self._get_connection() as connection:
+            connection.execute("DELETE FROM results")
+
+    def __len__(self) -> int:
+        with self._lock:
+            connection = self._get_connection()
+            return connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+_result_cache: typing.Optional[AutomationResultCache] = None
+
+
+def get_result_cache() -> AutomationResultCache:
+    """Return the automation results cache of the current QGIS profile"""
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = AutomationResultCache(utils.get_automation_cache_path())
+    return _result_cache
@@ -1,4 +1,5 @@
 import typing
+from collections import deque
 from pathlib import Path
 from sys import getfilesystemencoding
 
@@ -10,6 +11,7 @@ from qgis.core import (
     QgsMapLayerType,
     QgsMessageLog,
     QgsProcessingAlgorithm,
+    QgsProcessingRegistry,
 )
 from qgis.utils import iface
 from PyQt5 import (
@@ -19,15 +21,162 @@ from PyQt5 import (
 )
 from PyQt5.QtCore import QAbstractItemModel
 
-from .constants import DatasetType
+from .constants import (
+    DatasetType,
+    ErrorOutputMode,
+    QGIS_VARIABLE_PREFIX,
+)
+
+LOG_LEVELS = {
+    "debug": 10,
+    "info": 20,
+    "warning": 30,
+    "critical": 40,
+}
+
+_LOG_TAG = "dataset_qa_workbench"
+
+_QGIS_LOG_LEVELS = {
+    "warning": Qgis.Warning,
+    "critical": Qgis.Critical,
+}
+
+
+class BufferedMessageLog:
+    """Sends messages to the QGIS message log in batches
+
+    Messages below the threshold set in the ``dataset_qa_workbench_log_level``
+    QGIS variable (``info`` by default) are discarded before being formatted.
+    Messages logged from the main thread are kept in a bounded ring buffer,
+    which is sent to the QGIS message log once control returns to the event
+    loop. Warnings, critical messages and messages logged from other threads
+    are sent right away.
+
+    """
+
+    max_messages: int = 1000
+    flush_interval: int = 250
+    _messages: typing.Deque[typing.Tuple[str, Qgis.MessageLevel]]
+    _dropped: int
+    _threshold: typing.Optional[int]
+    _listening: bool
+    _timer: typing.Optional[QtCore.QTimer]
+
+    def __init__(self):
+        self._messages = deque(maxlen=self.max_messages)
+        self._dropped = 0
+        self._threshold = None
+        self._listening = False
+        self._timer = None
+
+    @property
+    def threshold(self) -> int:
+        if self._threshold is None:
+            raw_value = get_qgis_variable(f"{QGIS_VARIABLE_PREFIX}_log_level")
+            name = str(raw_value).strip().lower() if raw_value else "info"
+            self._threshold = LOG_LEVELS.get(name, LOG_LEVELS["info"])
+            application = QgsApplication.instance()
+            if not self._listening and application is not None:
+                application.customVariablesChanged.connect(self.reset_threshold)
+                self._listening = True
+        return self._threshold
+
+    def reset_threshold(self):
+        self._threshold = None
+
+    def is_enabled_for(self, level: typing.Optional[str]) -> bool:
+        return LOG_LEVELS.get(level, LOG_LEVELS["info"]) >= self.threshold
+
+    def log(self, message: str, args: typing.Tuple, level: typing.Optional[str] = None):
+        rank = LOG_LEVELS.get(level, LOG_LEVELS["info"])
+        if rank < self.threshold:
+            return
+        text = message % args if args else message
+        qgis_level = _QGIS_LOG_LEVELS.get(level, Qgis.Info)
+        if not _is_main_thread():
+            QgsMessageLog.logMessage(text, _LOG_TAG, level=qgis_level)
+        elif rank >= LOG_LEVELS["warning"]:
+            self.flush()
+            QgsMessageLog.logMessage(text, _LOG_TAG, level=qgis_level)
+        else:
+            if len(self._messages) == self._messages.maxlen:
+                self._dropped += 1
+            self._messages.append((text, qgis_level))
+            if self._timer is None:
+                self._timer = QtCore.QTimer()
+                self._timer.setSingleShot(True)
+                self._timer.setInterval(self.flush_interval)
+                self._timer.timeout.connect(self.flush)
+            if not self._timer.isActive():
+                self._timer.start()
+
+    def flush(self):
+        """Send buffered messages to the QGIS message log. Main thread only"""
+        if self._dropped > 0:
+            QgsMessageLog.logMessage(
+                f"{self._dropped} log messages were dropped",
+                _LOG_TAG,
+                level=Qgis.Warning,
+            )
+            self._dropped = 0
+        while self._messages:
+            text, qgis_level = self._messages.popleft()
+            QgsMessageLog.logMessage(text, _LOG_TAG, level=qgis_level)
+
+    def close(self):
+        """Flush buffered messages and release the timer and signal connection
+
+        The log keeps working after being closed, it sets them up again the
+        next time they are needed.
+
+        """
+
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer.timeout.disconnect(self.flush)
+            self._timer = None
+        application = QgsApplication.instance()
+        if self._listening and application is not None:
+            application.customVariablesChanged.disconnect(self.reset_threshold)
+        self._listening = False
+        self._threshold = None
+        self.flush()
+
+
+def _is_main_thread() -> bool:
+    application = QtCore.QCoreApplication.instance()
+    return (
+        application is not None
+        and QtCore.QThread.currentThread() == application.thread()
+    )
+
+
+_message_log = BufferedMessageLog()
+
+
+def log_message(message: str, *args, level: typing.Optional[str] = None):
+    """Log a message to the plugin's tab of the QGIS message log
+
+    ``level`` is one of ``debug``, ``info`` (the default), ``warning`` or
+    ``critical``. ``args`` are merged into ``message`` with the ``%``
+    operator, but only if the message is going to be logged, so they should be
+    preferred over f-strings for messages that are expensive to build:
+
+        log_message("Running with parameters %r", params, level="debug")
+
+    """
+
+    _message_log.log(message, args, level)
+
+
+def is_logging_enabled_for(level: typing.Optional[str]) -> bool:
+    """Return whether messages of the input level are being logged"""
+    return _message_log.is_enabled_for(level)
 
 
-def log_message(message: str, level: typing.Optional[str] = None):
-    msg_level = {
-        "warning": Qgis.Warning,
-        "critical": Qgis.Critical,
-    }.get(level, Qgis.Info)
-    QgsMessageLog.logMessage(message, "dataset_qa_workbench", level=msg_level)
+def close_message_log():
+    """Flush buffered messages and stop listening for changes to the log level"""
+    _message_log.close()
 
 
 def get_qgis_variable(
@@ -44,6 +193,66 @@ def get_qgis_variable(
     return result
 
 
+def get_max_automation_workers() -> int:
+    """Return how many automated checks may run at the same time
+
+    This is read from the ``dataset_qa_workbench_max_automation_workers`` QGIS
+    variable and defaults to the number of available CPU cores.
+
+    """
+
+    default = max(1, QtCore.QThread.idealThreadCount())
+    raw_value = get_qgis_variable(f"{QGIS_VARIABLE_PREFIX}_max_automation_workers")
+    try:
+        result = int(raw_value) if raw_value not in (None, "") else default
+    except (TypeError, ValueError):
+        log_message(
+            f"Invalid value for the maximum number of automation workers: "
+            f"{raw_value!r}, using {default} instead",
+            level="warning",
+        )
+        result = default
+    return max(1, result)
+
+
+def get_automation_fail_fast() -> bool:
+    """Return whether automating all checks stops at the first failed check
+
+    This is read from the ``dataset_qa_workbench_automation_fail_fast`` QGIS
+    variable.
+
+    """
+
+    raw_value = get_qgis_variable(f"{QGIS_VARIABLE_PREFIX}_automation_fail_fast")
+    return str(raw_value).strip().lower() in ("1", "true", "yes")
+
+
+def get_error_output_mode() -> ErrorOutputMode:
+    """Return where automated checks write the features they flag
+
+    This is read from the ``dataset_qa_workbench_error_output`` QGIS variable,
+    which may be ``discard``, ``temporary`` (the default) or ``persistent``.
+
+    """
+
+    default = ErrorOutputMode.TEMPORARY
+    raw_value = get_qgis_variable(f"{QGIS_VARIABLE_PREFIX}_error_output")
+    try:
+        result = (
+            ErrorOutputMode(str(raw_value).strip().lower())
+            if raw_value not in (None, "")
+            else default
+        )
+    except ValueError:
+        log_message(
+            f"Invalid value for the error output of automated checks: "
+            f"{raw_value!r}, using {default.value!r} instead",
+            level="warning",
+        )
+        result = default
+    return result
+
+
 def get_checklists_dir() -> Path:
     base_dir = get_profile_base_path()
     checklists_dir = base_dir / "checklists"
@@ -53,10 +262,95 @@ def get_checklists_dir() -> Path:
     return checklists_dir
 
 
+def get_checklists_index_path() -> Path:
+    return get_profile_base_path() / "checklists-index.json"
+
+
+def get_automation_cache_path() -> Path:
+    return get_profile_base_path() / "automation-cache.sqlite"
+
+
 def get_profile_base_path() -> Path:
     return Path(QgsApplication.qgisSettingsDirPath())
 
 
+class AlgorithmPrototypeCache:
+    """Initialized processing algorithms, keyed by their id
+
+    Creating an algorithm from the processing registry runs its
+    ``initAlgorithm()``, which is wasteful when the same algorithm is used by
+    many checks and datasets. Cached algorithms are shared and must not be
+    modified. Running them with ``run()`` or a ``QgsProcessingAlgRunnerTask``
+    is fine, as both work on their own copy of the algorithm.
+
+    The cache is emptied whenever a processing provider is added to or removed
+    from the registry, as its algorithms may have changed.
+
+    """
+
+    _prototypes: typing.Dict[str, QgsProcessingAlgorithm]
+    _registry: typing.Optional[QgsProcessingRegistry]
+    _connected: bool
+
+    def __init__(self, registry: typing.Optional[QgsProcessingRegistry] = None):
+        self._prototypes = {}
+        self._registry = registry
+        self._connected = False
+
+    @property
+    def registry(self) -> QgsProcessingRegistry:
+        if self._registry is None:
+            self._registry = QgsApplication.processingRegistry()
+        return self._registry
+
+    def get(self, algorithm_id: str) -> typing.Optional[QgsProcessingAlgorithm]:
+        try:
+            result = self._prototypes[algorithm_id]
+        except KeyError:
+            if not self._connected:
+                self.registry.providerAdded.connect(self.clear)
+                self.registry.providerRemoved.connect(self.clear)
+                self._connected = True
+            result = self.registry.createAlgorithmById(algorithm_id)
+            if result is not None:
+                self._prototypes[algorithm_id] = result
+        return result
+
+    def clear(self, *args):
+        self._prototypes.clear()
+
+    def close(self):
+        """Empty the cache and stop listening to changes in the registry"""
+        self.clear()
+        if self._connected:
+            self.registry.providerAdded.disconnect(self.clear)
+            self.registry.providerRemoved.disconnect(self.clear)
+            self._connected = False
+
+    def __len__(self) -> int:
+        return len(self._prototypes)
+
+
+_algorithm_cache: typing.Optional[AlgorithmPrototypeCache] = None
+
+
+def get_processing_algorithm(
+    algorithm_id: str,
+) -> typing.Optional[QgsProcessingAlgorithm]:
+    """Return the shared, initialized, processing algorithm with the input id"""
+    global _algorithm_cache
+    if _algorithm_cache is None:
+        _algorithm_cache = AlgorithmPrototypeCache()
+    return _algorithm_cache.get(algorithm_id)
+
+
+def close_processing_algorithms():
+    global _algorithm_cache
+    if _algorithm_cache is not None:
+        _algorithm_cache.close()
+        _algorithm_cache = None
+
+
 def match_maplayer_type(type_: QgsMapLayerType) -> typing.Optional[DatasetType]:
     return {
         QgsMapLayerType.VectorLayer: DatasetType.VECTOR,
@@ -65,23 +359,92 @@ def match_maplayer_type(type_: QgsMapLayerType) -> typing.Optional[DatasetType]:
 
 
 class TreeNode:
+    """A node of a ``TreeModel``
+
+    Child nodes are not created upfront. They are only instantiated when they
+    are requested for the first time, which is usually when a view asks the
+    model for their index.
+
+    """
+
     def __init__(self, parent, row):
         self.parent = parent
         self.row = row
-        self.sub_nodes = self._get_children()
+        self._sub_nodes = None
 
-    def _get_children(self):
+    def _get_child_count(self) -> int:
         raise NotImplementedError
 
+    def _create_child(self, row: int) -> "TreeNode":
+        raise NotImplementedError
+
+    def child_count(self) -> int:
+        if self._sub_nodes is None:
+            result = self._get_child_count()
+        else:
+            result = len(self._sub_nodes)
+        return result
+
+    def child(self, row: int) -> "TreeNode":
+        if self._sub_nodes is None:
+            self._sub_nodes = [None] * self._get_child_count()
+        node = self._sub_nodes[row]
+        if node is None:
+            node = self._create_child(row)
+            self._sub_nodes[row] = node
+        return node
+
+    def is_materialized(self, row: int) -> bool:
+        return self._sub_nodes is not None and self._sub_nodes[row] is not None
+
+    @property
+    def sub_nodes(self) -> typing.List["TreeNode"]:
+        return [self.child(row) for row in range(self.child_count())]
+
 
 class TreeModel(QAbstractItemModel):
+    """Base model for trees whose nodes are created on demand
+
+    Root nodes are made available to views in batches of ``fetch_batch_size``
+    rows, by means of Qt's ``canFetchMore()``/``fetchMore()`` mechanism. This
+    means that ``rowCount()`` on the root reports only the rows that have been
+    fetched so far, use ``total_root_count()`` to know how many there are.
+
+    """
+
+    fetch_batch_size: int = 200
+
     def __init__(self):
         super().__init__()
-        self.root_nodes = self._get_root_nodes()
+        self._init_root_nodes()
+
+    def _init_root_nodes(self):
+        total = self._get_root_count()
+        self._root_nodes = [None] * total
+        self._fetched_root_count = min(total, self.fetch_batch_size)
+
+    def _get_root_count(self) -> int:
+        raise NotImplementedError
 
-    def _get_root_nodes(self):
+    def _create_root_node(self, row: int) -> TreeNode:
         raise NotImplementedError
 
+    def root_node(self, row: int) -> TreeNode:
+        node = self._root_nodes[row]
+        if node is None:
+            node = self._create_root_node(row)
+            self._root_nodes[row] = node
+        return node
+
+    def is_root_node_materialized(self, row: int) -> bool:
+        return self._root_nodes[row] is not None
+
+    def total_root_count(self) -> int:
+        return len(self._root_nodes)
+
+    def fetched_root_count(self) -> int:
+        return self._fetched_root_count
+
     def index(
         self,
         row: int,
@@ -89,10 +452,10 @@ class TreeModel(QAbstractItemModel):
         parent: typing.Optional[QtCore.QModelIndex] = QtCore.QModelIndex(),
     ):
         if not parent.isValid():
-            result = self.createIndex(row, column, self.root_nodes[row])
+            result = self.createIndex(row, column, self.root_node(row))
         else:
             parent_node: TreeNode = parent.internalPointer()
-            result = self.createIndex(row, column, parent_node.sub_nodes[row])
+            result = self.createIndex(row, column, parent_node.child(row))
         return result
 
     def parent(self, index: QtCore.QModelIndex):
@@ -107,17 +470,42 @@ class TreeModel(QAbstractItemModel):
         return result
 
     def reset(self):
-        self.root_nodes = self._get_root_nodes()
-        super().reset()
+        self.beginResetModel()
+        self._init_root_nodes()
+        self.endResetModel()
 
     def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
         if not parent.isValid():
-            result = len(self.root_nodes)
+            result = self._fetched_root_count
+        elif parent.column() > 0:
+            result = 0
         else:
             node: TreeNode = parent.internalPointer()
-            result = len(node.sub_nodes)
+            result = node.child_count()
+        return result
+
+    def canFetchMore(self, parent: QtCore.QModelIndex) -> bool:
+        if not parent.isValid():
+            result = self._fetched_root_count < len(self._root_nodes)
+        else:
+            result = False
         return result
 
+    def fetchMore(self, parent: QtCore.QModelIndex):
+        if not parent.isValid():
+            remaining = len(self._root_nodes) - self._fetched_root_count
+            to_fetch = min(remaining, self.fetch_batch_size)
+            if to_fetch > 0:
+                first = self._fetched_root_count
+                self.beginInsertRows(QtCore.QModelIndex(), first, first + to_fetch - 1)
+                self._fetched_root_count += to_fetch
+                self.endInsertRows()
+
+    def fetch_all(self):
+        root = QtCore.QModelIndex()
+        while self.canFetchMore(root):
+            self.fetchMore(root)
+
 
 def serialize_report_to_plain_text(report: typing.Dict) -> str:
     validation_check_template_path = (
@@ -128,7 +516,7 @@ def serialize_report_to_plain_text(report: typing.Dict) -> str:
     check_template = check_template_fh.readAll().data().decode(getfilesystemencoding())
     check_template_fh.close()
     rendered_checks = []
-    log_message("Rendering checks...")
+    log_message("Rendering checks...", level="debug")
     for check in report.get("checks", []):
         rendered = check_template.format(
             check_name=check["name"],
@@ -136,9 +524,9 @@ def serialize_report_to_plain_text(report: typing.Dict) -> str:
             description=check["description"],
             notes=check["notes"].replace("{", "{{").replace("}", "}}"),
         )
-        log_message(f"check {rendered}")
+        log_message("check %s", rendered, level="debug")
         rendered_checks.append(rendered)
-    log_message("Rendering final report...")
+    log_message("Rendering final report...", level="debug")
     validation_report_template_path = (
         ":/plugins/dataset_qa_workbench/validation-report-template.txt"
     )
@@ -149,7 +537,7 @@ def serialize_report_to_plain_text(report: typing.Dict) -> str:
     )
     report_template_fh.close()
     ready_to_render = report_template.replace("{checks}", "\n".join(rendered_checks))
-    log_message(f"Replaced checks placeholder: {report_template}")
+    log_message("Replaced checks placeholder: %s", report_template, level="debug")
     rendered_report = ready_to_render.format(
         checklist_name=report["checklist"],
         dataset_name=report["dataset"],
@@ -170,7 +558,7 @@ def serialize_report_to_html(report: typing.Dict) -> QtGui.QTextDocument:
     check_template = check_template_fh.readAll().data().decode(getfilesystemencoding())
     check_template_fh.close()
     rendered_checks = []
-    log_message("Rendering checks...")
+    log_message("Rendering checks...", level="debug")
     for check in report.get("checks", []):
         rendered = check_template.format(
             check_name=check["name"],
@@ -178,9 +566,9 @@ def serialize_report_to_html(report: typing.Dict) -> QtGui.QTextDocument:
             description=check["description"],
             notes=check["notes"].replace("{", "{{").replace("}", "}}"),
         )
-        log_message(f"check {rendered}")
+        log_message("check %s", rendered, level="debug")
         rendered_checks.append(rendered)
-    log_message("Rendering final report...")
+    log_message("Rendering final report...", level="debug")
     validation_report_template_path = (
         ":/plugins/dataset_qa_workbench/validation-report-template.html"
     )
@@ -191,7 +579,7 @@ def serialize_report_to_html(report: typing.Dict) -> QtGui.QTextDocument:
     )
     report_template_fh.close()
     ready_to_render = report_template.replace("{checks}", "\n".join(rendered_checks))
-    log_message(f"Replaced checks placeholder: {report_template}")
+    log_message("Replaced checks placeholder: %s", report_template, level="debug")
     rendered_report = ready_to_render.format(
         checklist_name=report["checklist"],
         dataset_name=report["dataset"],
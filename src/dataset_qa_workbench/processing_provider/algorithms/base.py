@@ -1,16 +1,21 @@
+import threading
 import typing
+from collections import OrderedDict
 
 from PyQt5 import (
     QtCore,
     QtGui,
 )
 from qgis.core import (
+    QgsApplication,
     QgsExpression,
     QgsExpressionContext,
     QgsExpressionContextUtils,
     QgsProcessingAlgorithm,
 )
 
+MAX_CACHED_EXPRESSIONS = 256
+
 
 class BaseAlgorithm(QgsProcessingAlgorithm):
     # Constants used to refer to parameters and outputs. They will be
@@ -41,21 +46,117 @@ class BaseAlgorithm(QgsProcessingAlgorithm):
         return QtGui.QIcon(":/plugins/dataset_qa_workbench/clipboard-check-solid.svg")
 
 
-def parse_as_expression(
+class _ExpressionCache(threading.local):
+    """Parsed expressions and global scope context of the current thread
+
+    Expressions and contexts are not safe to evaluate from many threads at
+    once, and processing algorithms may run in background tasks, so each
+    thread gets its own cache.
+
+    """
+
+    generation: int
+    context: typing.Optional[QgsExpressionContext]
+    expressions: typing.Dict[str, QgsExpression]
+
+    def __init__(self):
+        self.generation = -1
+        self.context = None
+        self.expressions = OrderedDict()
+
+
+_expression_cache = _ExpressionCache()
+
+# bumped whenever QGIS global variables change, making caches outdated
+_global_scope_generation = 0
+_listening = False
+_listening_lock = threading.Lock()
+
+
+def _invalidate_expression_caches():
+    global _global_scope_generation
+    _global_scope_generation += 1
+
+
+def _listen_for_global_variable_changes():
+    global _listening
+    with _listening_lock:
+        application = QgsApplication.instance()
+        if not _listening and application is not None:
+            application.customVariablesChanged.connect(_invalidate_expression_caches)
+            _listening = True
+
+
+def close_expression_caches():
+    """Stop listening for changes to global variables and discard caches"""
+    global _listening
+    with _listening_lock:
+        application = QgsApplication.instance()
+        if _listening and application is not None:
+            application.customVariablesChanged.disconnect(_invalidate_expression_caches)
+        _listening = False
+    _invalidate_expression_caches()
+
+
+def get_compiled_expression(
     raw_expression: str,
-    context: typing.Optional[QgsExpressionContext] = None,
-    default: typing.Optional[typing.Any] = None,
-):
+) -> typing.Tuple[QgsExpression, QgsExpressionContext]:
+    """Return a parsed and prepared expression and the context to evaluate it
+
+    The context has the QGIS global scope. Both are cached, so evaluating the
+    same expression again has no parsing cost, and are discarded when QGIS
+    global variables change.
+
+    """
+
+    if not _listening:
+        _listen_for_global_variable_changes()
+    cache = _expression_cache
+    generation = _global_scope_generation
+    if cache.generation != generation:
+        cache.context = QgsExpressionContext()
+        cache.context.appendScope(QgsExpressionContextUtils.globalScope())
+        cache.expressions.clear()
+        cache.generation = generation
+    expression = cache.expressions.get(raw_expression)
+    if expression is None:
+        expression = _parse_expression(raw_expression)
+        expression.prepare(cache.context)
+        cache.expressions[raw_expression] = expression
+        if len(cache.expressions) > MAX_CACHED_EXPRESSIONS:
+            cache.expressions.popitem(last=False)
+    else:
+        cache.expressions.move_to_end(raw_expression)
+    return expression, cache.context
+
+
+def _parse_expression(raw_expression: str) -> QgsExpression:
     expression = QgsExpression(raw_expression)
     if expression.hasParserError():
         raise RuntimeError(
             f"Encountered error while parsing {raw_expression!r}: "
             f"{expression.parserErrorString()}"
         )
+    return expression
+
+
+def parse_as_expression(
+    raw_expression: str,
+    context: typing.Optional[QgsExpressionContext] = None,
+    default: typing.Optional[typing.Any] = None,
+):
+    """Evaluate an expression, returning ``default`` if it evaluates to NULL
+
+    Without a ``context``, the expression is evaluated with the QGIS global
+    scope, reusing the compiled expression from previous calls. Expressions
+    evaluated with a custom context are parsed every time.
+
+    """
+
     if context is None:
-        ctx = QgsExpressionContext()
-        ctx.appendScope(QgsExpressionContextUtils.globalScope())
+        expression, ctx = get_compiled_expression(raw_expression)
     else:
+        expression = _parse_expression(raw_expression)
         ctx = context
     result = expression.evaluate(ctx)
     if expression.hasEvalError():
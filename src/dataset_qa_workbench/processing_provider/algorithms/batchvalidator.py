@@ -0,0 +1,111 @@
+from pathlib import Path
+
+from qgis.core import (
+    QgsProcessingOutputFile,
+    QgsProcessingOutputNumber,
+    QgsProcessingParameterBoolean,
+    QgsProcessingParameterFile,
+    QgsProcessingParameterFolderDestination,
+    QgsProcessingParameterString,
+)
+
+from ...datasetqaworkbench import batch
+from .base import BaseAlgorithm
+
+
+class BatchValidatorAlgorithm(BaseAlgorithm):
+    INPUT_CHECKLIST = "INPUT_CHECKLIST"
+    INPUT_DATASETS = "INPUT_DATASETS"
+    INPUT_USE_CACHE = "INPUT_USE_CACHE"
+    OUTPUT_FOLDER = "OUTPUT_FOLDER"
+    OUTPUT_SUMMARY = "OUTPUT_SUMMARY"
+    OUTPUT_VALID_COUNT = "OUTPUT_VALID_COUNT"
+    OUTPUT_INVALID_COUNT = "OUTPUT_INVALID_COUNT"
+
+    def name(self):
+        return "batchvalidator"
+
+    def displayName(self):
+        return self.tr("Batch validator")
+
+    def createInstance(self):
+        return self.__class__()
+
+    def shortHelpString(self):
+        return self.tr(
+            "Run the automated checks of a checklist on many datasets.\n\n"
+            "Datasets are given as file paths or glob patterns (such as "
+            "/deliveries/**/*.gpkg), one per line. A JSON validation report is "
+            "written to the output folder for each dataset, together with a "
+            "summary.csv summary table. Checks that are not "
+            "automated are reported as pending."
+        )
+
+    def initAlgorithm(self, config):
+        self.addParameter(
+            QgsProcessingParameterFile(
+                self.INPUT_CHECKLIST,
+                self.tr("Checklist file"),
+                extension="json",
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterString(
+                self.INPUT_DATASETS,
+                self.tr("Datasets (paths or glob patterns, one per line)"),
+                multiLine=True,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.INPUT_USE_CACHE,
+                self.tr("Use cached automation results"),
+                defaultValue=True,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterFolderDestination(
+                self.OUTPUT_FOLDER, self.tr("Reports folder")
+            )
+        )
+        self.addOutput(
+            QgsProcessingOutputFile(self.OUTPUT_SUMMARY, self.tr("Summary table"))
+        )
+        self.addOutput(
+            QgsProcessingOutputNumber(
+                self.OUTPUT_VALID_COUNT, self.tr("Number of valid datasets")
+            )
+        )
+        self.addOutput(
+            QgsProcessingOutputNumber(
+                self.OUTPUT_INVALID_COUNT, self.tr("Number of invalid datasets")
+            )
+        )
+
+    def processAlgorithm(self, parameters, context, feedback):
+        checklist_path = Path(
+            self.parameterAsFile(parameters, self.INPUT_CHECKLIST, context)
+        )
+        raw_datasets = self.parameterAsString(parameters, self.INPUT_DATASETS, context)
+        use_cache = self.parameterAsBool(parameters, self.INPUT_USE_CACHE, context)
+        output_folder = Path(
+            self.parameterAsString(parameters, self.OUTPUT_FOLDER, context)
+        )
+        results = batch.run_batch(
+            checklist_path,
+            raw_datasets.splitlines(),
+            output_folder,
+            context=context,
+            feedback=feedback,
+            use_cache=use_cache,
+        )
+        valid_count = sum(1 for result in results if result.is_valid)
+        feedback.pushInfo(
+            f"Validated {len(results)} datasets, {valid_count} of them are valid"
+        )
+        return {
+            self.OUTPUT_FOLDER: str(output_folder),
+            self.OUTPUT_SUMMARY: str(output_folder / batch.SUMMARY_FILE_NAME),
+            self.OUTPUT_VALID_COUNT: valid_count,
+            self.OUTPUT_INVALID_COUNT: len(results) - valid_count,
+        }
@@ -0,0 +1,193 @@
+from pathlib import Path
+
+from PyQt5.QtCore import (
+    QThread,
+    QVariant,
+)
+from qgis.core import (
+    QgsCoordinateReferenceSystem,
+    QgsFeature,
+    QgsFeatureSink,
+    QgsField,
+    QgsFields,
+    QgsProcessing,
+    QgsProcessingException,
+    QgsProcessingOutputBoolean,
+    QgsProcessingOutputNumber,
+    QgsProcessingParameterFeatureSink,
+    QgsProcessingParameterFile,
+    QgsProcessingParameterMatrix,
+    QgsProcessingParameterNumber,
+    QgsProcessingParameterString,
+    QgsWkbTypes,
+)
+
+from ...datasetqaworkbench import batch
+from ..xpathmatcher import (
+    PathMatch,
+    XPathMatcher,
+)
+from .base import BaseAlgorithm
+
+
+class XmlBatchCheckerAlgorithm(BaseAlgorithm):
+    INPUT_FILES = "INPUT_FILES"
+    INPUT_FOLDER = "INPUT_FOLDER"
+    INPUT_FOLDER_PATTERN = "INPUT_FOLDER_PATTERN"
+    INPUT_XPATH_EXPRESSIONS = "INPUT_XPATH_EXPRESSIONS"
+    INPUT_WORKERS = "INPUT_WORKERS"
+    OUTPUT = "OUTPUT"
+    OUTPUT_ALL_PASSED = "OUTPUT_ALL_PASSED"
+    OUTPUT_PASSED_COUNT = "OUTPUT_PASSED_COUNT"
+    OUTPUT_FAILED_COUNT = "OUTPUT_FAILED_COUNT"
+
+    def name(self):
+        return "xmlbatchchecker"
+
+    def displayName(self):
+        return self.tr("XML batch checker")
+
+    def createInstance(self):
+        return self.__class__()
+
+    def shortHelpString(self):
+        return self.tr(
+            "Check many XML files (such as QGIS QML styles, SLDs, metadata "
+            "records, etc.) against the same list of XPath expressions.\n\n"
+            "Files are given as paths or glob patterns, one per line, and/or as "
+            "a folder that is searched for files matching a pattern. Files are "
+            "checked in parallel and a table with a row for each file and "
+            "expression is written, telling whether the expression was found "
+            "and on which line. A file passes when all expressions are found "
+            "in it."
+        )
+
+    def initAlgorithm(self, config):
+        self.addParameter(
+            QgsProcessingParameterString(
+                self.INPUT_FILES,
+                self.tr("Files (paths or glob patterns, one per line)"),
+                multiLine=True,
+                optional=True,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterFile(
+                self.INPUT_FOLDER,
+                self.tr("Folder"),
+                behavior=QgsProcessingParameterFile.Folder,
+                optional=True,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterString(
+                self.INPUT_FOLDER_PATTERN,
+                self.tr("Pattern of the files to check in the folder"),
+                defaultValue="**/*.xml",
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterMatrix(
+                self.INPUT_XPATH_EXPRESSIONS,
+                self.tr("Xpath expressions to check"),
+                headers=["XPath expression"],
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.INPUT_WORKERS,
+                self.tr("Number of files to check at the same time"),
+                type=QgsProcessingParameterNumber.Integer,
+                defaultValue=max(1, QThread.idealThreadCount()),
+                minValue=1,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterFeatureSink(
+                self.OUTPUT,
+                self.tr("Results"),
+                type=QgsProcessing.TypeVector,
+            )
+        )
+        self.addOutput(
+            QgsProcessingOutputBoolean(
+                self.OUTPUT_ALL_PASSED, self.tr("Whether all files passed")
+            )
+        )
+        self.addOutput(
+            QgsProcessingOutputNumber(
+                self.OUTPUT_PASSED_COUNT, self.tr("Number of files that passed")
+            )
+        )
+        self.addOutput(
+            QgsProcessingOutputNumber(
+                self.OUTPUT_FAILED_COUNT, self.tr("Number of files that failed")
+            )
+        )
+
+    def processAlgorithm(self, parameters, context, feedback):
+        patterns = self.parameterAsString(
+            parameters, self.INPUT_FILES, context
+        ).splitlines()
+        folder = self.parameterAsFile(parameters, self.INPUT_FOLDER, context)
+        if folder:
+            folder_pattern = self.parameterAsString(
+                parameters, self.INPUT_FOLDER_PATTERN, context
+            )
+            patterns.append(str(Path(folder) / folder_pattern))
+        files = batch.expand_datasets(patterns)
+        if not files:
+            raise QgsProcessingException(self.tr("Did not find any file to check"))
+        expressions = self.parameterAsMatrix(
+            parameters, self.INPUT_XPATH_EXPRESSIONS, context
+        )
+        workers = self.parameterAsInt(parameters, self.INPUT_WORKERS, context)
+        fields = QgsFields()
+        fields.append(QgsField("file", QVariant.String))
+        fields.append(QgsField("expression", QVariant.String))
+        fields.append(QgsField("found", QVariant.Bool))
+        fields.append(QgsField("line", QVariant.Int))
+        sink, destination_id = self.parameterAsSink(
+            parameters,
+            self.OUTPUT,
+            context,
+            fields,
+            QgsWkbTypes.NoGeometry,
+            QgsCoordinateReferenceSystem(),
+        )
+        if sink is None:
+            raise QgsProcessingException(self.invalidSinkError(parameters, self.OUTPUT))
+        feedback.pushInfo(f"Checking {len(files)} files with {workers} workers...")
+        matcher = XPathMatcher(expressions)
+        passed_count = 0
+        failed_count = 0
+        for index, (path, matches, error) in enumerate(
+            matcher.match_files(files, workers, should_stop=feedback.isCanceled)
+        ):
+            if feedback.isCanceled():
+                break
+            if error is not None:
+                feedback.reportError(f"Could not check {str(path)!r}: {error}")
+                matches = [PathMatch(expression) for expression in expressions]
+            if error is None and all(match.found for match in matches):
+                passed_count += 1
+            else:
+                failed_count += 1
+            features = []
+            for match in matches:
+                feature = QgsFeature(fields)
+                feature.setAttributes(
+                    [str(path), match.expression, match.found, match.line]
+                )
+                features.append(feature)
+            sink.addFeatures(features, QgsFeatureSink.FastInsert)
+            feedback.setProgress(100 * (index + 1) / len(files))
+        feedback.pushInfo(
+            f"{passed_count} of {passed_count + failed_count} checked files passed"
+        )
+        return {
+            self.OUTPUT: destination_id,
+            self.OUTPUT_ALL_PASSED: passed_count == len(files),
+            self.OUTPUT_PASSED_COUNT: passed_count,
+            self.OUTPUT_FAILED_COUNT: failed_count,
+        }
@@ -1,11 +1,14 @@
-from xml.etree import ElementTree as etree
+from xml.parsers import expat
 
 from qgis.core import (
+    QgsProcessingException,
     QgsProcessingOutputBoolean,
+    QgsProcessingOutputString,
     QgsProcessingParameterFile,
     QgsProcessingParameterMatrix,
 )
 
+from ..xpathmatcher import XPathMatcher
 from .base import BaseAlgorithm
 
 
@@ -13,6 +16,7 @@ class XmlCheckerAlgorithm(BaseAlgorithm):
     INPUT = "INPUT"
     INPUT_XPATH_EXPRESSIONS = "INPUT_XPATH_EXPRESSIONS"
     OUTPUT = "OUTPUT"
+    OUTPUT_MATCHED = "OUTPUT_MATCHED"
 
     def name(self):
         return "xmlchecker"
@@ -27,8 +31,12 @@ class XmlCheckerAlgorithm(BaseAlgorithm):
         return self.tr(
             "Perform validation on an XML file (such as a QGIS QML, a CSW "
             "metadata record, etc.\n\n"
-            "This algorithm allows you to input a list of XPath expressions to"
-            "be searched for in the file."
+            "This algorithm allows you to input a list of XPath expressions to "
+            "be searched for in the file.\n\n"
+            "The file is read in a single pass, which stops as soon as all "
+            "expressions have been found, without loading it in memory. "
+            "Expressions with '..', 'last()' or predicates on children or text "
+            "before their last step need the whole file to be loaded."
         )
 
     def initAlgorithm(self, config):
@@ -47,22 +55,39 @@ class XmlCheckerAlgorithm(BaseAlgorithm):
             )
         )
         self.addOutput(QgsProcessingOutputBoolean(self.OUTPUT, self.tr("result")))
+        self.addOutput(
+            QgsProcessingOutputString(
+                self.OUTPUT_MATCHED,
+                self.tr("Matched XPath expressions, one per line"),
+            )
+        )
 
     def processAlgorithm(self, parameters, context, feedback):
         file_ = self.parameterAsFile(parameters, self.INPUT, context)
-        tree = etree.parse(file_)
-        root = tree.getroot()
         items_to_check = self.parameterAsMatrix(
             parameters, self.INPUT_XPATH_EXPRESSIONS, context
         )
         feedback.pushInfo(f"file_: {file_}")
         feedback.pushInfo(f"items_to_check: {items_to_check}")
-        result = False
-        for xpath in items_to_check:
-            item = root.find(xpath)
-            if item is None:
-                feedback.reportError(f"Did not find {xpath!r}")
-                break
-        else:
-            result = True
-        return {self.OUTPUT: result}
+        matcher = XPathMatcher(items_to_check)
+        if not matcher.is_streamable:
+            feedback.pushInfo(
+                "Some expressions cannot be checked while reading the file, "
+                "loading it in memory"
+            )
+        try:
+            matches = matcher.match_file(file_, should_stop=feedback.isCanceled)
+        except (OSError, SyntaxError, expat.ExpatError) as exc:
+            raise QgsProcessingException(f"Could not check {file_!r}: {exc}")
+        matched = []
+        for match in matches:
+            if match.found:
+                location = f" at line {match.line}" if match.line is not None else ""
+                feedback.pushInfo(f"Found {match.expression!r}{location}")
+                matched.append(match.expression)
+            else:
+                feedback.reportError(f"Did not find {match.expression!r}")
+        return {
+            self.OUTPUT: len(matched) == len(matches),
+            self.OUTPUT_MATCHED: "\n".join(matched),
+        }
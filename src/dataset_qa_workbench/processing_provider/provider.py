@@ -4,10 +4,12 @@ from qgis.core import QgsProcessingProvider
 from PyQt5 import QtGui
 
 from .algorithms import (
+    batchvalidator,
     crschecker,
     xmlchecker,
     reportmailer,
     reportposter,
+    xmlbatchchecker,
 )
 
 _ALGORITHM_CLASSES = set()
@@ -17,10 +19,12 @@ class DatasetQaWorkbenchProvider(QgsProcessingProvider):
     IDENTIFIER: str = "dataset_qa_workbench"
 
     def loadAlgorithms(self, *args, **kwargs):
+        self.addAlgorithm(batchvalidator.BatchValidatorAlgorithm())
         self.addAlgorithm(crschecker.CrsCheckerAlgorithm())
         self.addAlgorithm(reportmailer.ReportMailerAlgorithm())
         self.addAlgorithm(reportposter.ReportPosterAlgorithm())
         self.addAlgorithm(xmlchecker.XmlCheckerAlgorithm())
+        self.addAlgorithm(xmlbatchchecker.XmlBatchCheckerAlgorithm())
 
     def id(self):
         return self.IDENTIFIER
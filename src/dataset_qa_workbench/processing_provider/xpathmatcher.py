@@ -0,0 +1,545 @@
+"""Streaming evaluation of many XPath expressions over an XML file
+
+The expressions use the XPath subset of ElementTree's ``Element.find()``,
+evaluated relative to the root element of the document. They are compiled once
+into an ``XPathMatcher``, which evaluates all of them during a single pass of
+an expat parser. No element tree is built, so memory use does not grow with
+the size of the file, and parsing stops as soon as every expression has
+matched.
+
+Most expressions used for checking files can be streamed:
+
+- child and descendant steps, such as ``a/b`` and ``.//b``
+- tags with namespaces, such as ``{http://www.isotc211.org/2005/gmd}name``,
+  and the ``*``, ``{*}name`` and ``{namespace}*`` wildcards
+- ``[@attribute]``, ``[@attribute='value']`` and ``[position]`` predicates
+- ``[tag]``, ``[tag='text']`` and ``[.='text']`` predicates, but only on the
+  last step of the expression
+
+Other expressions, such as those with ``..``, ``last()`` or predicates on
+``.``, are still supported, but they need the whole file to be loaded in
+memory.
+
+"""
+
+import re
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from xml.etree import ElementTree as etree
+from xml.parsers import expat
+
+_STEP_PATTERN = re.compile(
+    r"^(?P<tag>(?:\{[^}]*\})?[^\[\]{}:]+)(?P<predicates>(?:\[[^\]]*\])*)$"
+)
+_PREDICATE_PATTERN = re.compile(r"\[([^\]]*)\]")
+_NAME = r"(?:\{[^}]*\})?[^\s\[\]{}:@=!'\"/.()][^\s\[\]{}:@=!'\"/()]*"
+_QUOTED = r"(?:'[^']*'|\"[^\"]*\")"
+_ATTRIBUTE_PREDICATE = re.compile(
+    rf"^@(?P<name>{_NAME})(?:\s*(?P<operator>!?=)\s*(?P<value>{_QUOTED}))?$"
+)
+_POSITION_PREDICATE = re.compile(r"^\s*(?P<position>[1-9][0-9]*)\s*$")
+_CHILD_PREDICATE = re.compile(
+    rf"^(?P<name>\.|{_NAME})(?:\s*(?P<operator>!?=)\s*(?P<value>{_QUOTED}))?$"
+)
+
+# how many elements are parsed between checks of whether to stop
+_STOP_CHECK_INTERVAL = 1000
+
+
+class UnsupportedPathError(ValueError):
+    """Raised for expressions that cannot be evaluated while streaming"""
+
+
+class PathMatch:
+    """Whether an expression matched a file and where
+
+    ``line`` is the line of the start tag of the first matching element that
+    was found. It is None when the expression did not match, or when it was
+    evaluated on a fully loaded file.
+
+    """
+
+    __slots__ = ("expression", "found", "line")
+    expression: str
+    found: bool
+    line: typing.Optional[int]
+
+    def __init__(
+        self, expression: str, found: bool = False, line: typing.Optional[int] = None
+    ):
+        self.expression = expression
+        self.found = found
+        self.line = line
+
+
+def _to_expat_notation(name: str) -> str:
+    # expat reports namespaced names as ``namespace}local``, rather than
+    # ElementTree's ``{namespace}local``. Expressions are converted to the
+    # former so that names reported by the parser can be used as they are
+    return name[1:] if name.startswith("{") else name
+
+
+def _compile_tag_test(tag: str) -> typing.Callable[[str], bool]:
+    if tag == "*":
+        result = _match_any_tag
+    elif tag == "{}*":
+        result = _match_tag_without_namespace
+    elif tag.startswith("{*}"):
+        local_name = tag[3:]
+        namespaced_suffix = f"}}{local_name}"
+
+        def result(candidate: str) -> bool:
+            return candidate == local_name or candidate.endswith(namespaced_suffix)
+
+    elif tag.startswith("{") and tag.endswith("}*"):
+        namespace = _to_expat_notation(tag[:-1])
+
+        def result(candidate: str) -> bool:
+            return candidate.startswith(namespace)
+
+    else:
+        result = _to_expat_notation(tag).__eq__
+    return result
+
+
+def _match_any_tag(tag: str) -> bool:
+    return True
+
+
+def _match_tag_without_namespace(tag: str) -> bool:
+    return "}" not in tag
+
+
+class _Step:
+    __slots__ = (
+        "descendant",
+        "tag_test",
+        "attribute_predicates",
+        "position",
+        "child_predicates",
+        "text_predicates",
+    )
+    descendant: bool
+    tag_test: typing.Callable[[str], bool]
+    attribute_predicates: typing.List[
+        typing.Tuple[str, typing.Optional[str], typing.Optional[str]]
+    ]
+    position: typing.Optional[int]
+    child_predicates: typing.List[
+        typing.Tuple[
+            typing.Callable[[str], bool], typing.Optional[str], typing.Optional[str]
+        ]
+    ]
+    text_predicates: typing.List[typing.Tuple[str, str]]
+
+    def __init__(self, descendant: bool, raw_step: str):
+        match = _STEP_PATTERN.match(raw_step)
+        if match is None:
+            raise UnsupportedPathError(f"Unsupported step: {raw_step!r}")
+        self.descendant = descendant
+        self.tag_test = _compile_tag_test(match.group("tag"))
+        self.attribute_predicates = []
+        self.position = None
+        self.child_predicates = []
+        self.text_predicates = []
+        for predicate in _PREDICATE_PATTERN.findall(match.group("predicates")):
+            self._add_predicate(predicate.strip())
+
+    def _add_predicate(self, predicate: str):
+        attribute_match = _ATTRIBUTE_PREDICATE.match(predicate)
+        position_match = _POSITION_PREDICATE.match(predicate)
+        child_match = _CHILD_PREDICATE.match(predicate)
+        if attribute_match is not None:
+            value = attribute_match.group("value")
+            self.attribute_predicates.append(
+                (
+                    _to_expat_notation(attribute_match.group("name")),
+                    attribute_match.group("operator"),
+                    value[1:-1] if value is not None else None,
+                )
+            )
+        elif position_match is not None:
+            if self.position is not None:
+                raise UnsupportedPathError(f"Unsupported predicate: {predicate!r}")
+            self.position = int(position_match.group("position"))
+        elif child_match is not None:
+            name = child_match.group("name")
+            operator = child_match.group("operator")
+            value = child_match.group("value")
+            if name == ".":
+                if operator is None:
+                    raise UnsupportedPathError(f"Unsupported predicate: {predicate!r}")
+                self.text_predicates.append((operator, value[1:-1]))
+            else:
+                self.child_predicates.append(
+                    (
+                        _compile_tag_test(name),
+                        operator,
+                        value[1:-1] if value is not None else None,
+                    )
+                )
+        else:
+            raise UnsupportedPathError(f"Unsupported predicate: {predicate!r}")
+
+    @property
+    def needs_content(self) -> bool:
+        """Whether matching needs the element's children and text"""
+        return bool(self.child_predicates or self.text_predicates)
+
+    def matches_start(
+        self, tag: str, attributes: typing.Dict[str, str], position: int
+    ) -> bool:
+        if not self.tag_test(tag):
+            return False
+        if self.position is not None and position != self.position:
+            return False
+        for name, operator, value in self.attribute_predicates:
+            actual = attributes.get(name)
+            if operator is None:
+                matched = actual is not None
+            elif operator == "=":
+                matched = actual == value
+            else:
+                matched = actual is not None and actual != value
+            if not matched:
+                return False
+        return True
+
+    def matches_content(self, frame: "_Frame") -> bool:
+        for operator, value in self.text_predicates:
+            if (frame.full_text == value) != (operator == "="):
+                return False
+        for tag_test, operator, value in self.child_predicates:
+            children = (text for tag, text in frame.children if tag_test(tag))
+            if operator is None:
+                matched = next(children, None) is not None
+            elif operator == "=":
+                matched = any(text == value for text in children)
+            else:
+                matched = any(text != value for text in children)
+            if not matched:
+                return False
+        return True
+
+
+class _CompiledPath:
+    __slots__ = ("expression", "steps")
+    expression: str
+    steps: typing.List[_Step]
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.steps = []
+        raw_path = expression.strip()
+        if not raw_path or raw_path.startswith("/"):
+            raise UnsupportedPathError(f"Unsupported path: {expression!r}")
+        descendant = False
+        for index, raw_step in enumerate(_split_steps(raw_path)):
+            if raw_step == "":
+                if index == 0 or descendant:
+                    raise UnsupportedPathError(f"Unsupported path: {expression!r}")
+                descendant = True
+            elif raw_step == ".":
+                if descendant:
+                    raise UnsupportedPathError(f"Unsupported path: {expression!r}")
+            elif raw_step == ".." or raw_step.startswith("."):
+                # such as ``.[@a]``, whose predicates apply to the current element
+                raise UnsupportedPathError(f"Unsupported step: {raw_step!r}")
+            else:
+                self.steps.append(_Step(descendant, raw_step))
+                descendant = False
+        if descendant:
+            raise UnsupportedPathError(f"Unsupported path: {expression!r}")
+        if any(step.needs_content for step in self.steps[:-1]):
+            raise UnsupportedPathError(
+                f"Predicates on children or text are only supported on the last "
+                f"step: {expression!r}"
+            )
+
+
+def _split_steps(path: str) -> typing.List[str]:
+    steps = []
+    current = []
+    brackets = 0
+    braces = 0
+    quote = None
+    for character in path:
+        if quote is not None:
+            if character == quote:
+                quote = None
+        elif character in "'\"" and brackets > 0:
+            quote = character
+        elif character == "[":
+            brackets += 1
+        elif character == "]":
+            brackets -= 1
+        elif character == "{":
+            braces += 1
+        elif character == "}":
+            braces -= 1
+        elif character == "/" and brackets == 0 and braces == 0:
+            steps.append("".join(current).strip())
+            current = []
+            continue
+        current.append(character)
+    steps.append("".join(current).strip())
+    return steps
+
+
+class _Frame:
+    """Parsing state of an element that has been opened but not yet closed"""
+
+    __slots__ = (
+        "tag",
+        "line",
+        "active",
+        "pending",
+        "child_counts",
+        "text_parts",
+        "children",
+    )
+    tag: str
+    # only known for elements whose content is needed
+    line: typing.Optional[int]
+    # (path index, step index) of the steps that children may match
+    active: typing.Set[typing.Tuple[int, int]]
+    # indexes of the paths that match this element if its content matches
+    pending: typing.List[int]
+    child_counts: typing.Dict[str, int]
+    # only collected for elements whose content is needed
+    text_parts: typing.Optional[typing.List[str]]
+    children: typing.Optional[typing.List[typing.Tuple[str, str]]]
+
+    def __init__(self, tag: str):
+        self.tag = tag
+        self.line = None
+        self.active = set()
+        self.pending = []
+        self.child_counts = {}
+        self.text_parts = None
+        self.children = None
+
+    @property
+    def full_text(self) -> str:
+        return "".join(self.text_parts) if self.text_parts is not None else ""
+
+
+# stands for elements that can neither match nor contribute to a match
+_INERT_FRAME = _Frame("")
+
+
+class _AllMatched(Exception):
+    pass
+
+
+class _Stopped(Exception):
+    pass
+
+
+FileMatches = typing.Tuple[
+    typing.Union[str, Path],
+    typing.Optional[typing.List[PathMatch]],
+    typing.Optional[str],
+]
+
+
+class XPathMatcher:
+    """Evaluates a set of XPath expressions over XML files
+
+    A matcher holds no state about the files it has matched, so the same one
+    may be used to match many files, from many threads at once.
+
+    """
+
+    expressions: typing.List[str]
+    _paths: typing.List[typing.Optional[_CompiledPath]]
+
+    def __init__(self, expressions: typing.Iterable[str]):
+        self.expressions = list(expressions)
+        self._paths = []
+        for expression in self.expressions:
+            try:
+                path = _CompiledPath(expression)
+            except UnsupportedPathError:
+                path = None
+            self._paths.append(path)
+
+    @property
+    def is_streamable(self) -> bool:
+        """Whether all expressions can be evaluated without loading the file"""
+        return all(path is not None for path in self._paths)
+
+    def match_file(
+        self,
+        path: typing.Union[str, Path],
+        should_stop: typing.Optional[typing.Callable[[], bool]] = None,
+    ) -> typing.List[PathMatch]:
+        """Return whether each of the expressions matches the input file
+
+        Results are in the same order as the expressions. ``should_stop`` is
+        called every now and then while parsing, returning True stops parsing
+        and expressions not matched so far are reported as not found.
+
+        """
+
+        with open(path, "rb") as fh:
+            matches = self._stream(fh, should_stop)
+        if not self.is_streamable and (should_stop is None or not should_stop()):
+            root = etree.parse(str(path)).getroot()
+            for index, compiled in enumerate(self._paths):
+                if compiled is None:
+                    matches[index].found = (
+                        root.find(self.expressions[index]) is not None
+                    )
+        return matches
+
+    def match_files(
+        self,
+        paths: typing.Sequence[typing.Union[str, Path]],
+        max_workers: int = 1,
+        should_stop: typing.Optional[typing.Callable[[], bool]] = None,
+    ) -> typing.Iterator[FileMatches]:
+        """Match many files, using a pool of threads
+
+        Yields the path, the matches and an error message for each file, in
+        the same order as ``paths``. Files that cannot be read or parsed have
+        no matches and an error message instead.
+
+        """
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [
+                executor.submit(self._match_file_safely, path, should_stop)
+                for path in paths
+            ]
+            try:
+                for path, future in zip(paths, futures):
+                    matches, error = future.result()
+                    yield path, matches, error
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def _match_file_safely(
+        self,
+        path: typing.Union[str, Path],
+        should_stop: typing.Optional[typing.Callable[[], bool]] = None,
+    ) -> typing.Tuple[typing.Optional[typing.List[PathMatch]], typing.Optional[str]]:
+        try:
+            result = self.match_file(path, should_stop), None
+        except (OSError, SyntaxError, expat.ExpatError) as exc:
+            result = None, str(exc)
+        return result
+
+    def _stream(
+        self,
+        source: typing.BinaryIO,
+        should_stop: typing.Optional[typing.Callable[[], bool]] = None,
+    ) -> typing.List[PathMatch]:
+        matches = [PathMatch(expression) for expression in self.expressions]
+        streamed = [
+            (index, compiled)
+            for index, compiled in enumerate(self._paths)
+            if compiled is not None
+        ]
+        remaining = len(streamed)
+        if remaining == 0:
+            return matches
+        steps = {index: compiled.steps for index, compiled in streamed}
+        needs_content = any(
+            step.needs_content for path_steps in steps.values() for step in path_steps
+        )
+        parser = expat.ParserCreate(namespace_separator="}")
+        parser.buffer_text = True
+        stack: typing.List[_Frame] = []
+        element_count = 0
+
+        def record(index: int, line: int):
+            nonlocal remaining
+            if not matches[index].found:
+                matches[index].found = True
+                matches[index].line = line
+                remaining -= 1
+                if remaining == 0:
+                    raise _AllMatched()
+
+        def start_element(name: str, attributes: typing.Dict[str, str]):
+            nonlocal element_count
+            element_count += 1
+            if (
+                should_stop is not None
+                and element_count % _STOP_CHECK_INTERVAL == 0
+                and should_stop()
+            ):
+                raise _Stopped()
+            if not stack:
+                frame = _Frame(name)
+                # expressions are relative to the root element
+                for index, path_steps in steps.items():
+                    if path_steps:
+                        frame.active.add((index, 0))
+                    else:
+                        record(index, parser.CurrentLineNumber)
+                stack.append(frame)
+                return
+            parent = stack[-1]
+            if not parent.active:
+                if parent.text_parts is None:
+                    stack.append(_INERT_FRAME)
+                else:
+                    frame = _Frame(name)
+                    frame.text_parts = []
+                    stack.append(frame)
+                return
+            frame = _Frame(name)
+            position = parent.child_counts.get(name, 0) + 1
+            parent.child_counts[name] = position
+            for index, step_index in parent.active:
+                if matches[index].found:
+                    continue
+                path_steps = steps[index]
+                step = path_steps[step_index]
+                if step.descendant:
+                    frame.active.add((index, step_index))
+                if not step.matches_start(name, attributes, position):
+                    continue
+                if step_index < len(path_steps) - 1:
+                    frame.active.add((index, step_index + 1))
+                elif step.needs_content:
+                    frame.pending.append(index)
+                else:
+                    record(index, parser.CurrentLineNumber)
+            if frame.pending:
+                frame.line = parser.CurrentLineNumber
+                frame.children = []
+                frame.text_parts = []
+            elif parent.text_parts is not None:
+                frame.text_parts = []
+            stack.append(frame)
+
+        def end_element(name: str):
+            frame = stack.pop()
+            for index in frame.pending:
+                if not matches[index].found and steps[index][-1].matches_content(frame):
+                    record(index, frame.line)
+            if stack:
+                parent = stack[-1]
+                if parent.text_parts is not None:
+                    parent.text_parts.append(frame.full_text)
+                if parent.children is not None:
+                    parent.children.append((frame.tag, frame.full_text))
+
+        def character_data(data: str):
+            if stack and stack[-1].text_parts is not None:
+                stack[-1].text_parts.append(data)
+
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        if needs_content:
+            parser.CharacterDataHandler = character_data
+        try:
+            parser.ParseFile(source)
+        except (_AllMatched, _Stopped):
+            pass
+        return matches
@@ -0,0 +1,342 @@
+import pytest
+from PyQt5.QtCore import Qt
+from qgis.core import QgsVectorLayer
+
+from dataset_qa_workbench.datasetqaworkbench import (
+    automation,
+    models,
+)
+from dataset_qa_workbench.datasetqaworkbench.constants import (
+    CheckStatus,
+    ErrorOutputMode,
+)
+from dataset_qa_workbench.processing_provider.algorithms.crschecker import (
+    CrsCheckerAlgorithm,
+)
+from dataset_qa_workbench.processing_provider.algorithms.xmlchecker import (
+    XmlCheckerAlgorithm,
+)
+
+
+def _create_algorithm(algorithm_class):
+    algorithm = algorithm_class()
+    algorithm.initAlgorithm({})
+    return algorithm
+
+
+class FakeAlgorithm:
+    def id(self):
+        return 'dataset_qa_workbench:fake'
+
+    def parameterDefinitions(self):
+        return []
+
+
+class FakeTask:
+    timings = None
+    outputs = None
+
+    def __init__(self, cancelled=False):
+        self.cancelled = cancelled
+
+    def isCanceled(self):
+        return self.cancelled
+
+
+@pytest.fixture()
+def checks_model(qgis_application):
+    checklist = models.CheckList.from_dict({
+        'name': 'sample',
+        'description': '',
+        'dataset_type': 'vector',
+        'validation_artifact_type': 'dataset',
+        'checks': [
+            {'name': f'check {i}', 'description': '', 'guide': ''}
+            for i in range(3)
+        ],
+    })
+    return models.CheckListItemsModel(checklist)
+
+
+@pytest.fixture()
+def create_automator(monkeypatch, checks_model):
+    monkeypatch.setattr(
+        automation.utils,
+        'get_processing_algorithm',
+        lambda algorithm_id: FakeAlgorithm(),
+    )
+    session = automation.ValidationSession(
+        'dataset.gpkg', error_output_mode=ErrorOutputMode.TEMPORARY
+    )
+
+    def factory(row):
+        return automation.ValidationStepAutomator(
+            'dataset_qa_workbench:fake',
+            'INPUT',
+            'OUTPUT',
+            False,
+            'dataset.gpkg',
+            checks_model,
+            row,
+            use_cache=False,
+            session=session,
+        )
+
+    return factory
+
+
+def test_cancelled_automation_leaves_check_pending(checks_model, create_automator):
+    automator = create_automator(0)
+    automator._task = FakeTask(cancelled=True)
+    automator.task_finished(False, {})
+    check = checks_model.checklist.checks[0]
+    assert check.status == CheckStatus.PENDING
+    assert check.validation_notes == 'Automated validation was cancelled'
+    assert check.automation_result is None
+
+
+def test_failed_automation_is_recorded_as_failure(checks_model, create_automator):
+    automator = create_automator(0)
+    automator._task = FakeTask()
+    automator.task_finished(False, {})
+    check = checks_model.checklist.checks[0]
+    assert check.status == CheckStatus.FAILED
+    assert check.automation_result is not None
+
+
+def test_session_opens_file_once(qgis_application, tmp_path):
+    dataset = tmp_path / 'points.geojson'
+    dataset.write_text(
+        '{"type": "FeatureCollection", "features": []}', encoding='utf-8'
+    )
+    session = automation.ValidationSession(dataset)
+    algorithm = _create_algorithm(CrsCheckerAlgorithm)
+    params = {'INPUT_LAYER': str(dataset)}
+    first = session.prepare_parameters(algorithm, 'INPUT_LAYER', params)
+    second = session.prepare_parameters(algorithm, 'INPUT_LAYER', params)
+    assert params == {'INPUT_LAYER': str(dataset)}
+    assert first['INPUT_LAYER'] is second['INPUT_LAYER']
+    layer_store = session.context.temporaryLayerStore()
+    assert first['INPUT_LAYER'].id() in layer_store.mapLayers()
+
+
+def test_session_clones_layer_for_concurrent_tasks(qgis_application, tmp_path):
+    dataset = tmp_path / 'points.geojson'
+    dataset.write_text(
+        '{"type": "FeatureCollection", "features": []}', encoding='utf-8'
+    )
+    session = automation.ValidationSession(dataset)
+    algorithm = _create_algorithm(CrsCheckerAlgorithm)
+    params = {'INPUT_LAYER': str(dataset)}
+    first_context = session.create_context()
+    second_context = session.create_context()
+    first = session.prepare_parameters(algorithm, 'INPUT_LAYER', params, first_context)
+    second = session.prepare_parameters(
+        algorithm, 'INPUT_LAYER', params, second_context
+    )
+    assert first['INPUT_LAYER'] is not second['INPUT_LAYER']
+    assert first['INPUT_LAYER'] is not session.layer
+    assert first['INPUT_LAYER'].id() in first_context.temporaryLayerStore().mapLayers()
+    assert second_context.temporaryLayerStore().count() == 1
+
+
+def test_session_keeps_file_parameters(qgis_application, tmp_path):
+    dataset = tmp_path / 'metadata.xml'
+    dataset.write_text('<root/>', encoding='utf-8')
+    session = automation.ValidationSession(dataset)
+    params = {'INPUT': str(dataset)}
+    result = session.prepare_parameters(
+        _create_algorithm(XmlCheckerAlgorithm), 'INPUT', params
+    )
+    assert result == params
+    assert session.context.temporaryLayerStore().count() == 0
+
+
+def test_session_uses_layers_as_they_are(qgis_application):
+    layer = QgsVectorLayer('Point?crs=EPSG:4326', 'points', 'memory')
+    session = automation.ValidationSession(layer)
+    assert session.layer is layer
+    result = session.prepare_parameters(
+        _create_algorithm(CrsCheckerAlgorithm), 'INPUT_LAYER', {'INPUT_LAYER': layer}
+    )
+    assert result['INPUT_LAYER'] is layer
+
+
+def test_dataset_watcher_debounces_layer_changes(qgis_application, qtbot):
+    layer = QgsVectorLayer('Point?crs=EPSG:4326', 'points', 'memory')
+    watcher = automation.DatasetWatcher(debounce_interval=10)
+    emitted = []
+    watcher.dataset_changed.connect(lambda: emitted.append(True))
+    watcher.watch(layer)
+    with qtbot.waitSignal(watcher.dataset_changed, timeout=1000):
+        layer.dataChanged.emit()
+        layer.dataChanged.emit()
+    assert emitted == [True]
+
+
+def test_dataset_watcher_forgets_previous_dataset(qgis_application, qtbot):
+    layer = QgsVectorLayer('Point?crs=EPSG:4326', 'points', 'memory')
+    watcher = automation.DatasetWatcher(debounce_interval=10)
+    emitted = []
+    watcher.dataset_changed.connect(lambda: emitted.append(True))
+    watcher.watch(layer)
+    watcher.watch(None)
+    layer.dataChanged.emit()
+    qtbot.wait(50)
+    assert emitted == []
+
+
+class FakeSignal:
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def emit(self, *args):
+        for slot in self.slots:
+            slot(*args)
+
+
+class FakeSchedulerTask:
+    def __init__(self):
+        self.executed = FakeSignal()
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeTaskManager:
+    def __init__(self):
+        self.tasks = []
+
+    def addTask(self, task):
+        self.tasks.append(task)
+
+
+class FakeAutomator:
+    def __init__(self, row, model=None):
+        self.row = row
+        self.model = model
+        self.last_result = None
+        self.task = None
+
+    def get_cached_results(self):
+        return None
+
+    def create_task(self):
+        self.task = FakeSchedulerTask()
+        return self.task
+
+    def finish(self, passed=True, successful=True):
+        self.last_result = passed if successful else None
+        self.task.executed.emit(successful, {})
+
+
+@pytest.fixture()
+def task_manager(monkeypatch):
+    manager = FakeTaskManager()
+
+    class FakeApplication:
+        @staticmethod
+        def taskManager():
+            return manager
+
+    monkeypatch.setattr(automation, 'QgsApplication', FakeApplication)
+    return manager
+
+
+@pytest.fixture()
+def scheduler_events():
+    events = {'progress': [], 'finished': [], 'skipped': [], 'all_finished': []}
+
+    def connect(scheduler):
+        scheduler.progress_changed.connect(
+            lambda *args: events['progress'].append(args)
+        )
+        scheduler.check_finished.connect(
+            lambda *args: events['finished'].append(args)
+        )
+        scheduler.check_skipped.connect(lambda row, _: events['skipped'].append(row))
+        scheduler.all_finished.connect(events['all_finished'].append)
+        return scheduler
+
+    events['connect'] = connect
+    return events
+
+
+def test_scheduler_runs_at_most_max_workers_at_a_time(task_manager, scheduler_events):
+    scheduler = scheduler_events['connect'](automation.AutomationScheduler(2))
+    automators = [FakeAutomator(row) for row in range(4)]
+    scheduler.submit(automators)
+    assert [a.task for a in automators[:2]] == task_manager.tasks
+    assert automators[2].task is None
+    assert scheduler.is_scheduled(3)
+    automators[0].finish()
+    assert len(task_manager.tasks) == 3
+    for automator in automators[1:]:
+        automator.finish(passed=False)
+    assert not scheduler.is_running
+    assert not scheduler.is_scheduled(3)
+    assert scheduler_events['progress'][0] == (0, 4)
+    assert scheduler_events['progress'][-1] == (4, 4)
+    assert len(scheduler_events['finished']) == 4
+    assert scheduler_events['all_finished'] == [True]
+
+
+def test_scheduler_cancel_drops_queued_checks(task_manager, scheduler_events):
+    scheduler = scheduler_events['connect'](automation.AutomationScheduler(1))
+    automators = [FakeAutomator(row) for row in range(3)]
+    scheduler.submit(automators)
+    scheduler.cancel()
+    assert automators[0].task.cancelled
+    assert scheduler_events['progress'][-1] == (2, 3)
+    assert scheduler_events['all_finished'] == []
+    automators[0].finish(successful=False)
+    assert len(task_manager.tasks) == 1
+    assert scheduler_events['progress'][-1] == (3, 3)
+    assert scheduler_events['all_finished'] == [False]
+
+
+def test_scheduler_skips_checks_whose_dependencies_did_not_pass(
+    task_manager, scheduler_events
+):
+    scheduler = scheduler_events['connect'](automation.AutomationScheduler(4))
+    automators = [FakeAutomator(row) for row in range(3)]
+    scheduler.submit(automators, {0: set(), 1: {0}, 2: {1}})
+    assert automators[1].task is None
+    automators[0].finish(passed=False)
+    assert scheduler_events['skipped'] == [1, 2]
+    assert automators[2].task is None
+    assert scheduler_events['progress'][-1] == (3, 3)
+    assert scheduler_events['all_finished'] == [True]
+
+
+def test_scheduler_judges_other_dependencies_by_their_status(
+    task_manager, scheduler_events, checks_model
+):
+    scheduler = scheduler_events['connect'](automation.AutomationScheduler(4))
+    automator = FakeAutomator(0, checks_model)
+    # check 2 is not part of the runs
+    checks_model.set_check_result(2, validated=Qt.Checked)
+    scheduler.submit([automator], {0: {2}})
+    assert automator.task is not None
+    automator.finish()
+    checks_model.set_check_result(2, validated=Qt.Unchecked, evaluated=False)
+    scheduler.submit([automator], {0: {2}})
+    assert scheduler_events['skipped'] == [0]
+    assert scheduler_events['all_finished'] == [True, True]
+
+
+def test_scheduler_fail_fast_cancels_other_checks(task_manager, scheduler_events):
+    scheduler = scheduler_events['connect'](
+        automation.AutomationScheduler(2, fail_fast=True)
+    )
+    automators = [FakeAutomator(row) for row in range(3)]
+    scheduler.submit(automators)
+    automators[0].finish(passed=False)
+    assert automators[1].task.cancelled
+    assert automators[2].task is None
+    automators[1].finish(successful=False)
+    assert scheduler_events['all_finished'] == [False]
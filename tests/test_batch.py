@@ -0,0 +1,79 @@
+import csv
+from pathlib import Path
+
+from dataset_qa_workbench.datasetqaworkbench import batch
+
+
+def test_expand_datasets_accepts_paths_and_globs(tmp_path):
+    for name in ('a.gpkg', 'b.gpkg', 'c.shp', 'a_qa_errors.gpkg'):
+        (tmp_path / name).write_bytes(b'')
+    (tmp_path / 'nested').mkdir()
+    (tmp_path / 'nested' / 'd.gpkg').write_bytes(b'')
+    datasets = batch.expand_datasets(
+        [
+            str(tmp_path / 'c.shp'),
+            str(tmp_path / '**' / '*.gpkg'),
+            '',
+            str(tmp_path / 'a.gpkg'),
+        ]
+    )
+    assert [p.relative_to(tmp_path.resolve()).as_posix() for p in datasets] == [
+        'c.shp',
+        'a.gpkg',
+        'b.gpkg',
+        'nested/d.gpkg',
+    ]
+
+
+def test_summary_table_includes_failed_datasets(tmp_path):
+    report = {
+        'dataset_is_valid': False,
+        'summary': {'total': 3, 'passed': 1, 'failed': 1, 'pending': 1},
+    }
+    results = [
+        batch.BatchResult(tmp_path / 'a.gpkg', report, tmp_path / 'a-report.json'),
+        batch.BatchResult(tmp_path / 'b.gpkg', error='cannot read'),
+    ]
+    summary_path = tmp_path / batch.SUMMARY_FILE_NAME
+    batch.write_summary(results, summary_path)
+    with summary_path.open(encoding='utf-8') as fh:
+        rows = list(csv.DictReader(fh))
+    assert [row['passed'] for row in rows] == ['1', '']
+    assert rows[0]['dataset_is_valid'] == 'False'
+    assert rows[1]['error'] == 'cannot read'
+
+
+def test_report_names_are_unique():
+    used_names = set()
+    names = [
+        batch._get_unique_name(Path(p), used_names)
+        for p in ('/a/roads.gpkg', '/b/roads.gpkg', '/c/rivers.gpkg')
+    ]
+    assert names == ['roads-report.json', 'roads-report-2.json', 'rivers-report.json']
+
+
+def test_run_batch_writes_reports_and_summary(tmp_path, monkeypatch):
+    checklist_path = tmp_path / 'checklist.json'
+    checklist_path.write_text('{"name": "sample"}', encoding='utf-8')
+    for name in ('a.gpkg', 'b.gpkg'):
+        (tmp_path / name).write_bytes(b'')
+
+    def fake_validate_dataset(raw_checklist, dataset, **kwargs):
+        if dataset.name == 'b.gpkg':
+            raise ValueError('broken dataset')
+        return {
+            'dataset_is_valid': True,
+            'summary': {'total': 1, 'passed': 1, 'failed': 0, 'pending': 0},
+        }
+
+    monkeypatch.setattr(batch, 'validate_dataset', fake_validate_dataset)
+    output_dir = tmp_path / 'reports'
+    results = batch.run_batch(
+        checklist_path, [str(tmp_path / '*.gpkg')], output_dir
+    )
+    assert [r.dataset.name for r in results] == ['a.gpkg', 'b.gpkg']
+    assert results[0].is_valid
+    assert results[0].report_path == output_dir / 'a-report.json'
+    assert results[0].report_path.is_file()
+    assert results[1].error == 'broken dataset'
+    assert (output_dir / batch.SUMMARY_FILE_NAME).is_file()
@@ -0,0 +1,134 @@
+import json
+import os
+import threading
+
+import pytest
+
+from dataset_qa_workbench.datasetqaworkbench import catalog
+
+
+def _write_checklist(path, name, num_checks=1):
+    contents = {
+        'name': name,
+        'description': f'{name} description',
+        'dataset_type': 'vector',
+        'validation_artifact_type': 'dataset',
+        'checks': [
+            {'name': f'check {i}', 'description': '', 'guide': ''}
+            for i in range(num_checks)
+        ],
+    }
+    path.write_text(json.dumps(contents), encoding='utf-8')
+
+
+@pytest.fixture()
+def checklists_dir(tmp_path):
+    directory = tmp_path / 'checklists'
+    directory.mkdir()
+    _write_checklist(directory / 'first.json', 'first', num_checks=3)
+    _write_checklist(directory / 'second.json', 'second')
+    return directory
+
+
+def test_refresh_indexes_checklist_headers(checklists_dir, tmp_path):
+    index_path = tmp_path / 'index.json'
+    cat = catalog.ChecklistCatalog(checklists_dir, index_path)
+    errors = cat.refresh()
+    assert errors == []
+    assert [e.name for e in cat] == ['first', 'second']
+    assert [e.check_count for e in cat] == [3, 1]
+
+
+def test_refresh_reports_invalid_files(checklists_dir, tmp_path):
+    (checklists_dir / 'broken.json').write_text('{not json', encoding='utf-8')
+    cat = catalog.ChecklistCatalog(checklists_dir, tmp_path / 'index.json')
+    errors = cat.refresh()
+    assert [path.name for path, _ in errors] == ['broken.json']
+    assert len(cat) == 2
+
+
+def test_index_is_reused_for_unchanged_files(checklists_dir, tmp_path, monkeypatch):
+    index_path = tmp_path / 'index.json'
+    cat = catalog.ChecklistCatalog(checklists_dir, index_path)
+    cat.refresh()
+    cat.save_index()
+    assert index_path.is_file()
+
+    changed = checklists_dir / 'second.json'
+    _write_checklist(changed, 'second, renamed')
+    stat_result = changed.stat()
+    os.utime(changed, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10))
+    (checklists_dir / 'first.json').unlink()
+
+    reloaded = catalog.ChecklistCatalog(checklists_dir, index_path)
+    reloaded.load_index()
+    parsed = []
+    original_from_file = catalog.ChecklistCatalogEntry.from_file
+
+    def tracking_from_file(path, stat_result=None):
+        parsed.append(path.name)
+        return original_from_file(path, stat_result)
+
+    monkeypatch.setattr(
+        catalog.ChecklistCatalogEntry, 'from_file', staticmethod(tracking_from_file)
+    )
+    reloaded.refresh()
+    assert parsed == ['second.json']
+    assert [e.name for e in reloaded] == ['second, renamed']
+
+
+def test_entry_loads_lazy_checklist(checklists_dir, tmp_path):
+    cat = catalog.ChecklistCatalog(checklists_dir, tmp_path / 'index.json')
+    cat.refresh()
+    entry = next(iter(cat))
+    checklist = entry.load_checklist()
+    assert checklist.name == 'first'
+    assert not checklist.checks_loaded
+    assert len(checklist.checks) == entry.check_count
+
+
+def test_scan_yields_every_file_once(checklists_dir, tmp_path):
+    (checklists_dir / 'broken.json').write_text('[]', encoding='utf-8')
+    cat = catalog.ChecklistCatalog(checklists_dir, tmp_path / 'index.json')
+    results = {path.name: (entry, error) for path, entry, error in cat.scan()}
+    assert sorted(results) == ['broken.json', 'first.json', 'second.json']
+    assert results['first.json'][0].name == 'first'
+    assert results['broken.json'][0] is None
+    assert results['broken.json'][1] is not None
+
+
+def test_entry_updates_lazy_checklist_in_place(checklists_dir, tmp_path):
+    cat = catalog.ChecklistCatalog(checklists_dir, tmp_path / 'index.json')
+    cat.refresh()
+    checklist = next(iter(cat)).load_checklist()
+    _write_checklist(checklists_dir / 'first.json', 'first, renamed', num_checks=5)
+    cat.update_file(checklists_dir / 'first.json')
+    updated_entry = next(iter(cat))
+    assert updated_entry.update_checklist(checklist)
+    assert checklist.name == 'first, renamed'
+    assert len(checklist.checks) == 5
+    assert not updated_entry.update_checklist(checklist)
+
+
+def test_index_can_be_saved_from_several_threads(checklists_dir, tmp_path, monkeypatch):
+    warnings = []
+    monkeypatch.setattr(
+        catalog.utils, 'log_message', lambda *args, **kwargs: warnings.append(args)
+    )
+    index_path = tmp_path / 'index.json'
+    cat = catalog.ChecklistCatalog(checklists_dir, index_path)
+    cat.refresh()
+
+    def save():
+        for _ in range(20):
+            cat.save_index(force=True)
+
+    threads = [threading.Thread(target=save) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert warnings == []
+    reloaded = catalog.ChecklistCatalog(checklists_dir, index_path)
+    reloaded.load_index()
+    assert [e.name for e in reloaded] == ['first', 'second']
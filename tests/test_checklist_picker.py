@@ -1,7 +1,10 @@
 import pytest
 from PyQt5 import QtGui
 
-from dataset_qa_workbench.datasetqaworkbench import checklist_picker
+from dataset_qa_workbench.datasetqaworkbench import (
+    catalog,
+    checklist_picker,
+)
 
 
 @pytest.mark.parametrize('button_type, expected', [
@@ -19,3 +22,18 @@ def test_selecting_a_checklist_enables_ok_button(iface, qtbot):
     print(f'num_checklists: {picker.checklists_tv.model().rowCount()}')
     picker.show()
     qtbot.addWidget(picker)
+
+
+def test_closing_the_picker_stops_watching_checklists(iface, tmp_path):
+    directory = tmp_path / 'checklists'
+    directory.mkdir()
+    checklist_catalog = catalog.ChecklistCatalog(directory, tmp_path / 'index.json')
+    watcher = catalog.ChecklistsDirectoryWatcher(checklist_catalog)
+    picker = checklist_picker.ChecklistPicker(
+        iface, checklist_catalog=checklist_catalog, watcher=watcher
+    )
+    assert watcher.receivers(watcher.checklist_added) == 1
+    picker.reject()
+    assert picker.watcher is None
+    assert watcher.receivers(watcher.checklist_added) == 0
+    assert watcher.receivers(watcher.checklist_removed) == 0
@@ -0,0 +1,62 @@
+from dataset_qa_workbench.datasetqaworkbench import error_outputs
+from dataset_qa_workbench.datasetqaworkbench.constants import ErrorOutputMode
+
+
+def test_persistent_path_is_next_to_the_dataset(tmp_path):
+    dataset = tmp_path / 'roads.gpkg'
+    dataset.write_bytes(b'')
+    expected = tmp_path / 'roads_qa_errors.gpkg'
+    assert error_outputs.get_persistent_path(dataset) == expected
+
+    class FakeLayer:
+        def source(self):
+            return f'{dataset}|layername=roads'
+
+    assert error_outputs.get_persistent_path(FakeLayer()) == expected
+    assert error_outputs.get_persistent_path(tmp_path / 'missing.gpkg') is None
+    assert error_outputs.get_persistent_path(object()) is None
+
+
+def test_table_names_are_safe_identifiers():
+    name = error_outputs.get_table_name('Geometries are valid (OGC)', 'OUTPUT')
+    assert name == 'geometries_are_valid_ogc_output'
+    assert error_outputs.get_table_name('', '') == 'errors'
+
+
+def test_persistent_outputs_need_a_file_dataset(tmp_path):
+    outputs = error_outputs.ErrorOutputs.for_dataset(
+        ErrorOutputMode.PERSISTENT, tmp_path / 'missing.gpkg', 'check'
+    )
+    assert outputs.mode == ErrorOutputMode.TEMPORARY
+    assert outputs.path is None
+
+
+def test_written_locations_only_include_produced_outputs():
+    outputs = error_outputs.ErrorOutputs()
+    outputs.locations = {'ERRORS': '/tmp/errors.gpkg', 'SKIPPED': '/tmp/skipped.gpkg'}
+    assert outputs.get_written_locations({'ERRORS': 'layer_id', 'SKIPPED': None}) == {
+        'ERRORS': '/tmp/errors.gpkg'
+    }
+
+
+def test_only_outputs_written_to_the_same_geopackage_wait_for_each_other(tmp_path):
+    dataset = tmp_path / 'roads.gpkg'
+    dataset.write_bytes(b'')
+    first, second, without_sinks = (
+        error_outputs.ErrorOutputs.for_dataset(
+            ErrorOutputMode.PERSISTENT, dataset, name
+        )
+        for name in ('first', 'second', 'crs')
+    )
+    errors_path = tmp_path / 'roads_qa_errors.gpkg'
+    first.locations = {'OUTPUT': f'{errors_path}|layername=first_output'}
+    second.locations = {'OUTPUT': f'{errors_path}|layername=second_output'}
+    without_sinks.locations = {'RASTER': '/tmp/output.tif'}
+    assert first.writing() is second.writing()
+    with first.writing():
+        assert not second.writing().acquire(blocking=False)
+        with without_sinks.writing():
+            pass
+    temporary = error_outputs.ErrorOutputs(ErrorOutputMode.TEMPORARY, 'first')
+    with temporary.writing(), error_outputs.ErrorOutputs().writing():
+        pass
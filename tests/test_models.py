@@ -0,0 +1,242 @@
+import pytest
+from PyQt5.QtCore import Qt
+
+from dataset_qa_workbench.datasetqaworkbench import models
+from dataset_qa_workbench.datasetqaworkbench.constants import (
+    AutomationStatus,
+    CheckStatus,
+)
+
+
+@pytest.fixture()
+def raw_checklist():
+    return {
+        'name': 'sample',
+        'description': 'a sample checklist',
+        'dataset_type': 'vector',
+        'validation_artifact_type': 'dataset',
+        'checks': [
+            {'name': f'check {i}', 'description': f'd{i}', 'guide': f'g{i}'}
+            for i in range(3)
+        ],
+    }
+
+
+def test_lazy_checklist_defers_parsing_checks(raw_checklist):
+    checklist = models.CheckList.from_dict(raw_checklist, lazy=True)
+    assert not checklist.checks_loaded
+    assert [c.name for c in checklist.checks] == ['check 0', 'check 1', 'check 2']
+    assert checklist.checks_loaded
+
+
+def test_lazy_checklist_serializes_like_eager_one(raw_checklist):
+    lazy = models.CheckList.from_dict(raw_checklist, lazy=True)
+    eager = models.CheckList.from_dict(raw_checklist)
+    assert lazy.to_dict() == eager.to_dict()
+
+
+def test_checklist_item_head_exposes_its_properties(raw_checklist):
+    raw_check = dict(raw_checklist['checks'][0])
+    raw_check['automation'] = {'algorithm_id': 'dataset_qa_workbench:crschecker'}
+    head = models.ChecklistItemHead.from_dict(raw_check)
+    assert head.description == 'd0'
+    assert head.guide == 'g0'
+    assert head.automation.algorithm_id == 'dataset_qa_workbench:crschecker'
+    assert head.validation_notes == ''
+    head.validation_notes = 'some notes'
+    assert head.check_properties[-1].value == 'some notes'
+    with pytest.raises(AttributeError):
+        head.unknown_attribute = True
+
+
+def test_head_node_creates_property_nodes_on_demand(raw_checklist):
+    checklist = models.CheckList.from_dict(raw_checklist)
+    node = models.ChecklistItemHeadNode(checklist.checks[0], None, 0)
+    assert node.child_count() == 4
+    assert not node.is_materialized(2)
+    property_node = node.child(2)
+    assert node.is_materialized(2)
+    assert not node.is_materialized(0)
+    assert node.child(2) is property_node
+    assert property_node.parent is node
+    assert property_node.child_count() == 0
+
+
+@pytest.mark.parametrize(
+    'rows, expected',
+    [
+        ([], []),
+        ([3], [(3, 3)]),
+        ([4, 0, 1, 2, 6, 7, 2], [(0, 2), (4, 4), (6, 7)]),
+    ],
+)
+def test_contiguous_ranges(rows, expected):
+    assert models.contiguous_ranges(rows) == expected
+
+
+def test_check_status_distinguishes_failed_from_pending(raw_checklist):
+    check = models.CheckList.from_dict(raw_checklist).checks[0]
+    assert check.status == CheckStatus.PENDING
+    check.evaluated = True
+    assert check.status == CheckStatus.FAILED
+    check.validated = Qt.Checked
+    assert check.status == CheckStatus.PASSED
+
+
+def test_checklist_summary_derives_pending_and_manual():
+    summary = models.ChecklistSummary(total=10, passed=4, failed=1, automated=3)
+    assert summary.to_dict() == {
+        'total': 10,
+        'passed': 4,
+        'failed': 1,
+        'pending': 5,
+        'automated': 3,
+        'manual': 7,
+    }
+    assert not summary.is_valid
+    assert models.ChecklistSummary(2, 2, 0, 0).is_valid
+
+
+def _automated_check(name, depends_on=None):
+    automation = {'algorithm_id': 'dataset_qa_workbench:crschecker'}
+    if depends_on is not None:
+        automation['depends_on'] = depends_on
+    return {'name': name, 'description': '', 'guide': '', 'automation': automation}
+
+
+def test_automation_dependencies_are_resolved_by_name(raw_checklist):
+    raw_checklist['checks'] = [
+        _automated_check('crs'),
+        {'name': 'manual', 'description': '', 'guide': ''},
+        _automated_check('validity', depends_on=['crs', 'manual']),
+    ]
+    checklist = models.CheckList.from_dict(raw_checklist)
+    assert models.get_automation_dependencies(checklist.checks) == {
+        0: set(),
+        2: {0, 1},
+    }
+    assert checklist.checks[2].automation.to_dict()['depends_on'] == [
+        'crs',
+        'manual',
+    ]
+
+
+@pytest.mark.parametrize(
+    'checks',
+    [
+        [_automated_check('a', depends_on=['missing'])],
+        [_automated_check('a', depends_on=['b']), _automated_check('b', ['a'])],
+    ],
+)
+def test_invalid_automation_dependencies_are_rejected(raw_checklist, checks):
+    raw_checklist['checks'] = checks
+    checklist = models.CheckList.from_dict(raw_checklist)
+    with pytest.raises(ValueError):
+        models.get_automation_dependencies(checklist.checks)
+
+
+def test_automation_order_puts_dependencies_first():
+    dependencies = {0: {3}, 1: set(), 3: {1}, 4: {0, 9}}
+    assert models.get_automation_order(dependencies) == [1, 3, 0, 4]
+
+
+def test_sort_by_cost_puts_slowest_checks_first(qgis_application, raw_checklist):
+    checklist = models.CheckList.from_dict(raw_checklist)
+    checklist.checks[0].timings = models.CheckTimings(wall_time=1.0)
+    checklist.checks[2].timings = models.CheckTimings(wall_time=5.0)
+    model = models.CheckListItemsModel(checklist)
+    model.sort_by_cost()
+    assert [model.check_row(row) for row in range(3)] == [2, 0, 1]
+    assert [model.view_row(row) for row in range(3)] == [1, 2, 0]
+    assert model.root_node(0).ref is checklist.checks[2]
+    model.sort_by_cost(False)
+    assert [model.check_row(row) for row in range(3)] == [0, 1, 2]
+    assert model.root_node(0).ref is checklist.checks[0]
+
+
+def test_automation_result_keeps_only_capped_plain_outputs():
+    outputs = {
+        'OUTPUT': False,
+        'LAYER': object(),
+        'DESCRIPTION': 'x' * 1000,
+    }
+    outputs.update({f'COUNT_{i}': i for i in range(20)})
+    result = models.AutomationResult.from_outputs(False, outputs, 'OUTPUT', 1.23456)
+    assert result.status == AutomationStatus.FAILED
+    assert result.output_value is False
+    assert 'LAYER' not in result.outputs
+    assert len(result.outputs) == models.MAX_AUTOMATION_OUTPUTS
+    assert len(result.outputs['DESCRIPTION']) == models.MAX_AUTOMATION_VALUE_LENGTH
+    serialized = result.to_dict()
+    assert serialized['status'] == 'failed'
+    assert serialized['output'] == {'OUTPUT': False}
+    assert serialized['duration'] == 1.235
+    assert 'errors' not in serialized
+
+
+def test_automation_result_notes_are_short():
+    passed = models.AutomationResult.from_outputs(True, {'OUTPUT': True}, 'OUTPUT')
+    assert passed.notes == 'Automated validation succeeded'
+    error = models.AutomationResult.from_error('OUTPUT', 'layer not found')
+    assert error.notes == 'Automated validation could not run: layer not found'
+    assert error.to_dict() == {
+        'status': 'error',
+        'output': {'OUTPUT': None},
+        'errors': ['layer not found'],
+    }
+
+
+def test_changing_check_result_discards_automation_result(qgis_application, raw_checklist):
+    model = models.CheckListItemsModel(models.CheckList.from_dict(raw_checklist))
+    automation_result = models.AutomationResult.from_outputs(True, {'OUTPUT': True}, 'OUTPUT')
+    model.set_check_result(0, validated=Qt.Checked, automation_result=automation_result)
+    assert model.checklist.checks[0].automation_result is automation_result
+    model.set_check_result(0, validated=Qt.Unchecked, evaluated=False)
+    assert model.checklist.checks[0].automation_result is None
+
+
+def test_text_width_falls_back_on_older_qt():
+    class OldFontMetrics:
+        def width(self, text):
+            return 7 * len(text)
+
+    assert models._get_text_width(OldFontMetrics(), 'Run') == 21
+
+
+def test_bulk_update_keeps_counters_and_emits_summary_once(
+    qgis_application, raw_checklist
+):
+    model = models.CheckListItemsModel(models.CheckList.from_dict(raw_checklist))
+    summaries = []
+    model.summaryChanged.connect(summaries.append)
+    with model.bulk_update():
+        model.set_check_result(0, validated=Qt.Checked)
+        model.set_check_result(1, validated=Qt.Unchecked, evaluated=True)
+        model.set_check_result(2, validated=Qt.Checked)
+        assert summaries == []
+    assert len(summaries) == 1
+    assert summaries[0].to_dict() == model.summary().to_dict()
+    assert (model.summary().passed, model.summary().failed) == (2, 1)
+    assert not model.result
+    model.set_check_result(1, validated=Qt.Checked)
+    assert len(summaries) == 2
+    assert model.result
+    # changing only the notes does not change the summary
+    model.set_check_result(1, notes='checked by hand')
+    assert len(summaries) == 2
+
+
+def test_bulk_update_batches_data_changed_of_contiguous_rows(
+    qgis_application, raw_checklist
+):
+    model = models.CheckListItemsModel(models.CheckList.from_dict(raw_checklist))
+    changed = []
+    model.dataChanged.connect(
+        lambda first, last, roles: changed.append((first.row(), last.row()))
+    )
+    with model.bulk_update():
+        for row in range(3):
+            model.setData(model.index(row, 1), Qt.Checked, Qt.CheckStateRole)
+    assert changed == [(0, 2)]
+    assert model.summary().passed == 3
+    assert model.result
@@ -0,0 +1,31 @@
+import pytest
+from qgis.core import QgsExpressionContextUtils
+
+from dataset_qa_workbench.processing_provider.algorithms import base
+
+
+def test_compiled_expressions_are_reused(qgis_application):
+    first, first_context = base.get_compiled_expression('1 + 1')
+    second, second_context = base.get_compiled_expression('1 + 1')
+    assert first is second
+    assert first_context is second_context
+    assert base.parse_as_expression('1 + 1') == 2
+
+
+def test_compiled_expressions_follow_global_variables(qgis_application):
+    name = 'dataset_qa_workbench_test_value'
+    QgsExpressionContextUtils.setGlobalVariable(name, 'first')
+    try:
+        assert base.parse_as_expression(f'@{name}') == 'first'
+        QgsExpressionContextUtils.setGlobalVariable(name, 'second')
+        assert base.parse_as_expression(f'@{name}') == 'second'
+    finally:
+        QgsExpressionContextUtils.removeGlobalVariable(name)
+    assert base.parse_as_expression(f'@{name}', default='missing') == 'missing'
+
+
+def test_invalid_expressions_are_not_cached(qgis_application):
+    with pytest.raises(RuntimeError):
+        base.parse_as_expression('1 +')
+    with pytest.raises(RuntimeError):
+        base.parse_as_expression('1 +')
@@ -0,0 +1,50 @@
+from dataset_qa_workbench.datasetqaworkbench import (
+    models,
+    report,
+)
+
+
+def _build_checklist():
+    return models.CheckList.from_dict(
+        {
+            'name': 'sample',
+            'dataset_type': 'vector',
+            'validation_artifact_type': 'dataset',
+            'checks': [
+                {'name': 'fast', 'description': '', 'guide': ''},
+                {'name': 'untimed', 'description': '', 'guide': ''},
+            ],
+        }
+    )
+
+
+def test_report_has_no_timings_by_default(qgis_application):
+    contents = report.build_report_contents(_build_checklist(), 'dataset.gpkg')
+    assert 'timings' not in contents
+
+
+def test_report_includes_timings_of_timed_checks(qgis_application):
+    checklist = _build_checklist()
+    checklist.checks[0].timings = models.CheckTimings(wall_time=1.23456, cpu_time=1.0)
+    contents = report.build_report_contents(
+        checklist, 'dataset.gpkg', dataset_open_time=0.5
+    )
+    assert contents['timings'] == {
+        'dataset_open_time': 0.5,
+        'checks': [
+            {'name': 'fast', 'wall_time': 1.235, 'cpu_time': 1.0}
+        ],
+    }
+
+
+def test_report_includes_automation_results(qgis_application):
+    checklist = _build_checklist()
+    checklist.checks[0].automation_result = models.AutomationResult.from_outputs(
+        True, {'OUTPUT': True, 'LAYER': object()}, 'OUTPUT'
+    )
+    contents = report.build_report_contents(checklist, 'dataset.gpkg')
+    assert contents['checks'][0]['automation'] == {
+        'status': 'passed',
+        'output': {'OUTPUT': True},
+    }
+    assert 'automation' not in contents['checks'][1]
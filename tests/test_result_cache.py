@@ -0,0 +1,102 @@
+import os
+import threading
+
+import pytest
+
+from dataset_qa_workbench.datasetqaworkbench import result_cache
+
+
+def test_fingerprint_changes_with_the_file(tmp_path):
+    dataset = tmp_path / 'dataset.gpkg'
+    dataset.write_bytes(b'first')
+    fingerprint = result_cache.dataset_fingerprint(dataset)
+    assert fingerprint == result_cache.dataset_fingerprint(str(dataset))
+    stat_result = dataset.stat()
+    os.utime(dataset, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10))
+    assert result_cache.dataset_fingerprint(dataset) != fingerprint
+    assert result_cache.dataset_fingerprint(tmp_path / 'missing.gpkg') is None
+
+
+@pytest.mark.parametrize('dataset_name, sidecar_name', [
+    pytest.param('roads.shp', 'roads.dbf'),
+    pytest.param('roads.gpkg', 'roads.gpkg-wal'),
+])
+def test_fingerprint_changes_with_sidecar_files(tmp_path, dataset_name, sidecar_name):
+    dataset = tmp_path / dataset_name
+    dataset.write_bytes(b'geometries')
+    sidecar = tmp_path / sidecar_name
+    sidecar.write_bytes(b'first')
+    fingerprint = result_cache.dataset_fingerprint(dataset)
+    sidecar.write_bytes(b'second, longer')
+    assert result_cache.dataset_fingerprint(dataset) != fingerprint
+
+
+def test_fingerprint_ignores_sqlite_shared_memory_files(tmp_path):
+    dataset = tmp_path / 'roads.gpkg'
+    dataset.write_bytes(b'contents')
+    fingerprint = result_cache.dataset_fingerprint(dataset)
+    (tmp_path / 'roads.gpkg-shm').write_bytes(b'index')
+    (tmp_path / 'roads_other.gpkg').write_bytes(b'unrelated')
+    assert result_cache.dataset_fingerprint(dataset) == fingerprint
+
+
+def test_fingerprint_of_layers(tmp_path):
+    dataset = tmp_path / 'dataset.gpkg'
+    dataset.write_bytes(b'contents')
+
+    class FakeLayer:
+        modified = False
+
+        def source(self):
+            return f'{dataset}|layername=roads'
+
+        def providerType(self):
+            return 'ogr'
+
+        def isModified(self):
+            return self.modified
+
+    layer = FakeLayer()
+    assert 'layername=roads' in result_cache.dataset_fingerprint(layer)
+    layer.modified = True
+    assert result_cache.dataset_fingerprint(layer) is None
+
+
+def test_cache_key_ignores_parameter_order():
+    first = result_cache.make_cache_key('p:alg', {'a': 1, 'b': 'x'}, 'fp')
+    second = result_cache.make_cache_key('p:alg', {'b': 'x', 'a': 1}, 'fp')
+    assert first == second
+    assert first != result_cache.make_cache_key('p:alg', {'a': 2, 'b': 'x'}, 'fp')
+
+
+def test_cache_stores_plain_results_and_evicts_least_recently_used(
+    tmp_path, monkeypatch
+):
+    clock = iter(range(100))
+    monkeypatch.setattr(result_cache.time, 'time', lambda: next(clock))
+    cache = result_cache.AutomationResultCache(tmp_path / 'cache.sqlite', 2)
+    cache.put('first', 'p:alg', {'OUTPUT': True, 'LAYER': object()})
+    cache.put('second', 'p:alg', {'OUTPUT': 3})
+    assert cache.get('first') == {'OUTPUT': True}
+    cache.put('third', 'p:alg', {'OUTPUT': None})
+    assert len(cache) == 2
+    assert cache.get('second') is None
+    assert cache.get('first') == {'OUTPUT': True}
+    cache.close()
+
+
+def test_cache_can_be_used_from_other_threads(tmp_path):
+    cache = result_cache.AutomationResultCache(tmp_path / 'cache.sqlite')
+    cache.put('first', 'p:alg', {'OUTPUT': True})
+    found = []
+    thread = threading.Thread(
+        target=lambda: (
+            cache.put('second', 'p:alg', {'OUTPUT': False}),
+            found.append(cache.get('first')),
+        )
+    )
+    thread.start()
+    thread.join()
+    assert found == [{'OUTPUT': True}]
+    assert cache.get('second') == {'OUTPUT': False}
+    cache.close()
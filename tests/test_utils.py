@@ -24,3 +24,135 @@ def test_get_checklists_dir(qgis_application):
 ])
 def test_match_maplayer_type(maplayer_type, expected):
     assert utils.match_maplayer_type(maplayer_type) == expected
+
+
+class FakeSignal:
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def disconnect(self, slot):
+        self.slots.remove(slot)
+
+    def emit(self, *args):
+        for slot in list(self.slots):
+            slot(*args)
+
+
+class FakeRegistry:
+    def __init__(self):
+        self.providerAdded = FakeSignal()
+        self.providerRemoved = FakeSignal()
+        self.created = []
+
+    def createAlgorithmById(self, algorithm_id):
+        if algorithm_id.startswith('missing'):
+            return None
+        self.created.append(algorithm_id)
+        return object()
+
+
+def test_algorithm_prototype_cache_reuses_algorithms():
+    registry = FakeRegistry()
+    cache = utils.AlgorithmPrototypeCache(registry)
+    first = cache.get('provider:first')
+    assert cache.get('provider:first') is first
+    assert cache.get('missing:algorithm') is None
+    assert cache.get('missing:algorithm') is None
+    assert registry.created == ['provider:first']
+    assert len(registry.providerAdded.slots) == 1
+
+
+def test_algorithm_prototype_cache_is_invalidated_by_registry_changes():
+    registry = FakeRegistry()
+    cache = utils.AlgorithmPrototypeCache(registry)
+    first = cache.get('provider:first')
+    registry.providerRemoved.emit('provider')
+    assert len(cache) == 0
+    assert cache.get('provider:first') is not first
+    registry.providerAdded.emit('other')
+    assert len(cache) == 0
+    cache.close()
+    assert registry.providerAdded.slots == []
+    assert registry.providerRemoved.slots == []
+
+
+class RecordingMessageLog:
+    def __init__(self):
+        self.messages = []
+
+    def logMessage(self, text, tag, level=None):
+        self.messages.append(text)
+
+
+class ActiveTimer:
+    def isActive(self):
+        return True
+
+
+@pytest.fixture()
+def message_log(monkeypatch):
+    recorder = RecordingMessageLog()
+    monkeypatch.setattr(utils, 'QgsMessageLog', recorder)
+    monkeypatch.setattr(utils, '_is_main_thread', lambda: True)
+    log = utils.BufferedMessageLog()
+    log._threshold = utils.LOG_LEVELS['info']
+    log._timer = ActiveTimer()
+    return log, recorder
+
+
+def test_buffered_message_log_does_not_format_gated_messages(message_log):
+    log, recorder = message_log
+
+    class Unformattable:
+        def __repr__(self):
+            raise AssertionError('debug message was formatted')
+
+    log.log('value: %r', (Unformattable(),), 'debug')
+    log.flush()
+    assert recorder.messages == []
+
+
+def test_buffered_message_log_sends_warnings_after_buffered_messages(message_log):
+    log, recorder = message_log
+    log.log('first %s', ('message',), 'info')
+    assert recorder.messages == []
+    log.log('something went wrong', (), 'warning')
+    assert recorder.messages == ['first message', 'something went wrong']
+
+
+def test_buffered_message_log_reports_dropped_messages(message_log):
+    log, recorder = message_log
+    for index in range(log.max_messages + 5):
+        log.log('message %d', (index,), 'info')
+    log.flush()
+    assert recorder.messages[0] == '5 log messages were dropped'
+    assert recorder.messages[1] == 'message 5'
+    assert len(recorder.messages) == log.max_messages + 1
+
+
+class StoppableTimer(ActiveTimer):
+    def __init__(self):
+        self.stopped = False
+        self.disconnected = []
+        self.timeout = self
+
+    def stop(self):
+        self.stopped = True
+
+    def disconnect(self, slot):
+        self.disconnected.append(slot)
+
+
+def test_buffered_message_log_close_releases_timer(message_log):
+    log, recorder = message_log
+    timer = StoppableTimer()
+    log._timer = timer
+    log.log('pending', (), 'info')
+    log.close()
+    assert timer.stopped
+    assert timer.disconnected == [log.flush]
+    assert log._timer is None
+    assert recorder.messages == ['pending']
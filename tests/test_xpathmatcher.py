@@ -0,0 +1,101 @@
+from xml.etree import ElementTree as etree
+
+import pytest
+
+from dataset_qa_workbench.processing_provider.xpathmatcher import XPathMatcher
+
+SAMPLE = '''<?xml version="1.0"?>
+<root xmlns:gmd="http://www.isotc211.org/2005/gmd">
+  <layer id="roads"><name>Roads <b>main</b></name><name>second</name></layer>
+  <layer id="rivers"><style/></layer>
+  <gmd:identificationInfo>
+    <gmd:title lang="en">Title</gmd:title>
+  </gmd:identificationInfo>
+</root>
+'''
+
+
+@pytest.fixture()
+def sample_file(tmp_path):
+    path = tmp_path / 'sample.xml'
+    path.write_text(SAMPLE, encoding='utf-8')
+    return path
+
+
+@pytest.mark.parametrize('expression', [
+    pytest.param('layer'),
+    pytest.param('layer/name'),
+    pytest.param('.//style'),
+    pytest.param('.'),
+    pytest.param("layer[@id='rivers']"),
+    pytest.param("layer[@id!='roads']/style"),
+    pytest.param("layer[@id='lakes']"),
+    pytest.param('layer[2]/style'),
+    pytest.param('layer/name[2]'),
+    pytest.param('layer/name[3]'),
+    pytest.param("layer/name[.='Roads main']"),
+    pytest.param("layer[name='second']"),
+    pytest.param('layer[style]'),
+    pytest.param('layer[missing]'),
+    pytest.param('{http://www.isotc211.org/2005/gmd}identificationInfo/{*}title[@lang]'),
+    pytest.param('{http://www.isotc211.org/2005/gmd}*'),
+    pytest.param('layer/..'),
+    pytest.param('layer[last()]/style'),
+    pytest.param('.[layer]'),
+    pytest.param('.[@id]'),
+    pytest.param("layer/.[@id='rivers']"),
+])
+def test_matcher_agrees_with_element_tree(sample_file, expression):
+    matcher = XPathMatcher([expression])
+    expected = etree.parse(str(sample_file)).getroot().find(expression) is not None
+    assert matcher.match_file(sample_file)[0].found == expected
+
+
+def test_matcher_reports_lines_of_matches(sample_file):
+    matcher = XPathMatcher(['layer', './/style', 'missing'])
+    assert matcher.is_streamable
+    matches = matcher.match_file(sample_file)
+    assert [(m.expression, m.found, m.line) for m in matches] == [
+        ('layer', True, 3),
+        ('.//style', True, 4),
+        ('missing', False, None),
+    ]
+
+
+def test_matcher_stops_once_all_expressions_matched(tmp_path):
+    path = tmp_path / 'truncated.xml'
+    # the file is not well formed past the matched elements
+    path.write_text('<root><a/><b/><c>', encoding='utf-8')
+    matches = XPathMatcher(['a', 'b']).match_file(path)
+    assert all(match.found for match in matches)
+
+
+def test_matcher_can_be_stopped(tmp_path):
+    path = tmp_path / 'large.xml'
+    path.write_text(f'<root>{"<a/>" * 5000}<last/></root>', encoding='utf-8')
+    matcher = XPathMatcher(['last'])
+    assert matcher.match_file(path)[0].found
+    assert not matcher.match_file(path, should_stop=lambda: True)[0].found
+
+
+def test_matcher_checks_many_files(tmp_path):
+    paths = []
+    for index in range(10):
+        path = tmp_path / f'style-{index}.qml'
+        path.write_text(
+            f'<qgis><renderer-v2 type="{"rule" if index % 2 else "single"}"/></qgis>',
+            encoding='utf-8',
+        )
+        paths.append(path)
+    broken = tmp_path / 'broken.qml'
+    broken.write_text('<qgis>', encoding='utf-8')
+    paths.append(broken)
+    matcher = XPathMatcher(["renderer-v2[@type='rule']"])
+    results = list(matcher.match_files(paths, max_workers=4))
+    assert [path for path, _, _ in results] == paths
+    assert [matches[0].found for _, matches, _ in results[:-1]] == [
+        index % 2 == 1 for index in range(10)
+    ]
+    _, matches, error = results[-1]
+    assert matches is None
+    assert error is not None